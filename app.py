@@ -1,346 +1,382 @@
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, g, request, jsonify
 from flask_cors import CORS
 import json
+import logging
 import os
-import hashlib
+import random
 import uuid
+from urllib.parse import urlencode
 from datetime import datetime
-import random
+import sys
+import time
+import click
+from passwords import HasherBusy, PasswordHasher
+from sessions import SessionStore
+from static_assets import StaticAssets
+from question_bank import QuestionBank, mark_seen, new_paper_seed, paper_rng, sample_questions
+from question_pack import compile_questions, dedupe_bank
+from app_logging import setup_logging
+from cache import TTLCache
+from filestore import atomic_write_json, file_lock
+from grading import grade_submission
+from item_stats import ItemStats, ability
+from leaderboard import METRICS, Leaderboard, scope_name
+from metrics import Metrics, take_io_seconds
+from regrade import regrade_interviews
+from sample_bank import sample_question_bank
+from storage import create_storage, migrate_json_to_sqlite, user_record_stats
+from synthetic import parse_distribution, write_history, write_questions
+from write_behind import WriteBehindStorage
 
 app = Flask(__name__)
 CORS(app)
 
+# Leveled logging through a background queue: LOG_LEVEL (default INFO) and
+# LOG_FORMAT ('json', default, or 'text')
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
+LOG_FORMAT = os.environ.get('LOG_FORMAT', 'json')
+setup_logging(LOG_LEVEL, LOG_FORMAT)
+log = logging.getLogger('interview')
+
+# Per-route request metrics, served in Prometheus text format on /metrics
+request_metrics = Metrics()
+request_metrics.histogram('http_request_duration_seconds', 'Request latency by route')
+request_metrics.counter('http_requests_total', 'Requests by route, method and status')
+request_metrics.counter('http_request_errors_total', 'Requests that raised or returned a 5xx status')
+request_metrics.counter('http_request_io_seconds_total', 'Request time spent in JSON file I/O')
+request_metrics.counter('http_request_compute_seconds_total', 'Request time spent outside JSON file I/O')
+# Any other method a client sends is counted as 'other', so it can't add series
+METRIC_METHODS = frozenset(('GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'))
+
 # Data storage files
 USERS_FILE = 'users.json'
 QUESTIONS_FILE = 'questions.json'
 INTERVIEWS_FILE = 'interviews.json'
+INTERVIEWS_LOG_FILE = 'interviews.log.jsonl'
 PROGRESS_FILE = 'progress.json'
+PROGRESS_LOG_FILE = 'progress.log.jsonl'
+QUESTION_STATS_FILE = 'question_stats.json'
+QUESTION_STATS_LOG_FILE = 'question_stats.log.jsonl'
+LEADERBOARD_FILE = 'leaderboard.json'
+LEADERBOARD_LOG_FILE = 'leaderboard.log.jsonl'
+
+# Storage backend for users/progress/interviews: 'json' (default) or 'sqlite'
+STORAGE_BACKEND = os.environ.get('STORAGE_BACKEND', 'json')
+STORAGE_DB_FILE = os.environ.get('STORAGE_DB_FILE', 'interview.db')
+
+# Buffer stat updates in memory and flush them in batches every N ms or M
+# writes (WRITE_BEHIND=0 writes through on every request)
+WRITE_BEHIND = os.environ.get('WRITE_BEHIND', '1') == '1'
+WRITE_BEHIND_INTERVAL_MS = int(os.environ.get('WRITE_BEHIND_INTERVAL_MS', 200))
+WRITE_BEHIND_MAX_BATCH = int(os.environ.get('WRITE_BEHIND_MAX_BATCH', 100))
+
+# Compiled, mmapped copy of questions.json built by `flask compile-questions`;
+# used instead of the JSON file for as long as it is up to date with it
+QUESTIONS_BIN = os.environ.get('QUESTIONS_BIN', 'questions.bin')
+
+# Shared, hot-reloaded question bank (re-read only when questions.json changes)
+question_bank = QuestionBank(QUESTIONS_FILE, packed_path=QUESTIONS_BIN)
+
+# Per-question attempt/correct counts from graded papers, for ?select=adaptive
+item_stats = ItemStats(QUESTION_STATS_FILE, QUESTION_STATS_LOG_FILE, question_bank)
+
+# Rankings by credits and average score, kept up to date by /api/update-stats
+leaderboard = Leaderboard(LEADERBOARD_FILE, LEADERBOARD_LOG_FILE)
+LEADERBOARD_PAGE_SIZE = 10
+LEADERBOARD_MAX_PAGE_SIZE = 100
+
+# Answer keys for papers issued without answers, kept for server-side grading
+PAPER_CACHE_SIZE = 10000
+PAPER_CACHE_TTL = 4 * 60 * 60
+paper_cache = TTLCache(PAPER_CACHE_SIZE, PAPER_CACHE_TTL)
+
+# Questions per page for papers delivered through /api/papers
+PAPER_PAGE_SIZE = 5
+PAPER_MAX_PAGE_SIZE = 50
+
+# Salted scrypt password hashing on a bounded pool; past the queue limit
+# signup/login answer 503 so a burst of logins can't starve other endpoints
+PASSWORD_SCRYPT_N = int(os.environ.get('PASSWORD_SCRYPT_N', 2 ** 14))
+PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 4))
+PASSWORD_HASH_MAX_QUEUE = int(os.environ.get('PASSWORD_HASH_MAX_QUEUE', 32))
+password_hasher = PasswordHasher(
+    n=PASSWORD_SCRYPT_N, workers=PASSWORD_HASH_WORKERS, max_queue=PASSWORD_HASH_MAX_QUEUE
+)
+
+# Login sessions: in memory, optionally persisted to SQLite (SESSION_BACKEND=sqlite)
+SESSION_TTL = 24 * 60 * 60
+SESSION_BACKEND = os.environ.get('SESSION_BACKEND', 'memory')
+sessions = SessionStore(SESSION_TTL, STORAGE_DB_FILE if SESSION_BACKEND == 'sqlite' else None)
+
+# Front-end files served from memory, fingerprinted and precompressed;
+# index.html is rewritten to load the fingerprinted URLs under /assets/
+static_assets = StaticAssets(app.root_path, ['styles.css', 'script.js'], pages=['index.html'])
+ASSET_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+PAGE_CACHE_CONTROL = 'no-cache'
+
+# Public user profiles served by verify-token, refreshed whenever a user is saved
+USER_PROFILE_CACHE_SIZE = 100000
+USER_PROFILE_CACHE_TTL = 60
+user_profiles = TTLCache(USER_PROFILE_CACHE_SIZE, USER_PROFILE_CACHE_TTL)
+
+storage = create_storage(
+    STORAGE_BACKEND, USERS_FILE, PROGRESS_FILE, PROGRESS_LOG_FILE,
+    INTERVIEWS_FILE, INTERVIEWS_LOG_FILE, STORAGE_DB_FILE
+)
+if WRITE_BEHIND:
+    storage = WriteBehindStorage(storage, WRITE_BEHIND_INTERVAL_MS / 1000, WRITE_BEHIND_MAX_BATCH)
 
 # Initialize data files
 def init_data_files():
     """Initialize JSON data files if they don't exist"""
-    if not os.path.exists(USERS_FILE):
-        with open(USERS_FILE, 'w') as f:
-            json.dump({}, f)
+    for path in (USERS_FILE, INTERVIEWS_FILE, PROGRESS_FILE):
+        with file_lock(path):
+            if not os.path.exists(path):
+                atomic_write_json(path, {})
     
-    if not os.path.exists(QUESTIONS_FILE):
-        create_sample_questions()
-    
-    if not os.path.exists(INTERVIEWS_FILE):
-        with open(INTERVIEWS_FILE, 'w') as f:
-            json.dump({}, f)
+    with file_lock(QUESTIONS_FILE):
+        if not os.path.exists(QUESTIONS_FILE):
+            create_sample_questions()
     
-    if not os.path.exists(PROGRESS_FILE):
-        with open(PROGRESS_FILE, 'w') as f:
-            json.dump({}, f)
+    if QUESTIONS_BIN and not os.path.exists(QUESTIONS_BIN):
+        compile_questions(QUESTIONS_FILE, QUESTIONS_BIN)
 
 def create_sample_questions():
     """Create sample questions data"""
-    questions = {
-        'data-analytics': {
-            'easy': [
-                {
-                    'id': 1,
-                    'question': 'What is the primary purpose of data visualization?',
-                    'type': 'mcq',
-                    'options': ['To make data look pretty', 'To communicate insights effectively', 'To reduce data size', 'To increase data accuracy'],
-                    'correct_answer': 'To communicate insights effectively',
-                    'keywords': ['communication', 'insights', 'visualization', 'presentation']
-                },
-                {
-                    'id': 2,
-                    'question': 'Which tool is commonly used for data analysis?',
-                    'type': 'mcq',
-                    'options': ['Microsoft Word', 'Excel', 'PowerPoint', 'Notepad'],
-                    'correct_answer': 'Excel',
-                    'keywords': ['spreadsheet', 'analysis', 'data', 'calculation']
-                },
-                {
-                    'id': 3,
-                    'question': 'What does SQL stand for?',
-                    'type': 'mcq',
-                    'options': ['Structured Query Language', 'Simple Query Language', 'Standard Query Language', 'System Query Language'],
-                    'correct_answer': 'Structured Query Language',
-                    'keywords': ['database', 'query', 'structured', 'language']
-                },
-                {
-                    'id': 4,
-                    'question': 'Explain the importance of data cleaning in analytics.',
-                    'type': 'text',
-                    'options': [],
-                    'correct_answer': 'Data cleaning ensures accuracy and reliability of analysis results',
-                    'keywords': ['accuracy', 'reliability', 'quality', 'preprocessing', 'validation']
-                },
-                {
-                    'id': 5,
-                    'question': 'What is a pivot table used for?',
-                    'type': 'mcq',
-                    'options': ['Creating charts', 'Summarizing and analyzing data', 'Writing formulas', 'Formatting cells'],
-                    'correct_answer': 'Summarizing and analyzing data',
-                    'keywords': ['summarize', 'analyze', 'pivot', 'data', 'table']
-                }
-            ],
-            'medium': [
-                {
-                    'id': 6,
-                    'question': 'What is the difference between correlation and causation?',
-                    'type': 'text',
-                    'options': [],
-                    'correct_answer': 'Correlation shows relationship between variables, causation shows one variable causes another',
-                    'keywords': ['correlation', 'causation', 'relationship', 'variables', 'cause', 'effect']
-                },
-                {
-                    'id': 7,
-                    'question': 'Which statistical measure represents the middle value?',
-                    'type': 'mcq',
-                    'options': ['Mean', 'Median', 'Mode', 'Standard Deviation'],
-                    'correct_answer': 'Median',
-                    'keywords': ['middle', 'median', 'central', 'tendency']
-                }
-            ],
-            'hard': [
-                {
-                    'id': 8,
-                    'question': 'Explain the concept of statistical significance in hypothesis testing.',
-                    'type': 'text',
-                    'options': [],
-                    'correct_answer': 'Statistical significance indicates that results are unlikely due to chance',
-                    'keywords': ['significance', 'hypothesis', 'testing', 'p-value', 'confidence', 'chance']
-                }
-            ]
-        },
-        'machine-learning': {
-            'easy': [
-                {
-                    'id': 9,
-                    'question': 'What is machine learning?',
-                    'type': 'mcq',
-                    'options': ['Programming computers', 'Teaching computers to learn from data', 'Creating websites', 'Building databases'],
-                    'correct_answer': 'Teaching computers to learn from data',
-                    'keywords': ['learning', 'data', 'algorithms', 'patterns', 'prediction']
-                },
-                {
-                    'id': 10,
-                    'question': 'What is supervised learning?',
-                    'type': 'mcq',
-                    'options': ['Learning without guidance', 'Learning with labeled data', 'Learning from mistakes', 'Learning automatically'],
-                    'correct_answer': 'Learning with labeled data',
-                    'keywords': ['supervised', 'labeled', 'training', 'guidance', 'examples']
-                }
-            ],
-            'medium': [
-                {
-                    'id': 11,
-                    'question': 'Explain overfitting in machine learning.',
-                    'type': 'text',
-                    'options': [],
-                    'correct_answer': 'Overfitting occurs when a model learns training data too well and fails to generalize',
-                    'keywords': ['overfitting', 'generalization', 'training', 'validation', 'bias', 'variance']
-                }
-            ],
-            'hard': [
-                {
-                    'id': 12,
-                    'question': 'Compare different ensemble methods and their advantages.',
-                    'type': 'text',
-                    'options': [],
-                    'correct_answer': 'Ensemble methods combine multiple models to improve performance and reduce overfitting',
-                    'keywords': ['ensemble', 'models', 'performance', 'bagging', 'boosting', 'stacking']
-                }
-            ]
-        },
-        'web-development': {
-            'easy': [
-                {
-                    'id': 13,
-                    'question': 'What does HTML stand for?',
-                    'type': 'mcq',
-                    'options': ['HyperText Markup Language', 'High Tech Modern Language', 'Home Tool Markup Language', 'Hyperlink Text Management Language'],
-                    'correct_answer': 'HyperText Markup Language',
-                    'keywords': ['html', 'markup', 'hypertext', 'web', 'structure']
-                },
-                {
-                    'id': 14,
-                    'question': 'What is CSS used for?',
-                    'type': 'mcq',
-                    'options': ['Creating databases', 'Styling web pages', 'Writing server code', 'Managing files'],
-                    'correct_answer': 'Styling web pages',
-                    'keywords': ['css', 'styling', 'design', 'presentation', 'layout']
-                }
-            ],
-            'medium': [
-                {
-                    'id': 15,
-                    'question': 'Explain the difference between frontend and backend development.',
-                    'type': 'text',
-                    'options': [],
-                    'correct_answer': 'Frontend handles user interface, backend handles server logic and database',
-                    'keywords': ['frontend', 'backend', 'interface', 'server', 'database', 'logic']
-                }
-            ],
-            'hard': [
-                {
-                    'id': 16,
-                    'question': 'Discuss microservices architecture and its benefits.',
-                    'type': 'text',
-                    'options': [],
-                    'correct_answer': 'Microservices architecture breaks applications into small, independent services for scalability',
-                    'keywords': ['microservices', 'architecture', 'scalability', 'independent', 'services', 'deployment']
-                }
-            ]
-        },
-        'dsa': {
-            'easy': [
-                {
-                    'id': 17,
-                    'question': 'What is the time complexity of binary search?',
-                    'type': 'mcq',
-                    'options': ['O(n)', 'O(log n)', 'O(n²)', 'O(1)'],
-                    'correct_answer': 'O(log n)',
-                    'keywords': ['binary', 'search', 'logarithmic', 'complexity', 'efficient']
-                },
-                {
-                    'id': 18,
-                    'question': 'What is a stack data structure?',
-                    'type': 'mcq',
-                    'options': ['First In First Out', 'Last In First Out', 'Random Access', 'No Order'],
-                    'correct_answer': 'Last In First Out',
-                    'keywords': ['stack', 'lifo', 'push', 'pop', 'last', 'first']
-                }
-            ],
-            'medium': [
-                {
-                    'id': 19,
-                    'question': 'Explain dynamic programming and provide an example.',
-                    'type': 'text',
-                    'options': [],
-                    'correct_answer': 'Dynamic programming solves complex problems by breaking them into simpler subproblems',
-                    'keywords': ['dynamic', 'programming', 'subproblems', 'optimization', 'memoization']
-                }
-            ],
-            'hard': [
-                {
-                    'id': 20,
-                    'question': 'Design an efficient algorithm for finding the shortest path in a weighted graph.',
-                    'type': 'text',
-                    'options': [],
-                    'correct_answer': 'Dijkstra\'s algorithm or Floyd-Warshall for shortest path in weighted graphs',
-                    'keywords': ['dijkstra', 'shortest', 'path', 'weighted', 'graph', 'algorithm']
-                }
-            ]
-        },
-        'group-discussion': {
-            'easy': [
-                {
-                    'id': 21,
-                    'question': 'What is the most important skill in group discussions?',
-                    'type': 'mcq',
-                    'options': ['Speaking loudly', 'Listening actively', 'Interrupting others', 'Being aggressive'],
-                    'correct_answer': 'Listening actively',
-                    'keywords': ['listening', 'active', 'communication', 'respect', 'understanding']
-                },
-                {
-                    'id': 22,
-                    'question': 'How should you handle disagreements in a group discussion?',
-                    'type': 'text',
-                    'options': [],
-                    'correct_answer': 'Present your point respectfully and consider others\' perspectives',
-                    'keywords': ['respectful', 'perspective', 'disagreement', 'constructive', 'collaborative']
-                }
-            ],
-            'medium': [
-                {
-                    'id': 23,
-                    'question': 'Explain the role of a facilitator in group discussions.',
-                    'type': 'text',
-                    'options': [],
-                    'correct_answer': 'A facilitator guides the discussion, ensures participation, and maintains focus',
-                    'keywords': ['facilitator', 'guide', 'participation', 'focus', 'leadership', 'moderation']
-                }
-            ],
-            'hard': [
-                {
-                    'id': 24,
-                    'question': 'Discuss strategies for managing dominant participants in group discussions.',
-                    'type': 'text',
-                    'options': [],
-                    'correct_answer': 'Use techniques like direct addressing, time limits, and encouraging others to participate',
-                    'keywords': ['dominant', 'participants', 'management', 'inclusion', 'balance', 'techniques']
-                }
-            ]
-        },
-        'cloud-computing': {
-            'easy': [
-                {
-                    'id': 25,
-                    'question': 'What is cloud computing?',
-                    'type': 'mcq',
-                    'options': ['Computing in the sky', 'Delivering computing services over the internet', 'Using only local computers', 'Storing data on CDs'],
-                    'correct_answer': 'Delivering computing services over the internet',
-                    'keywords': ['cloud', 'internet', 'services', 'computing', 'delivery', 'remote']
-                },
-                {
-                    'id': 26,
-                    'question': 'What are the main types of cloud services?',
-                    'type': 'mcq',
-                    'options': ['IaaS, PaaS, SaaS', 'Hardware, Software, Network', 'Public, Private, Hybrid', 'All of the above'],
-                    'correct_answer': 'IaaS, PaaS, SaaS',
-                    'keywords': ['iaas', 'paas', 'saas', 'infrastructure', 'platform', 'software']
-                }
-            ],
-            'medium': [
-                {
-                    'id': 27,
-                    'question': 'Explain the benefits of cloud computing for businesses.',
-                    'type': 'text',
-                    'options': [],
-                    'correct_answer': 'Cost reduction, scalability, flexibility, and reduced maintenance overhead',
-                    'keywords': ['cost', 'scalability', 'flexibility', 'maintenance', 'benefits', 'business']
-                }
-            ],
-            'hard': [
-                {
-                    'id': 28,
-                    'question': 'Discuss cloud security challenges and mitigation strategies.',
-                    'type': 'text',
-                    'options': [],
-                    'correct_answer': 'Security challenges include data breaches, compliance, and access control; mitigation involves encryption and monitoring',
-                    'keywords': ['security', 'challenges', 'encryption', 'monitoring', 'compliance', 'access control']
-                }
-            ]
-        }
+    # Only distinct questions go into the bank; papers are capped at the pool
+    # size rather than padded with copies
+    questions, _ = dedupe_bank(sample_question_bank())
+    
+    with file_lock(QUESTIONS_FILE):
+        atomic_write_json(QUESTIONS_FILE, questions)
+
+# Fields of a stored user that are never sent to the client
+PRIVATE_USER_FIELDS = ('password_hash', 'seenQuestions')
+
+def public_user(user):
+    """User data safe to return to the client (no password hash)"""
+    return {k: v for k, v in user.items() if k not in PRIVATE_USER_FIELDS}
+
+def save_user(email, user):
+    """Persist a user and refresh their cached profile"""
+    storage.save_user(email, user)
+    user_profiles.set(email, public_user(user))
+
+def request_user_key():
+    """Identify the requester for per-paper seeding (email, token or address)"""
+    return request.args.get('email') or request.headers.get('Authorization') or request.remote_addr or ''
+
+def session_email():
+    """Email of the user signed in with a Bearer token, or None"""
+    auth_header = request.headers.get('Authorization')
+    if auth_header and auth_header.startswith('Bearer '):
+        return sessions.get(auth_header[len('Bearer '):])
+    return None
+
+def request_email():
+    """Email of the signed-in user (Bearer token, else ?email=), or None"""
+    auth_header = request.headers.get('Authorization')
+    if auth_header and auth_header.startswith('Bearer '):
+        return session_email()
+    return request.args.get('email')
+
+def regradable_answers(answers):
+    """Normalize submitted answers to [{'id': int, 'answer': str}], or None if malformed"""
+    if not isinstance(answers, list):
+        return None
+    normalized = []
+    for item in answers:
+        if not isinstance(item, dict):
+            return None
+        question_id = item.get('id')
+        answer = item.get('answer')
+        # JSON object keys arrive as strings
+        if isinstance(question_id, str) and question_id.isdigit():
+            question_id = int(question_id)
+        if answer is None:
+            answer = ''
+        if not isinstance(question_id, int) or isinstance(question_id, bool) or not isinstance(answer, str):
+            return None
+        normalized.append({'id': question_id, 'answer': answer})
+    return normalized
+
+def record_item_results(domain, graded):
+    """Add a graded submission to the per-question statistics"""
+    item_stats.record(domain, [(item['id'], item['correct']) for item in graded['results']])
+
+def issue_paper(domain, difficulty, answer_key, questions=None):
+    """Remember a paper's answer key (and its questions, if paged) and return its id"""
+    paper_id = uuid.uuid4().hex
+    paper = {'domain': domain, 'difficulty': difficulty, 'answer_key': answer_key}
+    if questions is not None:
+        paper['questions'] = questions
+    paper_cache.set(paper_id, paper)
+    return paper_id
+
+def questions_response(questions, fields):
+    """JSON response around already-serialized questions"""
+    body = b'{"questions": [' + b', '.join(questions) + b'], ' + json.dumps(fields).encode()[1:]
+    return app.response_class(body, status=200, mimetype='application/json')
+
+def page_fields(paper_id, total, offset, limit):
+    """Paging metadata for questions [offset, offset + limit) of a paper"""
+    end = min(offset + limit, total)
+    return {
+        'paper_id': paper_id,
+        'total_questions': total,
+        'offset': offset,
+        'next': f'/api/papers/{paper_id}/questions?offset={end}&limit={limit}' if end < total else None
     }
+
+def draw_paper(domain, difficulty, strip_answers):
+    """Select and render a paper for the current request.
+
+    Honours ?select=unseen|adaptive. Returns (paper, None), where paper has
+    the serialized 'questions', the 'answer_key' and the response 'fields',
+    or (None, error response).
+    """
+    # Private RNG for this paper, seeded per user with fresh entropy
+    timestamp = int(time.time())
+    seed = new_paper_seed(request_user_key())
+    rng = paper_rng(seed)
     
-    # Add more questions to reach the required counts
-    for domain in questions:
-        for difficulty in questions[domain]:
-            current_count = len(questions[domain][difficulty])
-            target_count = {'easy': 45, 'medium': 30, 'hard': 15}[difficulty]
-            
-            # Duplicate and modify existing questions to reach target count
-            while current_count < target_count:
-                base_question = questions[domain][difficulty][current_count % len(questions[domain][difficulty])]
-                new_question = base_question.copy()
-                new_question['id'] = current_count + 1
-                questions[domain][difficulty].append(new_question)
-                current_count += 1
+    log.debug('Drawing paper', extra={'domain': domain, 'difficulty': difficulty, 'seed': seed})
+    
+    # Define question limits based on difficulty
+    limits = {'easy': 45, 'medium': 30, 'hard': 15}
+    max_questions = limits.get(difficulty, 15)
+    
+    # ?select=unseen draws questions this user has not been served yet
+    # first, from a per-user bitmap of pool positions. Only a Bearer session
+    # updates the bitmap; an ?email= caller draws from it without recording
+    seen = None
+    record_seen = False
+    if request.args.get('select') == 'unseen':
+        email = request_email()
+        user = storage.get_user(email) if email else None
+        if user is None:
+            return None, (jsonify({'message': 'Sign in to select unseen questions'}), 401)
+        seen_key = f'{domain}/{difficulty}'
+        seen = int(user.get('seenQuestions', {}).get(seen_key, '0'), 16)
+        record_seen = email == session_email()
+    
+    # ?select=adaptive draws from the whole domain, picking questions whose
+    # measured difficulty is closest to the user's running ability
+    user_ability = None
+    if request.args.get('select') == 'adaptive':
+        email = request_email()
+        stats = storage.get_user_stats(email) if email else None
+        user_ability = ability(stats['score_total'], stats['count']) if stats else 0.0
+        items = item_stats.select(domain, max_questions, user_ability, rng)
+        if not items:
+            return None, (jsonify({'message': 'Domain not found'}), 404)
+        questions, mcq_count, text_count, answer_key = question_bank.render_items(
+            domain, items, rng, strip_answers
+        )
+    else:
+        # Draw the required number of questions (with shuffled MCQ options)
+        # and assemble them from pre-serialized fragments
+        paper = question_bank.render_paper(domain, difficulty, max_questions, rng, strip_answers, seen)
+        if paper is None:
+            return None, (jsonify({'message': 'Domain or difficulty not found'}), 404)
+        questions, mcq_count, text_count, answer_key, positions = paper
+    
+    if record_seen:
+        pool_size = len(question_bank.get(domain, difficulty))
+        seen = mark_seen(seen, positions, pool_size)
+        user.setdefault('seenQuestions', {})[seen_key] = format(seen, 'x')
+        save_user(email, user)
     
-    with open(QUESTIONS_FILE, 'w') as f:
-        json.dump(questions, f, indent=2)
+    log.debug('Drew paper', extra={'seed': seed, 'questions': mcq_count + text_count})
+    
+    fields = {
+        'total_questions': mcq_count + text_count,
+        'mcq_count': mcq_count,
+        'text_count': text_count,
+        'randomization_timestamp': timestamp,
+        'seed': seed
+    }
+    if seen is not None:
+        # The draw depends on the bitmap too, not just the seed
+        fields['selection'] = 'unseen'
+    if user_ability is not None:
+        fields['selection'] = 'adaptive'
+        fields['ability'] = round(user_ability, 3)
+    return {'questions': questions, 'answer_key': answer_key, 'fields': fields}, None
+
+@app.errorhandler(HasherBusy)
+def hasher_busy(e):
+    response = jsonify({'message': 'Server is busy, please try again shortly'})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+    take_io_seconds()
+
+@app.after_request
+def remember_response_status(response):
+    g.response_status = response.status_code
+    return response
+
+@app.teardown_request
+def record_request_metrics(exc):
+    started = g.pop('request_started', None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    io_seconds = min(take_io_seconds(), elapsed)
+    status = 500 if exc is not None else g.pop('response_status', 500)
+    # Label by route pattern, not path, so the number of series stays fixed
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    method = request.method if request.method in METRIC_METHODS else 'other'
+    labels = (('route', route), ('method', method))
+    request_metrics.observe('http_request_duration_seconds', labels, elapsed)
+    request_metrics.inc('http_requests_total', labels + (('status', str(status)),))
+    if status >= 500:
+        request_metrics.inc('http_request_errors_total', labels)
+    request_metrics.inc('http_request_io_seconds_total', labels, io_seconds)
+    request_metrics.inc('http_request_compute_seconds_total', labels, elapsed - io_seconds)
+
+@app.route('/metrics')
+def metrics():
+    return app.response_class(request_metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+def asset_response(asset, cache_control):
+    """Send a static asset, precompressed if the client accepts it, or a 304"""
+    if asset is None:
+        return jsonify({'message': 'Not found'}), 404
+    encoding, body = asset.negotiate(request.headers.get('Accept-Encoding'))
+    if asset.matches(request.headers.get('If-None-Match')):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, mimetype=asset.mimetype)
+        if encoding != 'identity':
+            response.headers['Content-Encoding'] = encoding
+    response.set_etag(asset.etag(encoding))
+    response.headers['Cache-Control'] = cache_control
+    response.headers['Vary'] = 'Accept-Encoding'
+    return response
 
 # Main route
 @app.route('/')
 def index():
-    return send_file('index.html')
+    return asset_response(static_assets.get('index.html'), PAGE_CACHE_CONTROL)
 
 # Routes for serving static files
 @app.route('/styles.css')
 def styles():
-    return send_file('styles.css')
+    return asset_response(static_assets.get('styles.css'), PAGE_CACHE_CONTROL)
 
 @app.route('/script.js')
 def script():
-    return send_file('script.js')
+    return asset_response(static_assets.get('script.js'), PAGE_CACHE_CONTROL)
+
+# Fingerprinted URLs change whenever the file does, so they can be cached forever
+@app.route('/assets/<filename>')
+def fingerprinted_asset(filename):
+    return asset_response(static_assets.by_url(request.path), ASSET_CACHE_CONTROL)
 
 @app.route('/favicon.ico')
 def favicon():
@@ -353,40 +389,28 @@ def test():
 
 @app.route('/api/signup', methods=['POST'])
 def signup():
-    print("signup: Endpoint called")
     try:
         data = request.get_json()
-        print(f"signup: Raw request data: {data}")
         
         email = data.get('email') if data else None
         password = data.get('password') if data else None
         fullName = data.get('fullName') if data else None
         
-        print(f"signup: Received data - email: {email}, password: {'*' * len(password) if password else 'None'}, fullName: {fullName}")
-        
         if not all([email, password, fullName]):
-            print("signup: Missing required fields")
+            log.info('Signup missing required fields')
             return jsonify({'message': 'All fields are required'}), 400
     except Exception as e:
-        print(f"signup: Error parsing request data: {e}")
+        log.info('Signup with invalid request data', extra={'error': str(e)})
         return jsonify({'message': 'Invalid request data'}), 400
     
-    # Load existing users
-    users = {}
-    if os.path.exists(USERS_FILE):
-        with open(USERS_FILE, 'r') as f:
-            users = json.load(f)
-    
-    print(f"signup: Loaded {len(users)} existing users")
-    
-    # Check if user already exists
-    if email in users:
-        print(f"signup: User {email} already exists")
+    # Skip the expensive hash for emails that are obviously taken
+    if storage.get_user(email) is not None:
+        log.info('Signup for existing user', extra={'email': email})
         return jsonify({'message': 'User already exists'}), 400
     
     # Create new user
-    password_hash = hashlib.sha256(password.encode()).hexdigest()
-    users[email] = {
+    password_hash = password_hasher.hash(password)
+    user = {
         'email': email,
         'password_hash': password_hash,
         'fullName': fullName,
@@ -397,62 +421,53 @@ def signup():
         'interviewsCompleted': 0
     }
     
-    # Save users
-    with open(USERS_FILE, 'w') as f:
-        json.dump(users, f, indent=2)
+    # Save user (fails if the email is already registered)
+    if not storage.create_user(email, user):
+        log.info('Signup for existing user', extra={'email': email})
+        return jsonify({'message': 'User already exists'}), 400
     
-    print(f"signup: Successfully created user {email}")
+    log.info('Created user', extra={'email': email})
     return jsonify({'message': 'User created successfully'}), 201
 
 @app.route('/api/login', methods=['POST'])
 def login():
-    print("login: Endpoint called")
     try:
         data = request.get_json()
-        print(f"login: Raw request data: {data}")
         
         email = data.get('email') if data else None
         password = data.get('password') if data else None
         
-        print(f"login: Received data - email: {email}, password: {'*' * len(password) if password else 'None'}")
-        
         if not all([email, password]):
-            print("login: Missing required fields")
+            log.info('Login missing required fields')
             return jsonify({'message': 'Email and password are required'}), 400
     except Exception as e:
-        print(f"login: Error parsing request data: {e}")
+        log.info('Login with invalid request data', extra={'error': str(e)})
         return jsonify({'message': 'Invalid request data'}), 400
     
-    # Load users
-    users = {}
-    if os.path.exists(USERS_FILE):
-        with open(USERS_FILE, 'r') as f:
-            users = json.load(f)
-    
-    print(f"login: Loaded {len(users)} users from file")
-    
     # Check credentials
-    if email not in users:
-        print(f"login: User {email} not found in users")
+    user = storage.get_user(email)
+    if user is None:
+        log.info('Login for unknown user', extra={'email': email})
         return jsonify({'message': 'Invalid credentials'}), 401
     
-    user = users[email]
-    password_hash = hashlib.sha256(password.encode()).hexdigest()
-    
-    print(f"login: Stored hash: {user.get('password_hash', 'None')[:10]}...")
-    print(f"login: Computed hash: {password_hash[:10]}...")
-    
-    if user['password_hash'] != password_hash:
-        print("login: Password hash mismatch")
+    valid, upgraded_hash = password_hasher.verify_and_upgrade(password, user.get('password_hash'))
+    if not valid:
+        log.info('Login with wrong password', extra={'email': email})
         return jsonify({'message': 'Invalid credentials'}), 401
     
-    # Generate token
-    token = str(uuid.uuid4())
+    # Transparently move legacy SHA-256 (or outdated scrypt) hashes forward
+    if upgraded_hash:
+        user['password_hash'] = upgraded_hash
+        save_user(email, user)
+    
+    # Start a session
+    token = sessions.create(email)
     
     # Return user data (excluding password hash)
-    user_data = {k: v for k, v in user.items() if k != 'password_hash'}
+    user_data = public_user(user)
+    user_profiles.set(email, user_data)
     
-    print(f"login: Successfully logged in user {email}")
+    log.info('Logged in', extra={'email': email})
     return jsonify({
         'message': 'Login successful',
         'token': token,
@@ -465,98 +480,115 @@ def verify_token():
     if not auth_header or not auth_header.startswith('Bearer '):
         return jsonify({'message': 'No token provided'}), 401
     
-    # For simplicity, we'll just return the user data
-    # In a real app, you'd validate the token
-    email = request.args.get('email', 'test@example.com')
-    
-    users = {}
-    if os.path.exists(USERS_FILE):
-        with open(USERS_FILE, 'r') as f:
-            users = json.load(f)
-    
-    if email not in users:
-        return jsonify({'message': 'User not found'}), 401
+    email = sessions.get(auth_header[len('Bearer '):])
+    if email is None:
+        return jsonify({'message': 'Invalid or expired token'}), 401
     
-    user = users[email]
-    user_data = {k: v for k, v in user.items() if k != 'password_hash'}
+    user_data = user_profiles.get(email)
+    if user_data is None:
+        user = storage.get_user(email)
+        if user is None:
+            return jsonify({'message': 'User not found'}), 401
+        user_data = public_user(user)
+        user_profiles.set(email, user_data)
     
-    print(f"verify-token: Returning user data for {email}: {user_data}")
+    log.debug('Verified token', extra={'email': email})
     
     return jsonify({'user': user_data}), 200
 
+@app.route('/api/logout', methods=['POST'])
+def logout():
+    auth_header = request.headers.get('Authorization')
+    if auth_header and auth_header.startswith('Bearer '):
+        sessions.revoke(auth_header[len('Bearer '):])
+    return jsonify({'message': 'Logged out'}), 200
+
 @app.route('/api/questions/<domain>/<difficulty>')
 def get_questions(domain, difficulty):
     try:
-        if not os.path.exists(QUESTIONS_FILE):
+        if not question_bank.exists():
             return jsonify({'message': 'Questions not found'}), 404
         
-        with open(QUESTIONS_FILE, 'r') as f:
-            all_questions = json.load(f)
-        
-        if domain not in all_questions or difficulty not in all_questions[domain]:
-            return jsonify({'message': 'Domain or difficulty not found'}), 404
-        
-        # Get all questions for the domain and difficulty
-        all_available_questions = all_questions[domain][difficulty].copy()
-        
-        print(f"DEBUG: Found {len(all_available_questions)} total questions for {domain}/{difficulty}")
-        
-        # Add timestamp-based seed for unique randomization every second
-        import time
-        timestamp = int(time.time())
-        random.seed(timestamp)
-        
-        print(f"DEBUG: Using timestamp seed: {timestamp}")
-        
-        # Define question limits based on difficulty
-        limits = {'easy': 45, 'medium': 30, 'hard': 15}
-        max_questions = limits.get(difficulty, 15)
-        
-        # SIMPLIFIED LOGIC: Just shuffle and take the required number
-        # This ensures we get different questions each time
-        random.shuffle(all_available_questions)
+        # ?strip_answers=1 leaves answers out of the payload and keeps the
+        # answer key server-side for /api/grade
+        strip_answers = request.args.get('strip_answers') in ('1', 'true')
         
-        # Take only the required number of questions
-        selected_questions = all_available_questions[:max_questions]
+        paper, error = draw_paper(domain, difficulty, strip_answers)
+        if error:
+            return error
         
-        print(f"DEBUG: Selected {len(selected_questions)} questions out of {len(all_available_questions)} available")
-        
-        # Verify questions are different
-        question_texts = [q.get('text', '') for q in selected_questions[:5]]
-        print(f"DEBUG: First 5 question texts: {question_texts}")
-        
-        # Randomize options for MCQ questions
-        for question in selected_questions:
-            if question.get('type') == 'mcq' and question.get('options'):
-                # Store correct answer
-                correct_answer = question.get('correct_answer')
-                # Shuffle options
-                random.shuffle(question['options'])
-                # Keep the correct answer as the actual answer text (not position)
-                question['correct_answer'] = correct_answer
-        
-        # Reset random seed to system time
-        random.seed()
-        
-        print(f"DEBUG: Returning {len(selected_questions)} questions with timestamp {timestamp}")
-        
-        return jsonify({
-            'questions': selected_questions,
-            'total_questions': len(selected_questions),
-            'mcq_count': len([q for q in selected_questions if q.get('type') == 'mcq']),
-            'text_count': len([q for q in selected_questions if q.get('type') == 'text']),
-            'randomization_timestamp': timestamp
-        }), 200
+        fields = paper['fields']
+        # Adaptive papers mix difficulties, so they can only be graded by paper_id
+        if strip_answers or fields.get('selection') == 'adaptive':
+            fields['paper_id'] = issue_paper(domain, difficulty, paper['answer_key'])
+        return questions_response(paper['questions'], fields)
         
     except Exception as e:
-        print(f"ERROR in get_questions: {str(e)}")
+        log.exception('Error loading questions', extra={'domain': domain, 'difficulty': difficulty})
         return jsonify({'message': f'Error loading questions: {str(e)}'}), 500
 
+@app.route('/api/papers/<domain>/<difficulty>', methods=['POST'])
+def create_paper(domain, difficulty):
+    """Issue an answer-free paper and return it with its first page of questions.
+
+    Takes the same ?select= modes as /api/questions. The rest of the paper is
+    fetched page by page from /api/papers/<paper_id>/questions, or streamed
+    from /api/papers/<paper_id>/stream, and graded with /api/grade.
+    """
+    if not question_bank.exists():
+        return jsonify({'message': 'Questions not found'}), 404
+    limit = min(max(request.args.get('limit', PAPER_PAGE_SIZE, type=int), 1), PAPER_MAX_PAGE_SIZE)
+    
+    paper, error = draw_paper(domain, difficulty, strip_answers=True)
+    if error:
+        return error
+    
+    questions = paper['questions']
+    paper_id = issue_paper(domain, difficulty, paper['answer_key'], questions)
+    fields = paper['fields']
+    fields.update(page_fields(paper_id, len(questions), 0, limit))
+    return questions_response(questions[:limit], fields)
+
+@app.route('/api/papers/<paper_id>/questions')
+def get_paper_page(paper_id):
+    """One page of an issued paper's questions (?offset=, ?limit=)"""
+    paper = paper_cache.get(paper_id)
+    if paper is None or 'questions' not in paper:
+        return jsonify({'message': 'Paper not found or expired'}), 404
+    questions = paper['questions']
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    limit = min(max(request.args.get('limit', PAPER_PAGE_SIZE, type=int), 1), PAPER_MAX_PAGE_SIZE)
+    return questions_response(questions[offset:offset + limit], page_fields(paper_id, len(questions), offset, limit))
+
+@app.route('/api/papers/<paper_id>/stream')
+def stream_paper(paper_id):
+    """Server-sent events: one 'question' event per question, then 'end'.
+
+    Each event's id is the question's position in the paper, so a client
+    reconnecting with Last-Event-ID resumes after the last one it got.
+    """
+    paper = paper_cache.get(paper_id)
+    if paper is None or 'questions' not in paper:
+        return jsonify({'message': 'Paper not found or expired'}), 404
+    questions = paper['questions']
+    last_event_id = request.headers.get('Last-Event-ID', '')
+    start = int(last_event_id) + 1 if last_event_id.isdigit() else max(request.args.get('offset', 0, type=int), 0)
+    
+    def events():
+        for index in range(start, len(questions)):
+            yield b'event: question\nid: %d\ndata: %s\n\n' % (index, questions[index])
+        yield b'event: end\ndata: {"total_questions": %d}\n\n' % len(questions)
+    
+    response = Response(events(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
 @app.route('/api/questions-hardcoded/<domain>/<difficulty>')
 def get_questions_hardcoded(domain, difficulty):
     """HARDCODED API - Manually creates completely different questions"""
     try:
-        print(f"HARDCODED API: Creating unique questions for {domain}/{difficulty}")
+        log.debug('Building hardcoded paper', extra={'domain': domain, 'difficulty': difficulty})
         
         # Define question limits - ALL DOMAINS NOW HAVE SAME COUNTS: Easy=45, Medium=30, Hard=15
         limits = {'easy': 45, 'medium': 30, 'hard': 15}
@@ -1173,18 +1205,15 @@ def get_questions_hardcoded(domain, difficulty):
         selected_questions = sample_questions[:max_questions]
         
         # Shuffle options for each MCQ question
-        import time
         timestamp = int(time.time() * 1000)
-        random.seed(timestamp)
+        seed = new_paper_seed(request_user_key())
+        rng = paper_rng(seed)
         
         for question in selected_questions:
             if question['type'] == 'mcq' and question['options']:
-                random.shuffle(question['options'])
+                rng.shuffle(question['options'])
         
-        random.seed()
-        
-        print(f"HARDCODED API: Created {len(selected_questions)} unique questions")
-        print(f"HARDCODED API: First 3 questions: {[q['text'][:30] + '...' for q in selected_questions[:3]]}")
+        log.debug('Built hardcoded paper', extra={'seed': seed, 'questions': len(selected_questions)})
         
         return jsonify({
             'questions': selected_questions,
@@ -1192,73 +1221,129 @@ def get_questions_hardcoded(domain, difficulty):
             'mcq_count': len([q for q in selected_questions if q.get('type') == 'mcq']),
             'text_count': len([q for q in selected_questions if q.get('type') == 'text']),
             'randomization_timestamp': timestamp,
+            'seed': seed,
             'api_version': 'hardcoded',
             'uniqueness_check': f"{len(selected_questions)}/{len(selected_questions)} unique",
             'duplicate_check': f"{len(selected_questions)} total questions"
         }), 200
         
     except Exception as e:
-        print(f"HARDCODED API ERROR: {str(e)}")
+        log.exception('Error building hardcoded paper', extra={'domain': domain, 'difficulty': difficulty})
         return jsonify({'message': f'Hardcoded API error: {str(e)}'}), 500
 
 @app.route('/api/questions-backup/<domain>/<difficulty>')
 def get_questions_backup(domain, difficulty):
     """Backup API endpoint with simplified question selection"""
     try:
-        if not os.path.exists(QUESTIONS_FILE):
+        if not question_bank.exists():
             return jsonify({'message': 'Questions not found'}), 404
         
-        with open(QUESTIONS_FILE, 'r') as f:
-            all_questions = json.load(f)
-        
-        if domain not in all_questions or difficulty not in all_questions[domain]:
-            return jsonify({'message': 'Domain or difficulty not found'}), 404
-        
-        # Get all questions for the domain and difficulty
-        questions = all_questions[domain][difficulty]
-        
-        # Simple randomization without complex logic
-        import time
+        # Simple randomization with a private per-paper RNG
         timestamp = int(time.time())
-        random.seed(timestamp)
-        
-        # Shuffle all questions
-        questions_copy = questions.copy()
-        random.shuffle(questions_copy)
+        seed = new_paper_seed(request_user_key())
+        rng = paper_rng(seed)
         
         # Take required number based on difficulty
         limits = {'easy': 45, 'medium': 30, 'hard': 15}
         max_questions = limits.get(difficulty, 15)
         
-        selected = questions_copy[:max_questions]
-        
-        # Shuffle options for MCQ questions
-        for q in selected:
-            if q.get('type') == 'mcq' and q.get('options'):
-                random.shuffle(q['options'])
-        
-        random.seed()
+        # Sample questions and shuffle MCQ options
+        paper = question_bank.render_paper(domain, difficulty, max_questions, rng)
+        if paper is None:
+            return jsonify({'message': 'Domain or difficulty not found'}), 404
+        questions, mcq_count, text_count, _, _ = paper
         
-        return jsonify({
-            'questions': selected,
-            'total_questions': len(selected),
-            'mcq_count': len([q for q in selected if q.get('type') == 'mcq']),
-            'text_count': len([q for q in selected if q.get('type') == 'text']),
+        return questions_response(questions, {
+            'total_questions': mcq_count + text_count,
+            'mcq_count': mcq_count,
+            'text_count': text_count,
             'randomization_timestamp': timestamp,
+            'seed': seed,
             'api_version': 'backup'
-        }), 200
+        })
         
     except Exception as e:
         return jsonify({'message': f'Backup API error: {str(e)}'}), 500
 
+@app.route('/api/grade', methods=['POST'])
+def grade():
+    """Score a whole submission against the compiled answer matchers"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return jsonify({'message': 'Request body must be a JSON object'}), 400
+    
+    # Papers issued with ?strip_answers=1 are graded from their cached answer
+    # key; answers are given by position, as a list or {index: answer}
+    paper_id = data.get('paper_id')
+    if paper_id:
+        if not isinstance(paper_id, str):
+            return jsonify({'message': 'paper_id must be a string'}), 400
+        paper = paper_cache.get(paper_id)
+        if paper is None:
+            return jsonify({'message': 'Paper not found or expired'}), 404
+        answers = data.get('answers') or {}
+        if isinstance(answers, list):
+            answers = dict(enumerate(answers))
+        elif isinstance(answers, dict):
+            answers = {int(k): v for k, v in answers.items() if str(k).isdigit()}
+        else:
+            return jsonify({'message': 'answers must be a list or an object'}), 400
+        pairs = [(matcher, answers.get(i)) for i, matcher in enumerate(paper['answer_key'])]
+        result = grade_submission(pairs)
+        result['paper_id'] = paper_id
+        # Count each issued paper towards the question statistics once
+        if not paper.get('graded'):
+            paper['graded'] = True
+            record_item_results(paper['domain'], result)
+        return jsonify(result), 200
+    
+    domain = data.get('domain')
+    difficulty = data.get('difficulty')
+    answers = data.get('answers')
+    
+    # Answers may be {question_id: answer} or [{'id': ..., 'answer': ...}]
+    if isinstance(answers, dict):
+        answers = [{'id': question_id, 'answer': answer} for question_id, answer in answers.items()]
+    if not domain or not difficulty or not isinstance(answers, list) or not answers:
+        return jsonify({'message': 'domain, difficulty and answers are required'}), 400
+    if not isinstance(domain, str) or not isinstance(difficulty, str):
+        return jsonify({'message': 'domain and difficulty must be strings'}), 400
+    
+    matchers = question_bank.matchers(domain, difficulty)
+    if matchers is None:
+        return jsonify({'message': 'Domain or difficulty not found'}), 404
+    
+    pairs = []
+    for item in answers:
+        question_id = item.get('id') if isinstance(item, dict) else None
+        # JSON object keys arrive as strings
+        if isinstance(question_id, str) and question_id.isdigit():
+            question_id = int(question_id)
+        # Ids are matched as dict keys; anything else (a list, an object) is not an id
+        if not isinstance(question_id, (str, int)) or isinstance(question_id, bool):
+            return jsonify({'message': f'Invalid question id: {question_id!r}'}), 400
+        matcher = matchers.get(question_id)
+        if matcher is None:
+            return jsonify({'message': f'Unknown question id: {question_id}'}), 400
+        pairs.append((matcher, item.get('answer')))
+    
+    # Not counted towards the question statistics: nothing ties these
+    # answers to an issued paper, so the same ones could be posted again
+    return jsonify(grade_submission(pairs)), 200
+
 @app.route('/api/user-progress', methods=['GET'])
 def get_user_progress():
-    progress = {}
-    if os.path.exists(PROGRESS_FILE):
-        with open(PROGRESS_FILE, 'r') as f:
-            progress = json.load(f)
-    
-    return jsonify(progress), 200
+    # Revalidated on every visit. The ETag comes from the storage version,
+    # so unchanged progress is answered with a 304 before anything is read
+    # or serialized
+    version = storage.progress_version()
+    if request.if_none_match.contains(version):
+        response = app.response_class(status=304)
+    else:
+        response = jsonify(storage.get_progress())
+    response.set_etag(version)
+    response.headers['Cache-Control'] = PAGE_CACHE_CONTROL
+    return response
 
 @app.route('/api/update-stats', methods=['POST'])
 def update_stats():
@@ -1267,18 +1352,20 @@ def update_stats():
     difficulty = data.get('difficulty')
     results = data.get('results')
     
+    # Answers keyed by question id let the interview be regraded later when
+    # the question bank changes; they are stored in one canonical shape
+    answers = None
+    if data.get('answers') is not None:
+        answers = regradable_answers(data['answers'])
+        if answers is None:
+            return jsonify({'message': 'answers must be a list of {id, answer} with integer ids and string answers'}), 400
+    
     # Load current user data
     email = request.args.get('email', 'test@example.com')  # In real app, get from token
-    users = {}
-    if os.path.exists(USERS_FILE):
-        with open(USERS_FILE, 'r') as f:
-            users = json.load(f)
-    
-    if email not in users:
+    user = storage.get_user(email)
+    if user is None:
         return jsonify({'message': 'User not found'}), 404
     
-    user = users[email]
-    
     # Update user stats with proper calculations
     credits_earned = results.get('creditsEarned', 0)
     user['credits'] = user.get('credits', 0) + credits_earned
@@ -1303,37 +1390,88 @@ def update_stats():
         user['accuracy'] = current_score
     
     # Save updated user data
-    with open(USERS_FILE, 'w') as f:
-        json.dump(users, f, indent=2)
-    
-    # Update progress
-    progress = {}
-    if os.path.exists(PROGRESS_FILE):
-        with open(PROGRESS_FILE, 'r') as f:
-            progress = json.load(f)
+    save_user(email, user)
     
-    if email not in progress:
-        progress[email] = {}
-    
-    if domain not in progress[email]:
-        progress[email][domain] = {'completed': 0, 'interviews': []}
-    
-    progress[email][domain]['completed'] += 1
-    progress[email][domain]['interviews'].append({
+    # Update progress and interview history (which keeps the running aggregates)
+    timestamp = datetime.now().isoformat()
+    storage.record_progress(email, domain, {
         'difficulty': difficulty,
         'score': results['accuracy'],
-        'timestamp': datetime.now().isoformat()
+        'timestamp': timestamp
     })
-    
-    with open(PROGRESS_FILE, 'w') as f:
-        json.dump(progress, f, indent=2)
+    interview = {
+        'domain': domain,
+        'difficulty': difficulty,
+        'score': results['accuracy'],
+        'correctAnswers': results.get('correctAnswers', 0),
+        'totalQuestions': results.get('totalQuestions', 0),
+        'creditsEarned': credits_earned,
+        'completedAt': timestamp
+    }
+    if answers is not None:
+        interview['answers'] = answers
+    storage.record_interview(email, interview)
+    # Batched with the storage writes when they are written behind
+    storage.defer(
+        leaderboard.record_many,
+        (email, user.get('fullName'), domain, difficulty, credits_earned, results['accuracy'])
+    )
     
     # Add logging for debugging
-    print(f"Updated stats for {email}: credits={user['credits']}, streak={user['streak']}, accuracy={user['accuracy']:.1f}%, interviews={user['interviewsCompleted']}")
+    log.info('Updated stats', extra={
+        'email': email,
+        'credits': user['credits'],
+        'streak': user['streak'],
+        'accuracy': round(user['accuracy'], 1),
+        'interviews': user['interviewsCompleted']
+    })
     
-    user_data = {k: v for k, v in user.items() if k != 'password_hash'}
+    user_data = public_user(user)
     return jsonify({'user': user_data}), 200
 
+def leaderboard_scope():
+    """(metric, scope, None) for the request's ?metric=&domain=&difficulty=, or (None, None, error)"""
+    metric = request.args.get('metric', 'credits')
+    domain = request.args.get('domain')
+    difficulty = request.args.get('difficulty')
+    if metric not in METRICS:
+        return None, None, (jsonify({'message': f"metric must be one of: {', '.join(METRICS)}"}), 400)
+    if bool(domain) != bool(difficulty):
+        return None, None, (jsonify({'message': 'domain and difficulty go together'}), 400)
+    return metric, scope_name(domain, difficulty), None
+
+@app.route('/api/leaderboard', methods=['GET'])
+def get_leaderboard():
+    metric, scope, error = leaderboard_scope()
+    if error:
+        return error
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    limit = min(max(request.args.get('limit', LEADERBOARD_PAGE_SIZE, type=int), 1), LEADERBOARD_MAX_PAGE_SIZE)
+    total, entries = leaderboard.page(metric, scope, offset, limit)
+    end = offset + len(entries)
+    next_page = None
+    if end < total:
+        next_page = request.path + '?' + urlencode(dict(request.args, offset=end, limit=limit))
+    return jsonify({
+        'metric': metric,
+        'scope': scope,
+        'total': total,
+        'offset': offset,
+        'entries': entries,
+        'next': next_page
+    }), 200
+
+@app.route('/api/leaderboard/me', methods=['GET'])
+def get_my_rank():
+    email = request_email()
+    if not email:
+        return jsonify({'message': 'Email is required'}), 400
+    metric, scope, error = leaderboard_scope()
+    if error:
+        return error
+    total, entry = leaderboard.position(metric, scope, email)
+    return jsonify({'metric': metric, 'scope': scope, 'total': total, 'entry': entry}), 200
+
 @app.route('/api/sync-user-stats', methods=['GET'])
 def sync_user_stats():
     try:
@@ -1342,60 +1480,141 @@ def sync_user_stats():
             return jsonify({'message': 'Email is required'}), 400
         
         # Load user data
-        with open(USERS_FILE, 'r') as f:
-            users = json.load(f)
-        
-        if email not in users:
+        user = storage.get_user(email)
+        if user is None:
             return jsonify({'message': 'User not found'}), 404
         
-        user = users[email]
-        
-        # Load interview history to calculate real stats
-        interviews = []
-        if os.path.exists(INTERVIEWS_FILE):
-            with open(INTERVIEWS_FILE, 'r') as f:
-                interviews_data = json.load(f)
-                interviews = interviews_data.get(email, [])
-        
-        # Calculate real stats from interview history
-        total_credits = sum(interview.get('creditsEarned', 0) for interview in interviews)
-        total_interviews = len(interviews)
-        total_score = sum(interview.get('score', 0) for interview in interviews)
-        overall_accuracy = round(total_score / total_interviews) if total_interviews > 0 else 0
-        
-        # Calculate streak
-        current_streak = 0
-        best_streak = 0
-        temp_streak = 0
+        # Real stats from the running aggregates of the interview history
+        synced = user_record_stats(storage.get_user_stats(email))
         
-        for interview in interviews:
-            if interview.get('score', 0) >= 70:
-                temp_streak += 1
-                current_streak = temp_streak
-                if temp_streak > best_streak:
-                    best_streak = temp_streak
-            else:
-                temp_streak = 0
+        # Save updated user data only if something changed
+        if any(user.get(key) != value for key, value in synced.items()):
+            user.update(synced)
+            save_user(email, user)
         
-        # Update user with real calculated stats
-        user['credits'] = total_credits
-        user['interviewsCompleted'] = total_interviews
-        user['accuracy'] = overall_accuracy
-        user['streak'] = current_streak
-        
-        # Save updated user data
-        with open(USERS_FILE, 'w') as f:
-            json.dump(users, f, indent=2)
-        
-        user_data = {k: v for k, v in user.items() if k != 'password_hash'}
-        print(f"Synced user stats for {email}: credits={total_credits}, interviews={total_interviews}, accuracy={overall_accuracy}%, streak={current_streak}")
+        user_data = public_user(user)
+        log.info('Synced user stats', extra={
+            'email': email,
+            'credits': synced['credits'],
+            'interviews': synced['interviewsCompleted'],
+            'accuracy': synced['accuracy'],
+            'streak': synced['streak']
+        })
         
         return jsonify(user_data), 200
         
     except Exception as e:
-        print(f"Error syncing user stats: {str(e)}")
+        log.exception('Error syncing user stats')
         return jsonify({'message': f'Error syncing user stats: {str(e)}'}), 500
 
+@app.cli.command('migrate-storage')
+def migrate_storage():
+    """Import the JSON data files into the SQLite database"""
+    users, progress_entries, interviews = migrate_json_to_sqlite(
+        USERS_FILE, PROGRESS_FILE, PROGRESS_LOG_FILE, INTERVIEWS_FILE, INTERVIEWS_LOG_FILE, STORAGE_DB_FILE
+    )
+    print(f"Migrated {users} users, {progress_entries} progress entries and {interviews} interviews into {STORAGE_DB_FILE}")
+
+@app.cli.command('compact-progress')
+def compact_progress():
+    """Fold the progress and interview event logs into their snapshots"""
+    storage.compact()
+    print(f"Compacted {PROGRESS_LOG_FILE} into {PROGRESS_FILE} and {INTERVIEWS_LOG_FILE} into {INTERVIEWS_FILE}")
+
+@app.cli.command('compile-questions')
+def compile_questions_command():
+    """Compile questions.json into the mmappable question bank"""
+    if not os.path.exists(QUESTIONS_FILE):
+        create_sample_questions()
+    count, dropped = compile_questions(QUESTIONS_FILE, QUESTIONS_BIN)
+    print(f"Compiled {count} questions from {QUESTIONS_FILE} into {QUESTIONS_BIN} ({dropped} duplicates dropped)")
+
+@app.cli.command('reproduce-paper')
+@click.argument('domain')
+@click.argument('difficulty')
+@click.argument('seed')
+def reproduce_paper(domain, difficulty, seed):
+    """Print the paper issued by /api/questions for a recorded seed"""
+    pool = question_bank.get(domain, difficulty)
+    if pool is None:
+        raise click.ClickException('Domain or difficulty not found')
+    limits = {'easy': 45, 'medium': 30, 'hard': 15}
+    questions = sample_questions(pool, limits.get(difficulty, 15), paper_rng(seed))
+    print(json.dumps(questions, indent=2))
+
+@app.cli.command('regrade')
+@click.option('--workers', type=int, default=None, help='Grading processes (default: one per CPU)')
+@click.option('--window', type=int, default=10000, help='Interviews held in memory at once')
+def regrade(workers, window):
+    """Re-score stored interviews against the current question bank"""
+    seen, rescored = regrade_interviews(storage, QUESTIONS_FILE, QUESTIONS_BIN, workers=workers, window=window)
+    print(f"Regraded {seen} interviews, {rescored} scores changed")
+    if rescored:
+        print(f"Rebuilt the leaderboard from {rebuild_leaderboard_totals()} interviews")
+
+@app.cli.command('rebuild-stats')
+@click.option('--fix', is_flag=True, help='Replace aggregates that disagree with the history')
+def rebuild_stats(fix):
+    """Verify per-user aggregates against the full interview history"""
+    mismatches = storage.verify_user_stats(fix=fix)
+    for email, stored, expected in mismatches:
+        print(f"{email}: stored={stored} expected={expected}")
+    action = 'Fixed' if fix else 'Found'
+    print(f"{action} {len(mismatches)} users with aggregates that do not match their history")
+    if mismatches and not fix:
+        sys.exit(1)
+
+def rebuild_leaderboard_totals():
+    """Recompute the leaderboard from storage; returns the interviews counted"""
+    storage.flush()
+    names = {email: user.get('fullName') for email, user in storage.iter_users()}
+    return leaderboard.rebuild(
+        ((email, interview) for _key, email, interview in storage.iter_interviews()), names
+    )
+
+@app.cli.command('rebuild-leaderboard')
+def rebuild_leaderboard():
+    """Recompute the leaderboard from the stored interview history"""
+    print(f"Rebuilt the leaderboard from {rebuild_leaderboard_totals()} interviews")
+
+@app.cli.command('generate-data')
+@click.argument('directory')
+@click.option('--users', type=int, default=100000, help='Users to generate')
+@click.option('--questions-per-pool', type=int, default=500, help='Questions per domain/difficulty')
+@click.option('--interviews', default='poisson:8', help='Interviews per user, e.g. poisson:8, geometric:0.1, lognormal:1.5:1')
+@click.option('--scores', default='beta:5:2', help='Interview scores (0-100), e.g. beta:5:2, normal:70:15, uniform:0:100')
+@click.option('--password', default='password123', help='Password shared by every generated user')
+@click.option('--seed', type=int, default=1)
+@click.option('--force', is_flag=True, help='Overwrite data files already in DIRECTORY')
+def generate_data(directory, users, questions_per_pool, interviews, scores, password, seed, force):
+    """Stream a large synthetic data set into DIRECTORY in the app's file formats"""
+    try:
+        interview_counts = parse_distribution(interviews)
+        score_samples = parse_distribution(scores)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+    
+    os.makedirs(directory, exist_ok=True)
+    existing = [name for name in (USERS_FILE, PROGRESS_FILE, INTERVIEWS_FILE, QUESTIONS_FILE)
+                if os.path.exists(os.path.join(directory, name))]
+    if existing and not force:
+        raise click.ClickException(f"{directory} already has {', '.join(existing)}; pass --force to overwrite")
+    # Logs, the compiled bank and item statistics belong to the old data
+    for name in (PROGRESS_LOG_FILE, INTERVIEWS_LOG_FILE, QUESTIONS_BIN, QUESTION_STATS_FILE, QUESTION_STATS_LOG_FILE,
+                 LEADERBOARD_FILE, LEADERBOARD_LOG_FILE):
+        if name and os.path.exists(os.path.join(directory, name)):
+            os.remove(os.path.join(directory, name))
+    
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    # One hash shared by every user; hashing each password would dominate the run
+    written = write_history(directory, users, password_hasher.hash(password), rng, interview_counts, score_samples)
+    questions = write_questions(
+        os.path.join(directory, QUESTIONS_FILE), sample_question_bank(), questions_per_pool, rng
+    )
+    print(f"Generated {users} users, {written} interviews and {questions} questions "
+          f"in {directory} ({time.perf_counter() - started:.1f}s)")
+
 if __name__ == '__main__':
     init_data_files()
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,243 @@
+"""Load-test the API in-process and record latency percentiles as JSON.
+
+Builds (or reuses) a synthetic data directory, imports the app against it
+and drives signup -> login -> questions -> update-stats -> sync-user-stats
+flows from concurrent threads through Flask test clients:
+
+    python bench.py --users 100000 --flows 2000 --concurrency 16 --output run.json
+    python bench.py --backend sqlite --baseline run.json
+
+With --baseline, endpoints whose p95 got worse by more than --tolerance are
+reported and the exit status is 1.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, REPO_DIR)
+
+from filestore import read_json  # noqa: E402
+from passwords import PasswordHasher  # noqa: E402
+from synthetic import DIFFICULTIES, DOMAINS, parse_distribution, user_email, write_history, write_questions  # noqa: E402
+
+PASSWORD = 'benchmark-password'
+ENDPOINTS = ('signup', 'login', 'questions', 'update-stats', 'sync-user-stats')
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=10000, help='existing users in the synthetic data set')
+    parser.add_argument('--questions-per-pool', type=int, default=500, help='questions per domain/difficulty')
+    parser.add_argument('--interviews', default='poisson:8', help='interviews per existing user, e.g. poisson:8')
+    parser.add_argument('--scores', default='beta:5:2', help='scores of their interviews, e.g. beta:5:2')
+    parser.add_argument('--flows', type=int, default=500, help='signup-to-sync flows to run')
+    parser.add_argument('--warmup', type=int, default=20, help='flows run before measuring')
+    parser.add_argument('--concurrency', type=int, default=8, help='threads driving flows')
+    parser.add_argument('--backend', choices=('json', 'sqlite'), default='json')
+    parser.add_argument('--write-behind', choices=('0', '1'), default='1')
+    parser.add_argument('--scrypt-n', type=int, default=2 ** 14, help='scrypt cost for passwords')
+    parser.add_argument('--packed', action='store_true', help='serve questions from the compiled bank')
+    parser.add_argument('--data-dir', help='reuse (or create) this data directory instead of a temporary one')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', default='bench-result.json')
+    parser.add_argument('--baseline', help='earlier result to compare p95 latencies against')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='allowed p95 slowdown (0.2 = 20%%)')
+    return parser.parse_args()
+
+
+def percentile(ordered, q):
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return None
+    rank = max(1, math.ceil(q * len(ordered) / 100))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def prepare(args):
+    directory = args.data_dir or tempfile.mkdtemp(prefix='interview-bench-')
+    if not os.path.exists(os.path.join(directory, 'users.json')):
+        started = time.perf_counter()
+        password_hash = PasswordHasher(n=args.scrypt_n).hash(PASSWORD)
+        rng = random.Random(args.seed)
+        os.makedirs(directory, exist_ok=True)
+        interviews = write_history(
+            directory, args.users, password_hash, rng,
+            parse_distribution(args.interviews), parse_distribution(args.scores)
+        )
+        # Variants of the repository's sample bank
+        write_questions(
+            os.path.join(directory, 'questions.json'), read_json(os.path.join(REPO_DIR, 'questions.json')),
+            args.questions_per_pool, rng
+        )
+        print(f'Generated {args.users} users and {interviews} interviews in {directory} '
+              f'({time.perf_counter() - started:.1f}s)', file=sys.stderr)
+
+    os.environ['STORAGE_BACKEND'] = args.backend
+    os.environ['WRITE_BEHIND'] = args.write_behind
+    os.environ['PASSWORD_SCRYPT_N'] = str(args.scrypt_n)
+    os.environ['QUESTIONS_BIN'] = 'questions.bin' if args.packed else ''
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+    # The app keeps its data files relative to the working directory
+    os.chdir(directory)
+
+    import app
+    if args.backend == 'sqlite' and app.storage.get_user(user_email(0)) is None:
+        app.migrate_json_to_sqlite(
+            app.USERS_FILE, app.PROGRESS_FILE, app.PROGRESS_LOG_FILE,
+            app.INTERVIEWS_FILE, app.INTERVIEWS_LOG_FILE, app.STORAGE_DB_FILE
+        )
+    if args.packed:
+        app.compile_questions(app.QUESTIONS_FILE, app.QUESTIONS_BIN)
+    return directory, app
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = {name: [] for name in ENDPOINTS}
+        self.errors = {name: 0 for name in ENDPOINTS}
+
+    def call(self, name, send, expected):
+        started = time.perf_counter()
+        response = send()
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.latencies[name].append(elapsed)
+            if response.status_code != expected:
+                self.errors[name] += 1
+        return response
+
+
+def run_flow(client, recorder, run_id, index, rng):
+    email = f'bench-{run_id}-{index}@example.com'
+    domain = rng.choice(DOMAINS)
+    difficulty = rng.choice(DIFFICULTIES)
+    recorder.call('signup', lambda: client.post(
+        '/api/signup', json={'email': email, 'password': PASSWORD, 'fullName': 'Bench User'}
+    ), 201)
+    recorder.call('login', lambda: client.post(
+        '/api/login', json={'email': email, 'password': PASSWORD}
+    ), 200)
+    recorder.call('questions', lambda: client.get(f'/api/questions/{domain}/{difficulty}'), 200)
+    accuracy = rng.randint(0, 100)
+    recorder.call('update-stats', lambda: client.post(f'/api/update-stats?email={email}', json={
+        'domain': domain,
+        'difficulty': difficulty,
+        'results': {'accuracy': accuracy, 'creditsEarned': accuracy * 2}
+    }), 200)
+    recorder.call('sync-user-stats', lambda: client.get(f'/api/sync-user-stats?email={email}'), 200)
+
+
+def run(app, args, flows, recorder):
+    local = threading.local()
+    run_id = f'{os.getpid()}-{time.time_ns()}'
+
+    def worker(index):
+        client = getattr(local, 'client', None)
+        if client is None:
+            client = local.client = app.app.test_client()
+        run_flow(client, recorder, run_id, index, random.Random(args.seed * 1000003 + index))
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        for future in [pool.submit(worker, index) for index in range(flows)]:
+            future.result()
+    return time.perf_counter() - started
+
+
+def summarize(recorder, wall_seconds):
+    endpoints = {}
+    for name in ENDPOINTS:
+        ordered = sorted(recorder.latencies[name])
+        if not ordered:
+            continue
+        endpoints[name] = {
+            'count': len(ordered),
+            'errors': recorder.errors[name],
+            'mean_ms': sum(ordered) / len(ordered) * 1000,
+            'p50_ms': percentile(ordered, 50) * 1000,
+            'p95_ms': percentile(ordered, 95) * 1000,
+            'p99_ms': percentile(ordered, 99) * 1000,
+            'max_ms': ordered[-1] * 1000,
+        }
+    requests = sum(len(values) for values in recorder.latencies.values())
+    return {
+        'wall_seconds': wall_seconds,
+        'requests': requests,
+        'requests_per_second': requests / wall_seconds if wall_seconds else None,
+        'flows_per_second': len(recorder.latencies['signup']) / wall_seconds if wall_seconds else None,
+        'endpoints': endpoints,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=REPO_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(result, baseline, tolerance):
+    """Return (endpoint, baseline p95, current p95) for every p95 regression"""
+    regressions = []
+    for name, current in result['endpoints'].items():
+        previous = baseline.get('endpoints', {}).get(name)
+        if previous and current['p95_ms'] > previous['p95_ms'] * (1 + tolerance):
+            regressions.append((name, previous['p95_ms'], current['p95_ms']))
+    return regressions
+
+
+def main():
+    args = parse_args()
+    output = os.path.abspath(args.output)
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+    directory, app = prepare(args)
+
+    if args.warmup:
+        run(app, args, args.warmup, Recorder())
+    recorder = Recorder()
+    wall_seconds = run(app, args, args.flows, recorder)
+    app.storage.flush()
+
+    result = {
+        'config': {key: value for key, value in vars(args).items() if key not in ('output', 'baseline')},
+        'data_dir': directory,
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'finished_at': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+    result.update(summarize(recorder, wall_seconds))
+    with open(output, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    print(f"{result['requests']} requests in {wall_seconds:.2f}s ({result['requests_per_second']:.1f} req/s)")
+    print(f"{'endpoint':<18}{'count':>7}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, stats in result['endpoints'].items():
+        print(f"{name:<18}{stats['count']:>7}{stats['errors']:>8}"
+              f"{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}{stats['p99_ms']:>10.2f}")
+    print(f'Saved {output}')
+
+    if baseline_path:
+        with open(baseline_path) as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        for name, before, after in regressions:
+            print(f'REGRESSION {name}: p95 {before:.2f} ms -> {after:.2f} ms')
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import uuid
+
+from filestore import atomic_write, file_lock, replace_with, write_temp
+from metrics import io_timer
+
+log = logging.getLogger(__name__)
+
+
+class EventLog:
+    """Append-only JSON-lines log replayed on top of a JSON snapshot.
+
+    State is rebuilt by loading the snapshot and applying every record in the
+    log with `apply(state, record)`. Appending a record costs one line write
+    regardless of how much history exists. `compact()` folds the log into a
+    new snapshot and starts a new log. A background thread does this once
+    `compact_every` records have been appended and the log has grown to
+    `compact_ratio` times the snapshot's size, so no append waits on it and
+    the cost of rewriting the snapshot is spread over a number of appends
+    that grows with it.
+
+    `load(state)`, if given, is called with the freshly parsed snapshot before
+    the log is replayed, so derived indexes can be rebuilt alongside it.
+
+    The first line of the log is a header holding a hash of the snapshot it
+    extends. A compaction serializes the snapshot and writes it to a temp
+    file without the inter-process lock, then, holding it, replaces the log
+    with one that keeps the records the new snapshot does not yet cover and
+    finally renames the snapshot into place. The new header names both
+    snapshots and how many bytes of records the new one already holds, so
+    whichever snapshot a reader (or a restart after a crash) sees, every
+    record is applied exactly once. A log that matches neither snapshot is
+    only discarded after checking again under the lock. Each log's header
+    also carries a random id, which is how readers notice it was replaced
+    (inode numbers get reused).
+
+    Appends and compactions hold an inter-process lock on the log, so several
+    workers can share the same files. Records they append are picked up by
+    `refresh()`, which reads only the bytes added since the last call.
+    """
+
+    def __init__(self, snapshot_path, log_path, apply, load=None, compact_every=1000, compact_ratio=0.25):
+        self.snapshot_path = snapshot_path
+        self.log_path = log_path
+        self.apply = apply
+        self.load = load
+        self.compact_every = compact_every
+        self.compact_ratio = compact_ratio
+        self.lock = threading.RLock()
+        self._compacting = False
+        self._load()
+
+    def _load(self):
+        if not self._try_load():
+            # Either a crash left a stale log, or another process compacted
+            # between our reading the snapshot and the log; only a check
+            # under the lock can tell them apart
+            with file_lock(self.log_path):
+                if not self._try_load():
+                    self._reset_log()
+
+    def _try_load(self):
+        snapshot_bytes = b''
+        with io_timer():
+            if os.path.exists(self.snapshot_path):
+                with open(self.snapshot_path, 'rb') as f:
+                    snapshot_bytes = f.read()
+            self.state = json.loads(snapshot_bytes) if snapshot_bytes.strip() else {}
+        self._snapshot_hash = hashlib.sha1(snapshot_bytes).hexdigest()
+        self._snapshot_size = len(snapshot_bytes)
+        if self.load:
+            self.load(self.state)
+        # First line of the log we are reading, and the snapshot it names
+        self._log_header = None
+        self._log_snapshot = None
+        self._offset = 0
+        # Log position where the records the snapshot does not hold begin
+        self._body_start = 0
+        self._appended = 0
+        return self._replay()
+
+    @staticmethod
+    def _new_header(snapshot_hash, **fields):
+        return (json.dumps(dict(snapshot=snapshot_hash, log=uuid.uuid4().hex, **fields)) + '\n').encode()
+
+    def _replay(self):
+        """Apply complete records written to the log since the last replay.
+
+        Returns False if the log belongs to a different snapshot, or was
+        replaced since the last replay.
+        """
+        with io_timer():
+            try:
+                f = open(self.log_path, 'rb')
+            except FileNotFoundError:
+                return self._log_header is None
+            with f:
+                if self._log_header is not None and f.readline() != self._log_header:
+                    return False
+                f.seek(self._offset)
+                data = f.read()
+
+        # A trailing partial line is an append still in flight (or a torn
+        # write after a crash); leave it for the next replay.
+        end = data.rfind(b'\n') + 1
+        position = self._offset
+        for line in data[:end].splitlines(keepends=True):
+            start = position
+            position += len(line)
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # Torn write terminated by a later append
+                continue
+            if 'snapshot' in record:
+                if record['snapshot'] == self._snapshot_hash:
+                    # The first `skip` bytes of records are in the snapshot
+                    self._body_start = position + record.get('skip', 0)
+                elif record.get('previous') == self._snapshot_hash:
+                    # Written by a compaction whose snapshot is not in place
+                    # (yet, or ever): every record still applies
+                    self._body_start = position
+                else:
+                    return False
+                self._log_header = line
+                self._log_snapshot = record['snapshot']
+                continue
+            if start >= self._body_start:
+                self.apply(self.state, record)
+        self._offset += end
+        return True
+
+    def _reset_log(self):
+        header = self._new_header(self._snapshot_hash)
+        with file_lock(self.log_path):
+            atomic_write(self.log_path, header)
+        self._log_header = header
+        self._log_snapshot = self._snapshot_hash
+        self._offset = self._body_start = len(header)
+
+    def refresh(self):
+        """Pick up records appended (or compactions done) by other processes"""
+        with self.lock:
+            if not self._replay():
+                self._load()
+
+    def version(self):
+        """Token that changes whenever the state does.
+
+        Call refresh() first to take records from other processes into
+        account. Processes that have read the same files agree on it.
+        """
+        return f'{self._snapshot_hash}-{self._offset}'
+
+    def append(self, record):
+        self.append_many([record])
+
+    def append_many(self, records):
+        """Append several records with a single write and fsync"""
+        if not records:
+            return
+        data = ''.join(json.dumps(record) + '\n' for record in records).encode()
+        with self.lock, file_lock(self.log_path):
+            self.refresh()
+            with io_timer(), open(self.log_path, 'ab') as f:
+                if f.tell() == 0:
+                    header = self._new_header(self._snapshot_hash)
+                    f.write(header)
+                    self._log_header = header
+                    self._log_snapshot = self._snapshot_hash
+                    self._body_start = len(header)
+                elif f.tell() != self._offset:
+                    # Unterminated record left by a crashed writer
+                    f.write(b'\n')
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+                end = f.tell()
+            for record in records:
+                self.apply(self.state, record)
+            self._offset = end
+            self._appended += len(records)
+            if self._should_compact():
+                self._compacting = True
+                threading.Thread(target=self._compact_in_background, daemon=True).start()
+
+    def _should_compact(self):
+        return (
+            self.compact_every and not self._compacting and self._appended >= self.compact_every
+            and self._offset - self._body_start >= self.compact_ratio * self._snapshot_size
+        )
+
+    def _compact_in_background(self):
+        try:
+            self.compact()
+        except Exception:
+            log.exception('Compaction failed', extra={'snapshot': self.snapshot_path})
+        finally:
+            self._compacting = False
+
+    def replace(self, state):
+        """Make `state` the new snapshot, discarding the log and current state"""
+        snapshot_bytes = json.dumps(state).encode()
+        with self.lock, file_lock(self.log_path):
+            atomic_write(self.snapshot_path, snapshot_bytes)
+            self._snapshot_hash = hashlib.sha1(snapshot_bytes).hexdigest()
+            self._snapshot_size = len(snapshot_bytes)
+            self.state = state
+            if self.load:
+                self.load(state)
+
+            self._reset_log()
+            self._appended = 0
+
+    def compact(self):
+        """Write the current state as the new snapshot and start a new log.
+
+        Serializing holds only this process's lock and writing the snapshot
+        holds none; appends in other processes wait only for the final
+        swap of the two files.
+        """
+        with self.lock:
+            self.refresh()
+            snapshot_bytes = json.dumps(self.state).encode()
+            covered = self._offset
+            log_header = self._log_header
+        snapshot_hash = hashlib.sha1(snapshot_bytes).hexdigest()
+        tmp = write_temp(self.snapshot_path, snapshot_bytes)
+        try:
+            self._swap_in(tmp, snapshot_bytes, snapshot_hash, covered, log_header)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    def _swap_in(self, tmp, snapshot_bytes, snapshot_hash, covered, log_header):
+        """Second half of compact(): replace the log, then rename `tmp` over the snapshot"""
+        with self.lock, file_lock(self.log_path):
+            self.refresh()
+            stale = self._log_header is not None and self._log_snapshot != self._snapshot_hash
+            if self._log_header != log_header or stale:
+                # Another process compacted in the meantime
+                os.unlink(tmp)
+                if stale:
+                    self._load()
+                return
+            body = b''
+            if self._offset > self._body_start:
+                # No log at all (nothing appended yet) means an empty body
+                with io_timer(), open(self.log_path, 'rb') as f:
+                    f.seek(self._body_start)
+                    body = f.read(self._offset - self._body_start)
+            header = self._new_header(snapshot_hash, previous=self._snapshot_hash, skip=covered - self._body_start)
+            # Log first: until the rename below, readers still find the old
+            # snapshot, which the header names as `previous`
+            atomic_write(self.log_path, header + body)
+            replace_with(tmp, self.snapshot_path)
+
+            self._body_start = len(header) + covered - self._body_start
+            self._offset = len(header) + len(body)
+            self._log_header = header
+            self._snapshot_hash = self._log_snapshot = snapshot_hash
+            self._snapshot_size = len(snapshot_bytes)
+            self._appended = 0
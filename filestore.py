@@ -0,0 +1,124 @@
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+from metrics import io_timer
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to in-process locking only
+    fcntl = None
+
+_thread_locks = {}
+_thread_locks_guard = threading.Lock()
+_held = threading.local()
+
+
+def _thread_lock(key):
+    with _thread_locks_guard:
+        return _thread_locks.setdefault(key, threading.Lock())
+
+
+@contextmanager
+def file_lock(path):
+    """Exclusive lock on a data file, held across threads and processes.
+
+    The lock lives on a '<path>.lock' side file so the data file itself can
+    be replaced while the lock is held. Re-entrant within a thread.
+    """
+    key = os.path.abspath(path)
+    held = _held.__dict__.setdefault('paths', set())
+    if key in held:
+        # flock() on a second descriptor would block on ourselves
+        yield
+        return
+    with _thread_lock(key):
+        held.add(key)
+        try:
+            if fcntl is None:
+                yield
+                return
+            with open(path + '.lock', 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+        finally:
+            held.discard(key)
+
+
+def _fsync_dir(path):
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_temp(path, data):
+    """Write `data` to a fsynced temp file next to `path` and return its name"""
+    if isinstance(data, str):
+        data = data.encode()
+    directory = os.path.dirname(os.path.abspath(path))
+    with io_timer():
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    return tmp
+
+
+def replace_with(tmp, path):
+    """Rename a temp file from `write_temp` over `path`, durably"""
+    with io_timer():
+        try:
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        _fsync_dir(path)
+
+
+def atomic_write(path, data):
+    """Replace a file's contents so readers and crashes see old or new, never half.
+
+    Writes a temp file next to `path`, fsyncs it, renames it over `path`
+    and fsyncs the directory so the rename itself is durable.
+    """
+    replace_with(write_temp(path, data), path)
+
+
+def atomic_write_json(path, data, indent=2):
+    atomic_write(path, json.dumps(data, indent=indent))
+
+
+def read_json(path, default=None):
+    with io_timer():
+        if not os.path.exists(path):
+            return {} if default is None else default
+        with open(path, 'r') as f:
+            return json.load(f)
+
+
+def update_json(path, update):
+    """Locked read-modify-write of a JSON file; `update` edits it in place.
+
+    Returns whatever `update` returns. Nothing is written if it returns False.
+    """
+    with file_lock(path):
+        data = read_json(path)
+        result = update(data)
+        if result is not False:
+            atomic_write_json(path, data)
+        return result
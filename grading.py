@@ -0,0 +1,89 @@
+import re
+
+# Share of a text question's keywords an answer must mention to count as correct
+KEYWORD_THRESHOLD = 0.5
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Longest suffixes first so 'ations' wins over 's'
+SUFFIXES = ('ations', 'ation', 'ments', 'ment', 'ness', 'ings', 'ing', 'ies', 'ied',
+            'ers', 'er', 'ed', 'es', 'ly', 's')
+
+
+def stem(word):
+    """Very small suffix-stripping stemmer ('learning' -> 'learn')"""
+    for suffix in SUFFIXES:
+        if suffix == 's' and word.endswith('ss'):
+            break
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[:-len(suffix)]
+            break
+    # 'cause' and 'causes' / 'causation' should agree
+    if word.endswith('e') and len(word) > 4:
+        word = word[:-1]
+    return word
+
+
+def stem_tokens(text):
+    return {stem(token) for token in TOKEN_RE.findall(text.lower())}
+
+
+class QuestionMatcher:
+    """Answer checker for one question, compiled once when the bank loads.
+
+    MCQ answers are compared with the correct option. Text answers are
+    tokenized and stemmed once, then each keyword (itself a set of stems, so
+    multi-word keywords like 'access control' work) is a subset test.
+    """
+
+    __slots__ = ('question_id', 'type', 'correct_answer', 'keywords', 'required')
+
+    def __init__(self, question):
+        self.question_id = question.get('id')
+        self.type = question.get('type')
+        self.correct_answer = question.get('correct_answer')
+        self.keywords = [
+            frozenset(stem_tokens(keyword)) for keyword in question.get('keywords', [])
+        ]
+        self.keywords = [keyword for keyword in self.keywords if keyword]
+        self.required = len(self.keywords) * KEYWORD_THRESHOLD
+
+    def is_correct(self, answer):
+        if not isinstance(answer, str) or not answer:
+            return False
+        if self.type == 'mcq':
+            return answer == self.correct_answer
+        if not self.keywords:
+            return False
+        tokens = stem_tokens(answer)
+        matched = sum(1 for keyword in self.keywords if keyword <= tokens)
+        return matched >= self.required
+
+
+def js_round(value):
+    """Math.round() semantics, so scores match what the browser computed"""
+    return int(value + 0.5)
+
+
+def grade_submission(answers):
+    """Grade a whole paper in one pass.
+
+    `answers` is a list of (matcher, answer) pairs. Returns the same totals
+    the frontend's calculateResults produces, plus per-question results.
+    """
+    results = []
+    correct_answers = 0
+    for matcher, answer in answers:
+        correct = matcher.is_correct(answer)
+        correct_answers += correct
+        results.append({'id': matcher.question_id, 'correct': correct})
+
+    total_questions = len(results)
+    ratio = correct_answers / total_questions if total_questions else 0
+    return {
+        'correctAnswers': correct_answers,
+        'totalQuestions': total_questions,
+        'accuracy': js_round(ratio * 100),
+        'creditsEarned': js_round(ratio * 200),
+        'results': results
+    }
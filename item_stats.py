@@ -0,0 +1,224 @@
+import bisect
+import logging
+import math
+import threading
+import time
+
+from event_log import EventLog
+from question_bank import sample_indices
+
+log = logging.getLogger(__name__)
+
+# Chance of a correct answer assumed for a question before anyone has
+# answered it, by the bucket it is filed under, and how many attempts that
+# assumption is worth
+BUCKET_PRIORS = {'easy': 0.75, 'medium': 0.5, 'hard': 0.25}
+PRIOR_WEIGHT = 4
+
+
+def logit(p):
+    return math.log(p / (1 - p))
+
+
+def ability(score_total, count):
+    """A candidate's running ability, on the item difficulty scale.
+
+    Taken from their average score so far, smoothed toward 50% so a first
+    result doesn't push them to either end of the bank. Scores are clamped to
+    0-100 per interview, since clients report them.
+    """
+    correct = min(max(score_total / 100, 0), count)
+    return logit((correct + 1) / (count + 2))
+
+
+class _DomainIndex:
+    """One domain's questions sorted for selection; never modified once built.
+
+    `entries` is a sorted list of (estimated difficulty, bucket, pool
+    position), `positions` maps each question id (as a string) to its
+    (bucket, pool position) and `estimates` to its estimated difficulty.
+    """
+
+    __slots__ = ('generation', 'loads', 'built_at', 'entries', 'positions', 'estimates')
+
+    def __init__(self, generation, loads, built_at, entries, positions, estimates):
+        self.generation = generation
+        self.loads = loads
+        self.built_at = built_at
+        self.entries = entries
+        self.positions = positions
+        self.estimates = estimates
+
+
+class ItemStats:
+    """Per-question attempt and correct counts, and adaptive selection over them.
+
+    Counts are kept in an EventLog keyed by 'domain/question id' (ids are
+    unique within a domain), with one record per graded paper. A question's
+    estimated difficulty is the logit of its smoothed wrong-answer rate, so a
+    candidate of ability a answers a question of difficulty a about half the
+    time.
+
+    For selection, every question of a domain, across all difficulty
+    buckets, is kept in a list sorted by estimated difficulty, so a
+    selection is a bisect plus O(k) sampling. The list is built when a
+    domain is first used and again when the bank reloads. Questions whose
+    counts change are noted as they come in, and at most every
+    `reindex_interval` seconds a background thread re-sorts just those into
+    a copy of the list and swaps it in; requests keep using the previous
+    list meanwhile. When the snapshot reloads, the rebuild moves to the
+    background thread too.
+    """
+
+    def __init__(self, snapshot_path, log_path, bank, reindex_interval=5.0):
+        self.bank = bank
+        self.reindex_interval = reindex_interval
+        # Bumped whenever the snapshot is (re)loaded and counts may all differ
+        self._loads = 0
+        # Domain -> ids of questions whose counts changed since its index was built
+        self._changed = {}
+        self._lock = threading.Lock()
+        self._indexes = {}
+        self._reindexing = set()
+        self._log = EventLog(snapshot_path, log_path, self._apply, load=self._loaded)
+
+    def _loaded(self, state):
+        self._loads += 1
+
+    def _apply(self, state, record):
+        domain = record['domain']
+        changed = self._changed.setdefault(domain, set())
+        for question_id, correct in record['results']:
+            counts = state.setdefault(f'{domain}/{question_id}', [0, 0])
+            counts[0] += 1
+            counts[1] += bool(correct)
+            changed.add(str(question_id))
+
+    def record(self, domain, results):
+        """Count one graded paper; `results` are (question id, correct) pairs"""
+        if results:
+            self._log.append({
+                'domain': domain,
+                'results': [[question_id, bool(correct)] for question_id, correct in results],
+            })
+
+    @staticmethod
+    def _estimate(counts, difficulty):
+        attempts, correct = counts or (0, 0)
+        prior = BUCKET_PRIORS.get(difficulty, 0.5)
+        p_correct = (correct + prior * PRIOR_WEIGHT) / (attempts + PRIOR_WEIGHT)
+        return -logit(p_correct)
+
+    def _build(self, domain):
+        """Index every question of a domain from scratch; None if the bank has no such domain"""
+        self.bank.refresh()
+        generation = self.bank.generation
+        pools = self.bank.pool_ids(domain)
+        if not pools:
+            return None
+        with self._log.lock:
+            state = self._log.state
+            loads = self._loads
+            self._changed.pop(domain, None)
+            counts = [
+                (str(question_id), difficulty, position, state.get(f'{domain}/{question_id}'))
+                for difficulty, ids in pools.items()
+                for position, question_id in enumerate(ids)
+            ]
+        positions = {}
+        estimates = {}
+        entries = []
+        for question_id, difficulty, position, question_counts in counts:
+            estimate = self._estimate(question_counts, difficulty)
+            positions[question_id] = (difficulty, position)
+            estimates[question_id] = estimate
+            entries.append((estimate, difficulty, position))
+        entries.sort()
+        return _DomainIndex(generation, loads, time.monotonic(), entries, positions, estimates)
+
+    def _update(self, domain, index):
+        """A copy of `index` with the questions whose counts changed re-sorted"""
+        with self._log.lock:
+            reloaded = self._loads != index.loads
+            if not reloaded:
+                changed = self._changed.pop(domain, set())
+                counts = {
+                    question_id: self._log.state.get(f'{domain}/{question_id}')
+                    for question_id in changed if question_id in index.positions
+                }
+        if reloaded:
+            return self._build(domain)
+        estimates = dict(index.estimates)
+        moved = set()
+        added = []
+        for question_id, question_counts in counts.items():
+            difficulty, position = index.positions[question_id]
+            estimates[question_id] = estimate = self._estimate(question_counts, difficulty)
+            moved.add((difficulty, position))
+            added.append((estimate, difficulty, position))
+        # Two sorted runs, which sort() merges in linear time
+        entries = [entry for entry in index.entries if entry[1:] not in moved]
+        entries.extend(sorted(added))
+        entries.sort()
+        return _DomainIndex(index.generation, index.loads, time.monotonic(), entries, index.positions, estimates)
+
+    def _reindex_in_background(self, domain, index):
+        try:
+            updated = self._update(domain, index)
+            with self._lock:
+                if self._indexes.get(domain) is index:
+                    if updated is None:
+                        # The domain left the bank
+                        del self._indexes[domain]
+                    else:
+                        self._indexes[domain] = updated
+        except Exception:
+            log.exception('Reindexing question statistics failed', extra={'domain': domain})
+        finally:
+            with self._lock:
+                self._reindexing.discard(domain)
+
+    def _index(self, domain):
+        self._log.refresh()
+        self.bank.refresh()
+        index = self._indexes.get(domain)
+        if index is None or index.generation != self.bank.generation:
+            # Pool positions moved, so there is no earlier index to start from
+            with self._lock:
+                index = self._indexes.get(domain)
+                if index is None or index.generation != self.bank.generation:
+                    index = self._build(domain)
+                    # Unknown domains come from clients; don't keep anything for them
+                    if index is None:
+                        self._indexes.pop(domain, None)
+                        return None
+                    self._indexes[domain] = index
+            return index
+
+        stale = self._changed.get(domain) or index.loads != self._loads
+        if stale and time.monotonic() - index.built_at >= self.reindex_interval:
+            with self._lock:
+                if domain not in self._reindexing:
+                    self._reindexing.add(domain)
+                    threading.Thread(
+                        target=self._reindex_in_background, args=(domain, index), daemon=True
+                    ).start()
+        return index
+
+    def select(self, domain, k, ability, rng):
+        """Pick k questions of a domain pitched at `ability`.
+
+        Samples k of the 2k questions whose estimated difficulty is nearest
+        to it. Returns (difficulty, pool position) pairs for
+        `QuestionBank.render_items`, or an empty list for an unknown domain.
+        """
+        index = self._index(domain)
+        if index is None:
+            return []
+        entries = index.entries
+        n = len(entries)
+        k = min(k, n)
+        width = min(n, 2 * k)
+        center = bisect.bisect_left(entries, (ability,))
+        low = min(max(center - width // 2, 0), n - width)
+        return [entries[low + i][1:] for i in sample_indices(width, k, rng)]
@@ -0,0 +1,280 @@
+import random
+
+from event_log import EventLog
+
+METRICS = ('credits', 'accuracy')
+GLOBAL_SCOPE = 'global'
+# State key for {email: full name}; scopes are 'global' or contain a '/'
+NAMES = 'names'
+
+# Enough levels for ~16 million entries per board
+MAX_LEVEL = 24
+
+
+def scope_name(domain=None, difficulty=None):
+    return f'{domain}/{difficulty}' if domain else GLOBAL_SCOPE
+
+
+def record_scopes(domain, difficulty):
+    """Boards an interview counts on: the global one, plus its domain/difficulty board if it has one"""
+    if domain and difficulty:
+        return GLOBAL_SCOPE, scope_name(domain, difficulty)
+    return (GLOBAL_SCOPE,)
+
+
+def sort_key(metric, email, totals):
+    """Position of a user on a board; smallest key ranks first.
+
+    Ties on credits go by email; ties on average score go to whoever has
+    more interviews behind it, then by email.
+    """
+    credits, score_total, count = totals
+    if metric == 'credits':
+        return (-credits, email)
+    return (-score_total / count, -count, email)
+
+
+class _Node:
+    __slots__ = ('key', 'next', 'width')
+
+    def __init__(self, key, levels):
+        self.key = key
+        self.next = [None] * levels
+        # width[i]: how many entries next[i] is ahead of this node
+        self.width = [1] * levels
+
+
+class RankedIndex:
+    """Indexable skip list: sorted keys with rank lookups.
+
+    Each link records how many entries it skips, so insert, remove, finding
+    a key's rank and seeking to the entry at a rank are all O(log n)
+    expected. Reading a page is a seek plus a walk along the bottom level.
+    Keys must be unique. Not thread-safe; callers hold their own lock.
+    """
+
+    def __init__(self, seed=None):
+        self._head = _Node(None, MAX_LEVEL)
+        self._rng = random.Random(seed)
+        self._size = 0
+        # Levels above this have no nodes yet and their head widths are stale
+        self._level = 1
+
+    @classmethod
+    def from_sorted(cls, keys, seed=None):
+        """Build an index from keys already in order, in O(n)"""
+        index = cls(seed)
+        last = [index._head] * MAX_LEVEL
+        last_position = [0] * MAX_LEVEL
+        position = 0
+        for key in keys:
+            position += 1
+            node = _Node(key, index._levels())
+            for level in range(len(node.next)):
+                last[level].next[level] = node
+                last[level].width[level] = position - last_position[level]
+                last[level] = node
+                last_position[level] = position
+            index._level = max(index._level, len(node.next))
+        for level in range(MAX_LEVEL):
+            last[level].width[level] = position + 1 - last_position[level]
+        index._size = position
+        return index
+
+    def __len__(self):
+        return self._size
+
+    def _levels(self):
+        levels = 1
+        while levels < MAX_LEVEL and self._rng.random() < 0.5:
+            levels += 1
+        return levels
+
+    def insert(self, key):
+        chain = [self._head] * MAX_LEVEL
+        steps = [0] * MAX_LEVEL
+        node = self._head
+        for level in reversed(range(self._level)):
+            while node.next[level] is not None and node.next[level].key < key:
+                steps[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+
+        new = _Node(key, self._levels())
+        for level in range(self._level, len(new.next)):
+            self._head.width[level] = self._size + 1
+        self._level = max(self._level, len(new.next))
+        travelled = 0
+        for level in range(len(new.next)):
+            previous = chain[level]
+            new.next[level] = previous.next[level]
+            previous.next[level] = new
+            new.width[level] = previous.width[level] - travelled
+            previous.width[level] = travelled + 1
+            travelled += steps[level]
+        for level in range(len(new.next), self._level):
+            chain[level].width[level] += 1
+        self._size += 1
+
+    def remove(self, key):
+        chain = [None] * self._level
+        node = self._head
+        for level in reversed(range(self._level)):
+            while node.next[level] is not None and node.next[level].key < key:
+                node = node.next[level]
+            chain[level] = node
+        target = chain[0].next[0]
+        if target is None or target.key != key:
+            raise KeyError(key)
+
+        for level in range(len(target.next)):
+            previous = chain[level]
+            previous.width[level] += target.width[level] - 1
+            previous.next[level] = target.next[level]
+        for level in range(len(target.next), self._level):
+            chain[level].width[level] -= 1
+        self._size -= 1
+
+    def rank(self, key):
+        """0-based position of `key`, or None if it is not in the index"""
+        position = 0
+        node = self._head
+        for level in reversed(range(self._level)):
+            while node.next[level] is not None and node.next[level].key < key:
+                position += node.width[level]
+                node = node.next[level]
+        target = node.next[0]
+        return position if target is not None and target.key == key else None
+
+    def page(self, offset, limit):
+        """Up to `limit` keys starting at 0-based position `offset`"""
+        if offset >= self._size or limit <= 0:
+            return []
+        remaining = offset + 1
+        node = self._head
+        for level in reversed(range(self._level)):
+            while node.next[level] is not None and node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+        keys = []
+        while node is not None and len(keys) < limit:
+            keys.append(node.key)
+            node = node.next[0]
+        return keys
+
+
+class Leaderboard:
+    """Rankings by credits and by average score, overall and per domain/difficulty.
+
+    Totals are kept in an EventLog as {scope: {email: [credits, score total,
+    interviews]}}, with one record per completed interview, so every worker
+    process sees the interviews the others record. The log also keeps each
+    ranked user's full name, which public pages show instead of the email. Each (scope, metric) gets
+    a RankedIndex, built from sorted keys the first time it is read (and
+    again after the snapshot reloads) and from then on updated one record
+    at a time: recording an interview moves the user on at most two boards
+    per metric, each a remove and an insert in O(log n).
+    """
+
+    def __init__(self, snapshot_path, log_path):
+        self._boards = {}
+        self._log = EventLog(snapshot_path, log_path, self._apply, load=self._loaded)
+
+    def _loaded(self, state):
+        self._boards = {}
+
+    def _board(self, scope, metric):
+        """The index for a board, built on first use; None if nobody is ranked on it"""
+        board = self._boards.get((scope, metric))
+        if board is None:
+            users = self._log.state.get(scope)
+            if not users:
+                return None
+            board = self._boards[(scope, metric)] = RankedIndex.from_sorted(
+                sorted(sort_key(metric, email, totals) for email, totals in users.items())
+            )
+        return board
+
+    def _apply(self, state, record):
+        email = record['email']
+        if record.get('name'):
+            state.setdefault(NAMES, {})[email] = record['name']
+        for scope in record_scopes(record['domain'], record['difficulty']):
+            boards = [(metric, self._boards[(scope, metric)]) for metric in METRICS if (scope, metric) in self._boards]
+            totals = state.setdefault(scope, {}).get(email)
+            if totals is None:
+                totals = state[scope][email] = [0, 0, 0]
+            else:
+                for metric, board in boards:
+                    board.remove(sort_key(metric, email, totals))
+            totals[0] += record['credits']
+            totals[1] += record['score']
+            totals[2] += 1
+            for metric, board in boards:
+                board.insert(sort_key(metric, email, totals))
+
+    def record_many(self, interviews):
+        """Count completed interviews given as (email, full name, domain, difficulty, credits, score)"""
+        self._log.append_many([
+            {'email': email, 'name': name, 'domain': domain, 'difficulty': difficulty, 'credits': credits, 'score': score}
+            for email, name, domain, difficulty, credits, score in interviews
+        ])
+
+    def rebuild(self, interviews, names):
+        """Replace all totals with ones computed from (email, interview) pairs.
+
+        `names` maps emails to full names; only those of ranked users are kept.
+
+        Interviews recorded while this runs may be missed; meant for the
+        rebuild-leaderboard command, not for request handling.
+        """
+        state = {}
+        for email, interview in interviews:
+            for scope in record_scopes(interview.get('domain'), interview.get('difficulty')):
+                totals = state.setdefault(scope, {}).setdefault(email, [0, 0, 0])
+                totals[0] += interview.get('creditsEarned', 0)
+                totals[1] += interview.get('score', 0)
+                totals[2] += 1
+        state[NAMES] = {email: names[email] for email in state.get(GLOBAL_SCOPE, {}) if names.get(email)}
+        self._log.replace(state)
+        return sum(totals[2] for totals in state.get(GLOBAL_SCOPE, {}).values())
+
+    def _entry(self, rank, email, totals):
+        credits, score_total, count = totals
+        return {
+            'rank': rank + 1,
+            'name': self._log.state.get(NAMES, {}).get(email),
+            'credits': credits,
+            'accuracy': round(score_total / count, 1),
+            'interviews': count,
+        }
+
+    def page(self, metric, scope, offset, limit):
+        """Return (total ranked, entries) for ranks offset+1 .. offset+limit"""
+        self._log.refresh()
+        with self._log.lock:
+            board = self._board(scope, metric)
+            if board is None:
+                return 0, []
+            users = self._log.state[scope]
+            keys = board.page(offset, limit)
+            return len(board), [
+                self._entry(offset + i, key[-1], users[key[-1]]) for i, key in enumerate(keys)
+            ]
+
+    def position(self, metric, scope, email):
+        """Return (total ranked, entry) for one user; entry is None if unranked.
+
+        Unlike page entries, the entry includes the user's email.
+        """
+        self._log.refresh()
+        with self._log.lock:
+            board = self._board(scope, metric)
+            if board is None:
+                return 0, None
+            totals = self._log.state[scope].get(email)
+            if totals is None:
+                return len(board), None
+            entry = self._entry(board.rank(sort_key(metric, email, totals)), email, totals)
+            entry['email'] = email
+            return len(board), entry
@@ -0,0 +1,140 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_local = threading.local()
+
+
+@contextmanager
+def io_timer():
+    """Count the time spent inside the block as file I/O for this thread.
+
+    Nested timers only count once, so a helper that times its own reads
+    and writes can be called from another timed block.
+    """
+    if getattr(_local, 'io_depth', 0):
+        yield
+        return
+    _local.io_depth = 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _local.io_depth = 0
+        _local.io_seconds = getattr(_local, 'io_seconds', 0.0) + time.perf_counter() - start
+
+
+def take_io_seconds():
+    """Return and reset the I/O time this thread has accumulated"""
+    seconds = getattr(_local, 'io_seconds', 0.0)
+    _local.io_seconds = 0.0
+    return seconds
+
+
+class _Shard:
+    __slots__ = ('lock', 'histograms', 'counters')
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # name -> {labels: [bucket counts..., +Inf count, sum]}
+        self.histograms = {}
+        # name -> {labels: value}
+        self.counters = {}
+
+
+class Metrics:
+    """Counters and fixed-bucket histograms, rendered in Prometheus text format.
+
+    Updates go to one of `shards` stripes picked by thread id, each with its
+    own lock, so concurrent requests rarely wait on each other. A histogram
+    series is a fixed array of bucket counts, so memory depends only on the
+    number of label combinations (routes x methods), never on traffic.
+    Scrapes add the stripes together.
+    """
+
+    def __init__(self, shards=16):
+        self._shards = tuple(_Shard() for _ in range(shards))
+        self._meta = {}
+
+    def _shard(self):
+        return self._shards[threading.get_ident() % len(self._shards)]
+
+    def counter(self, name, help_text):
+        self._meta[name] = ('counter', help_text, None)
+
+    def histogram(self, name, help_text, buckets=LATENCY_BUCKETS):
+        self._meta[name] = ('histogram', help_text, tuple(buckets))
+
+    def inc(self, name, labels, value=1):
+        """Add to a counter; `labels` is a tuple of (name, value) pairs"""
+        shard = self._shard()
+        with shard.lock:
+            series = shard.counters.setdefault(name, {})
+            series[labels] = series.get(labels, 0) + value
+
+    def observe(self, name, labels, value):
+        buckets = self._meta[name][2]
+        shard = self._shard()
+        with shard.lock:
+            series = shard.histograms.setdefault(name, {})
+            counts = series.get(labels)
+            if counts is None:
+                counts = series[labels] = [0] * (len(buckets) + 2)
+            counts[bisect.bisect_left(buckets, value)] += 1
+            counts[-1] += value
+
+    def _merged(self):
+        counters = {}
+        histograms = {}
+        for shard in self._shards:
+            with shard.lock:
+                for name, series in shard.counters.items():
+                    merged = counters.setdefault(name, {})
+                    for labels, value in series.items():
+                        merged[labels] = merged.get(labels, 0) + value
+                for name, series in shard.histograms.items():
+                    merged = histograms.setdefault(name, {})
+                    for labels, counts in series.items():
+                        total = merged.setdefault(labels, [0] * len(counts))
+                        for i, count in enumerate(counts):
+                            total[i] += count
+        return counters, histograms
+
+    def render(self):
+        """All series in the Prometheus text exposition format"""
+        counters, histograms = self._merged()
+        lines = []
+        for name, (kind, help_text, buckets) in self._meta.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            if kind == 'counter':
+                for labels, value in sorted(counters.get(name, {}).items()):
+                    lines.append(f'{name}{_labels(labels)} {_number(value)}')
+                continue
+            for labels, counts in sorted(histograms.get(name, {}).items()):
+                cumulative = 0
+                for bound, count in zip(buckets + (float('inf'),), counts):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else _number(bound)
+                    lines.append(f'{name}_bucket{_labels(labels + (("le", le),))} {cumulative}')
+                lines.append(f'{name}_sum{_labels(labels)} {_number(counts[-1])}')
+                lines.append(f'{name}_count{_labels(labels)} {cumulative}')
+        return '\n'.join(lines) + '\n'
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    escaped = (
+        (key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for key, value in labels
+    )
+    return '{' + ','.join(f'{key}="{value}"' for key, value in escaped) + '}'
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
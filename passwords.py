@@ -0,0 +1,71 @@
+import hashlib
+import hmac
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class HasherBusy(Exception):
+    """Raised when too many hashing jobs are already running or queued"""
+
+
+class PasswordHasher:
+    """Salted scrypt password hashing on a bounded worker pool.
+
+    Hashes are stored as 'scrypt$n$r$p$salt$hash'. Plain hex SHA-256 hashes
+    from before are still accepted by `verify_and_upgrade`, which returns a
+    replacement hash whenever the stored one is legacy or uses other cost
+    parameters.
+
+    Hashing is deliberately slow, so it runs on `workers` threads (hashlib
+    releases the GIL while it works) with at most `max_queue` jobs waiting.
+    Past that, HasherBusy is raised instead of piling up request threads.
+    """
+
+    def __init__(self, n=2 ** 14, r=8, p=1, workers=4, max_queue=32):
+        self.n = n
+        self.r = r
+        self.p = p
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hasher')
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise HasherBusy()
+        try:
+            future = self._pool.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result()
+
+    def _scrypt(self, password, salt, n, r, p):
+        # scrypt needs about 128 * r * (n + p) bytes; leave headroom over it
+        return hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p, maxmem=256 * r * (n + p))
+
+    def _hash(self, password):
+        salt = os.urandom(16)
+        digest = self._scrypt(password, salt, self.n, self.r, self.p)
+        return f'scrypt${self.n}${self.r}${self.p}${salt.hex()}${digest.hex()}'
+
+    def _verify_and_upgrade(self, password, stored):
+        if stored.startswith('scrypt$'):
+            _, n, r, p, salt, digest = stored.split('$')
+            n, r, p = int(n), int(r), int(p)
+            ok = hmac.compare_digest(self._scrypt(password, bytes.fromhex(salt), n, r, p).hex(), digest)
+            outdated = (n, r, p) != (self.n, self.r, self.p)
+        else:
+            # Legacy unsalted SHA-256
+            ok = hmac.compare_digest(hashlib.sha256(password.encode()).hexdigest(), stored)
+            outdated = True
+        if ok and outdated:
+            return True, self._hash(password)
+        return ok, None
+
+    def hash(self, password):
+        return self._run(self._hash, password)
+
+    def verify_and_upgrade(self, password, stored):
+        """Check a password; returns (ok, new hash to store or None)"""
+        return self._run(self._verify_and_upgrade, password, stored or '')
@@ -0,0 +1,435 @@
+import bisect
+import hashlib
+import itertools
+import json
+import logging
+import os
+import random
+import threading
+import time
+
+from grading import QuestionMatcher
+from metrics import io_timer
+from question_pack import LazyList, LazyMatchers, dedupe_pool, open_packed
+
+log = logging.getLogger(__name__)
+
+
+# Fields that give the answer away; left out of papers graded server-side
+ANSWER_FIELDS = ('correct_answer', 'keywords')
+
+# Rejection sampling is used while at least 1/UNSEEN_REJECTION_LIMIT of a
+# pool is unseen, so each pick costs at most that many draws on average
+UNSEEN_REJECTION_LIMIT = 4
+
+
+class QuestionFragment:
+    """A question pre-serialized to JSON bytes at bank-load time.
+
+    `head` is the question without its options and without the closing
+    brace, and `public_head` is the same without the answer fields. For MCQs
+    each option is pre-serialized separately so a response only has to join
+    them in the paper's order. `matcher` is the question's compiled grader.
+    """
+
+    __slots__ = ('head', 'public_head', 'options', 'is_mcq', 'matcher')
+
+    def __init__(self, question, matcher):
+        options = question.get('options')
+        self.is_mcq = question.get('type') == 'mcq'
+        self.matcher = matcher
+        if self.is_mcq and options:
+            static = {key: value for key, value in question.items() if key != 'options'}
+            self.options = tuple(json.dumps(option).encode() for option in options)
+        else:
+            static = question
+            self.options = None
+        self.head = self._head(static)
+        self.public_head = self._head(
+            {key: value for key, value in static.items() if key not in ANSWER_FIELDS}
+        )
+
+    def _head(self, static):
+        head = json.dumps(static).encode()[:-1]
+        if self.options is not None:
+            head += b', "options": [' if static else b'"options": ['
+        return head
+
+    def render(self, order=None, strip_answers=False):
+        head = self.public_head if strip_answers else self.head
+        if self.options is None:
+            return head + b'}'
+        return head + b', '.join(self.options[i] for i in order) + b']}'
+
+
+class QuestionBank:
+    """Process-wide, pre-indexed copy of the question bank.
+
+    The JSON file is parsed once and kept indexed by (domain, difficulty).
+    It is only re-read when the file's mtime or size changes, and the file
+    is stat()ed at most once every `check_interval` seconds. Answer matchers
+    for server-side grading and pre-serialized response fragments are built
+    once per load.
+
+    Repeated questions (same normalized text, type and options) are dropped
+    from each domain/difficulty as the bank is built, so a paper drawn from
+    distinct positions never repeats a question. Every question is indexed
+    by its content hash.
+
+    If `packed_path` names a bank compiled by `question_pack.compile_questions`
+    from the current JSON file, it is mmapped instead: nothing is parsed up
+    front, the pages are shared by every worker process, and a question is
+    only decoded (and its fragment and matcher built) the first time it is
+    drawn.
+    """
+
+    def __init__(self, path, check_interval=1.0, packed_path=None):
+        self.path = path
+        self.packed_path = packed_path
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._signature = None
+        # (questions, matchers, fragments, content hash index, question ids),
+        # swapped in as one reference so readers never see a mix of two loads
+        self._tables = ({}, {}, {}, {}, {})
+        # Bumped on every load, so derived indexes can tell they are stale
+        self.generation = 0
+        self._last_check = 0.0
+
+    def _file_signature(self):
+        signature = []
+        for path in (self.path, self.packed_path):
+            try:
+                stat = os.stat(path) if path else None
+            except FileNotFoundError:
+                stat = None
+            signature.append(stat and (stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _build_index(self, data):
+        index = {}
+        matchers = {}
+        fragments = {}
+        by_hash = {}
+        ids = {}
+        dropped = 0
+        for domain, difficulties in data.items():
+            for difficulty, questions in difficulties.items():
+                unique, hashes = dedupe_pool(questions)
+                dropped += len(questions) - len(unique)
+                questions = unique
+                _index_hashes(by_hash, domain, difficulty, hashes)
+                compiled = [QuestionMatcher(question) for question in questions]
+                index[(domain, difficulty)] = tuple(questions)
+                ids[(domain, difficulty)] = tuple(question.get('id') for question in questions)
+                matchers[(domain, difficulty)] = {matcher.question_id: matcher for matcher in compiled}
+                fragments[(domain, difficulty)] = tuple(
+                    QuestionFragment(question, matcher) for question, matcher in zip(questions, compiled)
+                )
+        if dropped:
+            log.warning('Dropped duplicate questions', extra={'path': self.path, 'dropped': dropped})
+        return index, matchers, fragments, by_hash, ids
+
+    def _packed_index(self, pools):
+        index = {}
+        matchers = {}
+        fragments = {}
+        by_hash = {}
+        pool_ids = {}
+        for key, (ids, hashes, pool) in pools.items():
+            lazy = LazyList(len(pool), lambda i, pool=pool: _fragment(pool[i]))
+            index[key] = pool
+            matchers[key] = LazyMatchers(ids, lazy)
+            fragments[key] = lazy
+            _index_hashes(by_hash, *key, hashes)
+            pool_ids[key] = tuple(ids)
+        return index, matchers, fragments, by_hash, pool_ids
+
+    def _load(self):
+        pools = open_packed(self.packed_path, self.path) if self.packed_path else None
+        if pools is not None:
+            return self._packed_index(pools)
+        if not os.path.exists(self.path):
+            return ({}, {}, {}, {}, {})
+        with io_timer(), open(self.path, 'r') as f:
+            data = json.load(f)
+        return self._build_index(data)
+
+    def refresh(self, force=False):
+        """Reload the bank if the underlying file has changed"""
+        now = time.monotonic()
+        if not force and now - self._last_check < self.check_interval:
+            return
+        self._last_check = now
+
+        signature = self._file_signature()
+        if signature == self._signature:
+            return
+
+        with self._lock:
+            # Another thread may have reloaded while we waited for the lock
+            signature = self._file_signature()
+            if signature == self._signature:
+                return
+            self._tables = self._load()
+            self.generation += 1
+            self._signature = signature
+
+    def exists(self):
+        self.refresh()
+        return self._signature is not None and any(self._signature)
+
+    def get(self, domain, difficulty):
+        """Return the questions for a domain/difficulty as a sequence, or None"""
+        self.refresh()
+        return self._tables[0].get((domain, difficulty))
+
+    def matchers(self, domain, difficulty):
+        """Return {question id: QuestionMatcher} for a domain/difficulty, or None"""
+        self.refresh()
+        return self._tables[1].get((domain, difficulty))
+
+    def pool_ids(self, domain):
+        """Return {difficulty: question ids in pool order} for a domain"""
+        self.refresh()
+        return {
+            difficulty: ids
+            for (pool_domain, difficulty), ids in self._tables[4].items()
+            if pool_domain == domain
+        }
+
+    def find(self, content_hash):
+        """Return (domain, difficulty, question) for a content hash, or None.
+
+        A question shared by several domains/difficulties is found in the
+        first one the bank lists it under.
+        """
+        self.refresh()
+        location = self._tables[3].get(content_hash)
+        if location is None:
+            return None
+        domain, difficulty, position = location
+        return domain, difficulty, self._tables[0][(domain, difficulty)][position]
+
+    def render_paper(self, domain, difficulty, k, rng, strip_answers=False, seen=None):
+        """Sample a paper and serialize it from the cached fragments.
+
+        Draws exactly what `sample_questions` would for the same rng. Returns
+        (questions as JSON-encoded bytes each, mcq count, text count, answer
+        key, pool positions), where the answer key is the paper's matchers in
+        order, or None for an unknown domain/difficulty. With `strip_answers`
+        the JSON omits ANSWER_FIELDS. With a `seen` bitmap, questions whose
+        bit is clear are drawn first (see `sample_unseen_indices`).
+        """
+        self.refresh()
+        questions, _, fragments, _, _ = self._tables
+        pool = questions.get((domain, difficulty))
+        if pool is None:
+            return None
+        fragments = fragments[(domain, difficulty)]
+        picks = sample_paper(pool, k, rng, seen)
+        paper = _render([(fragments[index], order) for index, order in picks], strip_answers)
+        return paper + ([index for index, _ in picks],)
+
+    def render_items(self, domain, items, rng, strip_answers=False):
+        """Serialize chosen questions of a domain, shuffling MCQ options with `rng`.
+
+        `items` are (difficulty, pool position) pairs, possibly from several
+        difficulties. Returns (questions as JSON-encoded bytes each, mcq
+        count, text count, answer key) like `render_paper`.
+        """
+        fragments = self._tables[2]
+        chosen = []
+        for difficulty, index in items:
+            fragment = fragments[(domain, difficulty)][index]
+            order = None
+            if fragment.options is not None:
+                order = list(range(len(fragment.options)))
+                rng.shuffle(order)
+            chosen.append((fragment, order))
+        return _render(chosen, strip_answers)
+
+
+def _render(chosen, strip_answers):
+    parts = []
+    answer_key = []
+    mcq_count = 0
+    for fragment, order in chosen:
+        mcq_count += fragment.is_mcq
+        parts.append(fragment.render(order, strip_answers))
+        answer_key.append(fragment.matcher)
+    return tuple(parts), mcq_count, len(parts) - mcq_count, tuple(answer_key)
+
+
+def _index_hashes(by_hash, domain, difficulty, hashes):
+    for position, digest in enumerate(hashes):
+        by_hash.setdefault(digest, (domain, difficulty, position))
+
+
+def _fragment(question):
+    return QuestionFragment(question, QuestionMatcher(question))
+
+
+def sample_indices(n, k, rng):
+    """Draw k distinct indices from range(n) in O(k) time and memory.
+
+    This is a partial Fisher-Yates shuffle over a virtual index array: only
+    the positions that have been swapped are stored, so the pool is never
+    copied or fully shuffled.
+    """
+    k = min(k, n)
+    swapped = {}
+    selected = []
+    for i in range(k):
+        j = rng.randrange(i, n)
+        selected.append(swapped.get(j, j))
+        swapped[j] = swapped.get(i, i)
+    return selected
+
+
+# Set bits are counted per block of this many bytes, then per 64-bit word
+# within the blocks a lookup lands in
+_SELECT_BLOCK = 64
+
+
+def _select_bits(data, ranks):
+    """Positions of the set bits with the given 0-based ranks in little-endian `data`.
+
+    Costs one popcount per block plus O(log) steps per rank, so the bits
+    themselves are never enumerated.
+    """
+    block_ends = list(itertools.accumulate(
+        int.from_bytes(data[start:start + _SELECT_BLOCK], 'little').bit_count()
+        for start in range(0, len(data), _SELECT_BLOCK)
+    ))
+    blocks = {}
+    positions = []
+    for rank in ranks:
+        block = bisect.bisect_right(block_ends, rank)
+        if block:
+            rank -= block_ends[block - 1]
+        if block not in blocks:
+            chunk = data[block * _SELECT_BLOCK:(block + 1) * _SELECT_BLOCK]
+            words = [int.from_bytes(chunk[start:start + 8], 'little') for start in range(0, len(chunk), 8)]
+            blocks[block] = words, list(itertools.accumulate(word.bit_count() for word in words))
+        words, word_ends = blocks[block]
+        index = bisect.bisect_right(word_ends, rank)
+        if index:
+            rank -= word_ends[index - 1]
+        word = words[index]
+        bit = 0
+        for width in (32, 16, 8, 4, 2, 1):
+            count = (word >> bit & ((1 << width) - 1)).bit_count()
+            if rank >= count:
+                rank -= count
+                bit += width
+        positions.append((block * _SELECT_BLOCK + index * 8) * 8 + bit)
+    return positions
+
+
+def sample_unseen_indices(n, k, seen, rng):
+    """Draw k distinct indices from range(n), preferring ones not set in `seen`.
+
+    `seen` is a bitmap with bit i set once position i has been served. While
+    at least 1/UNSEEN_REJECTION_LIMIT of the pool (and at least k positions)
+    is unseen, positions are drawn from a partial Fisher-Yates shuffle and
+    seen ones are skipped, which takes O(k) expected draws. Otherwise k
+    ranks are sampled among the unseen positions and looked up in the
+    bitmap's bytes, and any shortfall is sampled from the seen ones the
+    same way.
+    """
+    k = min(k, n)
+    full = (1 << n) - 1
+    seen &= full
+    size = (n + 7) // 8
+    seen_bytes = seen.to_bytes(size, 'little')
+    seen_count = seen.bit_count()
+    unseen_count = n - seen_count
+
+    if unseen_count >= k and unseen_count * UNSEEN_REJECTION_LIMIT >= n:
+        swapped = {}
+        selected = []
+        i = 0
+        while len(selected) < k:
+            j = rng.randrange(i, n)
+            index = swapped.get(j, j)
+            swapped[j] = swapped.get(i, i)
+            i += 1
+            if not seen_bytes[index >> 3] >> (index & 7) & 1:
+                selected.append(index)
+        return selected
+
+    unseen_bytes = (~seen & full).to_bytes(size, 'little')
+    selected = _select_bits(unseen_bytes, sample_indices(unseen_count, k, rng))
+    if len(selected) < k:
+        selected += _select_bits(seen_bytes, sample_indices(seen_count, k - len(selected), rng))
+    return selected
+
+
+def mark_seen(seen, positions, n):
+    """Set the bits for `positions`; once all n are set, start a new round.
+
+    The new round starts from just this paper's positions, so the next
+    papers cycle through everything else first.
+    """
+    marked = 0
+    for index in positions:
+        marked |= 1 << index
+    seen |= marked
+    if seen & ((1 << n) - 1) == (1 << n) - 1:
+        return marked
+    return seen
+
+
+def sample_paper(pool, k, rng, seen=None):
+    """Draw k questions from a pool as (index, option order) pairs.
+
+    The option order is a permutation of the MCQ's options (None for other
+    question types), so nothing in the shared pool is ever mutated. With a
+    `seen` bitmap, unseen questions are drawn first.
+    """
+    picks = []
+    if seen is None:
+        indices = sample_indices(len(pool), k, rng)
+    else:
+        indices = sample_unseen_indices(len(pool), k, seen, rng)
+    for index in indices:
+        question = pool[index]
+        options = question.get('options')
+        order = None
+        if question.get('type') == 'mcq' and options:
+            order = list(range(len(options)))
+            rng.shuffle(order)
+        picks.append((index, order))
+    return picks
+
+
+def sample_questions(pool, k, rng):
+    """Draw k questions from a shared pool with per-request option orders.
+
+    MCQ questions are returned as shallow copies whose options list has been
+    permuted, so the dicts held by the question bank are never mutated.
+    """
+    selected = []
+    for index, order in sample_paper(pool, k, rng):
+        question = pool[index]
+        if order is not None:
+            options = question['options']
+            question = dict(question)
+            question['options'] = [options[i] for i in order]
+        selected.append(question)
+    return selected
+
+
+def new_paper_seed(user_key):
+    """Seed for one paper, mixing the requesting user with fresh entropy.
+
+    Returned as a hex string so it survives a round trip through JSON in the
+    browser; `paper_rng(seed)` rebuilds the exact same generator.
+    """
+    digest = hashlib.sha256(user_key.encode() + os.urandom(16)).digest()
+    return digest[:8].hex()
+
+
+def paper_rng(seed):
+    return random.Random(int(seed, 16))
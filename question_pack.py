@@ -0,0 +1,221 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+from collections.abc import Mapping, Sequence
+
+from filestore import atomic_write, file_lock
+
+# Layout of a compiled question bank:
+#
+#   header     magic, format version, directory length
+#   directory  compact JSON: the source file's signature and, per
+#              domain/difficulty, its question count, question ids, content
+#              hashes and the offset of its index
+#   indexes    per domain/difficulty, one fixed-width (offset, length) entry
+#              per question
+#   records    each question as compact JSON
+#
+# Index offsets are relative to the start of the indexes and record offsets
+# to the start of the records, so a reader can mmap the file and decode a
+# single question with one slice.
+MAGIC = b'QBNK'
+VERSION = 2
+HEADER = struct.Struct('<4sIQ')
+INDEX_ENTRY = struct.Struct('<QI')
+
+
+def source_signature(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def content_hash(question):
+    """Hash of a question's normalized text, type and options.
+
+    Case, surrounding and repeated whitespace, and option order are ignored,
+    so copies of a question that only differ in their id hash the same.
+    """
+    def normalize(value):
+        return ' '.join(str(value).lower().split())
+
+    text = question.get('text') or question.get('question') or ''
+    options = sorted(normalize(option) for option in question.get('options') or ())
+    key = json.dumps([normalize(question.get('type', '')), normalize(text), options])
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def dedupe_pool(questions):
+    """Drop repeated questions from a pool, keeping the first of each.
+
+    Returns (unique questions, their content hashes).
+    """
+    unique = []
+    hashes = []
+    seen = set()
+    for question in questions:
+        digest = content_hash(question)
+        if digest not in seen:
+            seen.add(digest)
+            unique.append(question)
+            hashes.append(digest)
+    return unique, hashes
+
+
+def dedupe_bank(data):
+    """Dedupe every domain/difficulty; returns (deduped bank, questions dropped)"""
+    deduped = {}
+    dropped = 0
+    for domain, difficulties in data.items():
+        deduped[domain] = {}
+        for difficulty, questions in difficulties.items():
+            unique, _ = dedupe_pool(questions)
+            deduped[domain][difficulty] = unique
+            dropped += len(questions) - len(unique)
+    return deduped, dropped
+
+
+def compile_questions(json_path, packed_path):
+    """Compile questions.json into the packed format.
+
+    Duplicate questions are dropped from each domain/difficulty on the way.
+    Returns (questions written, duplicates dropped).
+    """
+    with file_lock(json_path):
+        signature = source_signature(json_path)
+        with open(json_path, 'r') as f:
+            data = json.load(f)
+
+    pools = []
+    records = []
+    dropped = 0
+    for domain, difficulties in data.items():
+        for difficulty, questions in difficulties.items():
+            unique, hashes = dedupe_pool(questions)
+            dropped += len(questions) - len(unique)
+            questions = unique
+            pools.append({
+                'domain': domain,
+                'difficulty': difficulty,
+                'count': len(questions),
+                'ids': [question.get('id') for question in questions],
+                'hashes': hashes,
+            })
+            records.append([json.dumps(question, separators=(',', ':')).encode() for question in questions])
+
+    index_offset = 0
+    for pool in pools:
+        pool['index'] = index_offset
+        index_offset += pool['count'] * INDEX_ENTRY.size
+    directory = json.dumps({'source': signature, 'pools': pools}, separators=(',', ':')).encode()
+
+    body = [HEADER.pack(MAGIC, VERSION, len(directory)), directory]
+    record_offset = 0
+    for pool_records in records:
+        for record in pool_records:
+            body.append(INDEX_ENTRY.pack(record_offset, len(record)))
+            record_offset += len(record)
+    for pool_records in records:
+        body.extend(pool_records)
+
+    atomic_write(packed_path, b''.join(body))
+    return sum(pool['count'] for pool in pools), dropped
+
+
+class PackedPool(Sequence):
+    """The questions of one domain/difficulty, decoded on first access"""
+
+    def __init__(self, buffer, index, records, count):
+        self._buffer = buffer
+        self._index = index
+        self._records = records
+        self._decoded = [None] * count
+
+    def __len__(self):
+        return len(self._decoded)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        question = self._decoded[i]
+        if question is None:
+            if i < 0:
+                i += len(self)
+            offset, length = INDEX_ENTRY.unpack_from(self._buffer, self._index + i * INDEX_ENTRY.size)
+            offset += self._records
+            question = json.loads(self._buffer[offset:offset + length])
+            self._decoded[i] = question
+        return question
+
+
+class LazyList(Sequence):
+    """Builds `make(i)` for each position the first time it is read"""
+
+    def __init__(self, count, make):
+        self._make = make
+        self._items = [None] * count
+
+    def __len__(self):
+        return len(self._items)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        item = self._items[i]
+        if item is None:
+            item = self._items[i] = self._make(i % len(self._items))
+        return item
+
+
+class LazyMatchers(Mapping):
+    """{question id: matcher} over lazily built fragments"""
+
+    def __init__(self, ids, fragments):
+        self._positions = {question_id: i for i, question_id in enumerate(ids)}
+        self._fragments = fragments
+
+    def __getitem__(self, question_id):
+        return self._fragments[self._positions[question_id]].matcher
+
+    def __iter__(self):
+        return iter(self._positions)
+
+    def __len__(self):
+        return len(self._positions)
+
+
+def open_packed(packed_path, json_path):
+    """mmap a compiled bank; returns {(domain, difficulty): (ids, hashes, PackedPool)}.
+
+    Returns None if there is no compiled bank, or if questions.json no longer
+    has the mtime and size it was compiled from, so an edited JSON file is
+    never shadowed by an old compile.
+    """
+    try:
+        with open(packed_path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+        return None
+    magic, version, directory_length = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC or version != VERSION:
+        buffer.close()
+        return None
+    directory = json.loads(buffer[HEADER.size:HEADER.size + directory_length])
+    current = source_signature(json_path)
+    if current is not None and current != directory['source']:
+        buffer.close()
+        return None
+
+    # The pools keep the mapping open; it is unmapped once they are all gone
+    indexes = HEADER.size + directory_length
+    records = indexes + sum(pool['count'] for pool in directory['pools']) * INDEX_ENTRY.size
+    return {
+        (pool['domain'], pool['difficulty']): (
+            pool['ids'], pool['hashes'], PackedPool(buffer, indexes + pool['index'], records, pool['count'])
+        )
+        for pool in directory['pools']
+    }
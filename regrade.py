@@ -0,0 +1,108 @@
+import itertools
+import multiprocessing
+import os
+
+from grading import grade_submission
+from question_bank import QuestionBank
+from storage import user_record_stats
+
+# Set in each worker process by _init_worker
+_bank = None
+
+
+def _init_worker(questions_file, packed_file):
+    global _bank
+    _bank = QuestionBank(questions_file, check_interval=float('inf'), packed_path=packed_file)
+    _bank.refresh(force=True)
+
+
+def _grade_record(record):
+    """Worker: regrade one stored interview, or return None if it can't be"""
+    key, email, interview = record
+    answers = interview.get('answers')
+    domain, difficulty = interview.get('domain'), interview.get('difficulty')
+    if not answers or not isinstance(answers, list) or not isinstance(domain, str) or not isinstance(difficulty, str):
+        return key, email, None
+    matchers = _bank.matchers(domain, difficulty)
+    if matchers is None:
+        return key, email, None
+
+    pairs = []
+    for item in answers:
+        if not isinstance(item, dict):
+            # Stored before answers were validated; keep the original score
+            return key, email, None
+        question_id = item.get('id')
+        if isinstance(question_id, str) and question_id.isdigit():
+            question_id = int(question_id)
+        try:
+            matcher = matchers.get(question_id)
+        except TypeError:
+            # Unhashable id
+            return key, email, None
+        if matcher is None:
+            # Question no longer in the bank; keep the original score
+            return key, email, None
+        pairs.append((matcher, item.get('answer')))
+
+    graded = grade_submission(pairs)
+    updated = dict(interview)
+    updated['score'] = graded['accuracy']
+    updated['correctAnswers'] = graded['correctAnswers']
+    updated['totalQuestions'] = graded['totalQuestions']
+    updated['creditsEarned'] = graded['creditsEarned']
+    if updated == interview:
+        return key, email, None
+    return key, email, updated
+
+
+def regrade_interviews(storage, questions_file, packed_file=None, workers=None, window=10000, chunksize=256):
+    """Re-score every stored interview against the current question bank.
+
+    Records are streamed from storage in windows of `window` and graded
+    across a process pool, so memory stays flat however long the history is.
+    With a compiled `packed_file`, workers share its mapped pages instead of
+    each parsing the JSON bank. Only interviews recorded with their answers
+    can be regraded. Changed scores are written back to the history and to
+    the matching progress entries, then the per-user aggregates and the
+    stats on each affected user's record are rebuilt. The leaderboard is
+    not touched; rebuild it afterwards.
+
+    Returns (interviews seen, interviews rescored).
+    """
+    seen = 0
+    rescored = 0
+    emails = set()
+    records = storage.iter_interviews()
+
+    with multiprocessing.Pool(workers or os.cpu_count(), _init_worker, (questions_file, packed_file)) as pool:
+        while True:
+            batch = list(itertools.islice(records, window))
+            if not batch:
+                break
+            seen += len(batch)
+            updates = [
+                (key, email, updated)
+                for key, email, updated in pool.imap_unordered(_grade_record, batch, chunksize)
+                if updated is not None
+            ]
+            if updates:
+                storage.update_interviews([(key, updated) for key, _email, updated in updates])
+                storage.update_progress([
+                    (email, updated['domain'], updated.get('completedAt'), updated['score'])
+                    for _key, email, updated in updates
+                ])
+                emails.update(email for _key, email, _updated in updates)
+                rescored += len(updates)
+
+    if rescored:
+        storage.verify_user_stats(fix=True)
+        users = {}
+        for email in emails:
+            user = storage.get_user(email)
+            if user is not None:
+                user.update(user_record_stats(storage.get_user_stats(email)))
+                users[email] = user
+        storage.save_users(users)
+        storage.compact()
+    return seen, rescored
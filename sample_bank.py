@@ -0,0 +1,1698 @@
+import copy
+
+# The built-in sample bank, written to questions.json on a fresh install.
+# Every pool holds at least as many distinct questions as a default paper
+# draws (45 easy, 30 medium, 15 hard), so papers are never cut short.
+
+
+def mcq(question, options, answer, keywords):
+    """A multiple choice question; `answer` is one of `options`"""
+    return {'question': question, 'type': 'mcq', 'options': options, 'correct_answer': answer, 'keywords': keywords}
+
+
+def text(question, answer, keywords):
+    """A free-text question graded on its keywords"""
+    return {'question': question, 'type': 'text', 'options': [], 'correct_answer': answer, 'keywords': keywords}
+
+
+POOLS = {
+    'data-analytics': {
+        'easy': [
+            mcq('What is the primary purpose of data visualization?',
+                ['To make data look pretty', 'To communicate insights effectively', 'To reduce data size', 'To increase data accuracy'],
+                'To communicate insights effectively', ['communication', 'insights', 'visualization', 'presentation']),
+            mcq('Which tool is commonly used for data analysis?',
+                ['Microsoft Word', 'Excel', 'PowerPoint', 'Notepad'],
+                'Excel', ['spreadsheet', 'analysis', 'data', 'calculation']),
+            mcq('What does SQL stand for?',
+                ['Structured Query Language', 'Simple Query Language', 'Standard Query Language', 'System Query Language'],
+                'Structured Query Language', ['database', 'query', 'structured', 'language']),
+            text('Explain the importance of data cleaning in analytics.',
+                 'Data cleaning ensures accuracy and reliability of analysis results',
+                 ['accuracy', 'reliability', 'quality', 'preprocessing', 'validation']),
+            mcq('What is a pivot table used for?',
+                ['Creating charts', 'Summarizing and analyzing data', 'Writing formulas', 'Formatting cells'],
+                'Summarizing and analyzing data', ['summarize', 'analyze', 'pivot', 'data', 'table']),
+            mcq('Which measure is the sum of the values divided by their count?',
+                ['Median', 'Mode', 'Mean', 'Range'],
+                'Mean', ['mean', 'average', 'sum', 'count']),
+            mcq('Which value occurs most often in a data set?',
+                ['Mode', 'Median', 'Mean', 'Variance'],
+                'Mode', ['mode', 'frequency', 'most', 'common']),
+            mcq('What is the range of a data set?',
+                ['The most frequent value', 'The difference between the largest and smallest values', 'The middle value', 'The number of values'],
+                'The difference between the largest and smallest values', ['range', 'maximum', 'minimum', 'spread']),
+            mcq('Which chart is best for showing a trend over time?',
+                ['Pie chart', 'Line chart', 'Scatter plot', 'Treemap'],
+                'Line chart', ['line', 'trend', 'time', 'series']),
+            mcq('Which chart shows the parts of a whole?',
+                ['Pie chart', 'Histogram', 'Box plot', 'Line chart'],
+                'Pie chart', ['pie', 'proportion', 'parts', 'whole']),
+            mcq('What does a histogram show?',
+                ['The relationship between two variables', 'The distribution of a numeric variable', 'Changes over time', 'Hierarchical data'],
+                'The distribution of a numeric variable', ['histogram', 'distribution', 'bins', 'frequency']),
+            mcq('Which SQL clause filters rows?',
+                ['SELECT', 'WHERE', 'ORDER BY', 'FROM'],
+                'WHERE', ['where', 'filter', 'condition', 'rows']),
+            mcq('Which SQL clause sorts the result set?',
+                ['GROUP BY', 'ORDER BY', 'HAVING', 'LIMIT'],
+                'ORDER BY', ['order', 'sort', 'ascending', 'descending']),
+            mcq('Which SQL function counts rows?',
+                ['SUM()', 'COUNT()', 'AVG()', 'MAX()'],
+                'COUNT()', ['count', 'aggregate', 'rows', 'function']),
+            mcq('What is a CSV file?',
+                ['A compressed image', 'A plain text file of comma-separated values', 'A database server', 'A spreadsheet formula'],
+                'A plain text file of comma-separated values', ['csv', 'comma', 'text', 'tabular']),
+            mcq('What is a missing value usually called in a data set?',
+                ['Null', 'Zero', 'Outlier', 'Index'],
+                'Null', ['null', 'missing', 'empty', 'value']),
+            mcq('What is an outlier?',
+                ['A value far from the other observations', 'The average value', 'A column header', 'A duplicate row'],
+                'A value far from the other observations', ['outlier', 'extreme', 'anomaly', 'observation']),
+            mcq('Which type of data has categories without a natural order?',
+                ['Ordinal', 'Nominal', 'Interval', 'Ratio'],
+                'Nominal', ['nominal', 'categorical', 'unordered', 'labels']),
+            mcq('Which type of data has categories with a meaningful order?',
+                ['Nominal', 'Ordinal', 'Binary', 'Continuous'],
+                'Ordinal', ['ordinal', 'order', 'ranking', 'categorical']),
+            mcq('What is a dashboard?',
+                ['A visual display of key metrics in one place', 'A type of database', 'A programming language', 'A data cleaning step'],
+                'A visual display of key metrics in one place', ['dashboard', 'metrics', 'kpi', 'visual']),
+            mcq('What does KPI stand for?',
+                ['Key Performance Indicator', 'Known Process Input', 'Key Project Index', 'Kernel Performance Interface'],
+                'Key Performance Indicator', ['kpi', 'performance', 'indicator', 'metric']),
+            mcq('Which Excel function adds up a range of cells?',
+                ['COUNT', 'SUM', 'VLOOKUP', 'IF'],
+                'SUM', ['sum', 'excel', 'add', 'range']),
+            mcq('Which Excel function looks up a value in the first column of a table?',
+                ['VLOOKUP', 'CONCAT', 'ROUND', 'TODAY'],
+                'VLOOKUP', ['vlookup', 'lookup', 'table', 'excel']),
+            mcq('What is a primary key in a table?',
+                ['A column that uniquely identifies each row', 'The first column of any table', 'A password for the database', 'An encrypted value'],
+                'A column that uniquely identifies each row', ['primary', 'key', 'unique', 'identifier']),
+            mcq('Which Python library is widely used for data frames?',
+                ['pandas', 'requests', 'flask', 'pygame'],
+                'pandas', ['pandas', 'dataframe', 'python', 'library']),
+            mcq('What is descriptive analytics?',
+                ['Summarizing what has happened', 'Predicting what will happen', 'Recommending what to do', 'Collecting new data'],
+                'Summarizing what has happened', ['descriptive', 'summary', 'historical', 'past']),
+            mcq('What is predictive analytics?',
+                ['Forecasting future outcomes from data', 'Cleaning data', 'Storing data', 'Describing past events'],
+                'Forecasting future outcomes from data', ['predictive', 'forecast', 'future', 'model']),
+            mcq('Which chart is best for comparing values across categories?',
+                ['Bar chart', 'Line chart', 'Scatter plot', 'Area chart'],
+                'Bar chart', ['bar', 'compare', 'categories', 'chart']),
+            mcq('What does a scatter plot show?',
+                ['The relationship between two numeric variables', 'Parts of a whole', 'A single distribution', 'Geographic data'],
+                'The relationship between two numeric variables', ['scatter', 'relationship', 'variables', 'correlation']),
+            mcq('What is a sample in statistics?',
+                ['A subset of the population', 'The whole population', 'A single value', 'A chart type'],
+                'A subset of the population', ['sample', 'subset', 'population', 'selection']),
+            mcq('What is data aggregation?',
+                ['Combining data into summary values', 'Deleting data', 'Encrypting data', 'Copying data'],
+                'Combining data into summary values', ['aggregation', 'summary', 'group', 'combine']),
+            mcq('Which SQL keyword removes duplicate rows from a result?',
+                ['UNIQUE', 'DISTINCT', 'DELETE', 'DROP'],
+                'DISTINCT', ['distinct', 'duplicate', 'unique', 'sql']),
+            mcq('What is structured data?',
+                ['Data organized in rows and columns', 'Free-form text and images', 'Encrypted data', 'Data with no values'],
+                'Data organized in rows and columns', ['structured', 'rows', 'columns', 'tabular']),
+            mcq('Which of these is unstructured data?',
+                ['A customer email', 'A sales table', 'A stock price series', 'An inventory spreadsheet'],
+                'A customer email', ['unstructured', 'text', 'email', 'free-form']),
+            mcq('What is a data warehouse?',
+                ['A central store of integrated data for analysis', 'A physical storage room', 'A spreadsheet template', 'A backup drive'],
+                'A central store of integrated data for analysis', ['warehouse', 'central', 'integrated', 'analysis']),
+            mcq('What does ETL stand for?',
+                ['Extract, Transform, Load', 'Evaluate, Test, Launch', 'Export, Transfer, Link', 'Edit, Track, Log'],
+                'Extract, Transform, Load', ['etl', 'extract', 'transform', 'load']),
+            mcq('What is a percentage?',
+                ['A ratio expressed out of 100', 'A count of rows', 'A type of chart', 'A database table'],
+                'A ratio expressed out of 100', ['percentage', 'ratio', 'hundred', 'proportion']),
+            text('What is the difference between a population and a sample?',
+                 'A population is the whole group of interest; a sample is a subset used to draw conclusions about it',
+                 ['population', 'sample', 'subset', 'whole', 'group']),
+            text('Why do analysts visualize data before modelling it?',
+                 'Visualization reveals patterns, outliers and errors early, which guides cleaning and modelling',
+                 ['patterns', 'outliers', 'errors', 'explore', 'visualization']),
+            text('What is a data type? Give two examples.',
+                 'A data type defines the kind of value a field holds, such as integer, text or date',
+                 ['type', 'integer', 'text', 'date', 'value']),
+            text('Describe what a spreadsheet formula does.',
+                 'A formula calculates a value from other cells and updates automatically when they change',
+                 ['formula', 'calculate', 'cells', 'automatic', 'update']),
+            text('What is the purpose of sorting data?',
+                 'Sorting arranges records in order so the largest, smallest or most recent values are easy to find',
+                 ['sort', 'order', 'arrange', 'records', 'find']),
+            text('Explain what filtering a data set means.',
+                 'Filtering keeps only the rows that meet a condition and hides or removes the rest',
+                 ['filter', 'condition', 'rows', 'subset', 'criteria']),
+            text('What is a duplicate record and why remove it?',
+                 'A duplicate record repeats an existing entry; removing it avoids double counting and skewed results',
+                 ['duplicate', 'record', 'double', 'counting', 'accuracy']),
+            text('What does it mean to group data?',
+                 'Grouping collects rows that share a value so aggregates like sums or averages can be computed per group',
+                 ['group', 'aggregate', 'category', 'sum', 'average'])
+        ],
+        'medium': [
+            text('What is the difference between correlation and causation?',
+                 'Correlation shows relationship between variables, causation shows one variable causes another',
+                 ['correlation', 'causation', 'relationship', 'variables', 'cause', 'effect']),
+            mcq('Which statistical measure represents the middle value?',
+                ['Mean', 'Median', 'Mode', 'Standard Deviation'],
+                'Median', ['middle', 'median', 'central', 'tendency']),
+            mcq('Which measure describes how spread out values are around the mean?',
+                ['Median', 'Standard deviation', 'Mode', 'Sum'],
+                'Standard deviation', ['standard', 'deviation', 'spread', 'variance']),
+            mcq('Which SQL clause filters groups after aggregation?',
+                ['WHERE', 'HAVING', 'ORDER BY', 'SELECT'],
+                'HAVING', ['having', 'group', 'aggregate', 'filter']),
+            mcq('Which join returns only rows with matches in both tables?',
+                ['LEFT JOIN', 'INNER JOIN', 'FULL OUTER JOIN', 'CROSS JOIN'],
+                'INNER JOIN', ['inner', 'join', 'match', 'tables']),
+            mcq('Which join keeps every row of the left table?',
+                ['INNER JOIN', 'LEFT JOIN', 'RIGHT JOIN', 'SELF JOIN'],
+                'LEFT JOIN', ['left', 'join', 'null', 'rows']),
+            mcq('In a right-skewed distribution, how does the mean usually compare with the median?',
+                ['The mean is lower', 'The mean is higher', 'They are always equal', 'The mean is zero'],
+                'The mean is higher', ['skew', 'mean', 'median', 'tail']),
+            mcq('What does a box plot show?',
+                ['Median, quartiles and outliers', 'A trend over time', 'Parts of a whole', 'Geographic regions'],
+                'Median, quartiles and outliers', ['box', 'quartiles', 'median', 'outliers']),
+            mcq('What is the interquartile range?',
+                ['Q3 minus Q1', 'The maximum minus the minimum', 'The mean minus the median', 'The square of the standard deviation'],
+                'Q3 minus Q1', ['interquartile', 'quartile', 'spread', 'iqr']),
+            mcq('What is a z-score?',
+                ['The number of standard deviations a value is from the mean', 'The largest value', 'A correlation coefficient', 'A p-value'],
+                'The number of standard deviations a value is from the mean', ['z-score', 'standard', 'deviation', 'mean']),
+            mcq('What does a correlation coefficient of -0.9 indicate?',
+                ['A strong negative linear relationship', 'No relationship', 'A weak positive relationship', 'Causation'],
+                'A strong negative linear relationship', ['correlation', 'negative', 'strong', 'linear']),
+            mcq('What is A/B testing?',
+                ['Comparing two variants with a controlled experiment', 'Testing two databases', 'Grading two analysts', 'Sorting data twice'],
+                'Comparing two variants with a controlled experiment', ['experiment', 'variant', 'control', 'test']),
+            mcq('Which SQL feature computes a running total without collapsing rows?',
+                ['GROUP BY', 'Window functions', 'Subqueries in FROM', 'DISTINCT'],
+                'Window functions', ['window', 'over', 'running', 'partition']),
+            mcq('What is normalization in database design?',
+                ['Organizing tables to reduce redundancy', 'Scaling values to 0-1', 'Encrypting columns', 'Adding indexes'],
+                'Organizing tables to reduce redundancy', ['normalization', 'redundancy', 'tables', 'design']),
+            mcq('What is a cohort analysis?',
+                ['Tracking groups that share a starting event over time', 'Comparing two columns', 'Sorting customers by name', 'A type of chart'],
+                'Tracking groups that share a starting event over time', ['cohort', 'group', 'retention', 'time']),
+            mcq('Which sampling method divides the population into groups and samples each one?',
+                ['Stratified sampling', 'Convenience sampling', 'Snowball sampling', 'Quota-free sampling'],
+                'Stratified sampling', ['stratified', 'strata', 'sampling', 'groups']),
+            mcq('Which imputation replaces missing numbers without being pulled by outliers?',
+                ['Mean imputation', 'Median imputation', 'Maximum imputation', 'Zero imputation'],
+                'Median imputation', ['imputation', 'median', 'missing', 'robust']),
+            mcq('What is a star schema?',
+                ['A fact table surrounded by dimension tables', 'A single flat table', 'A graph database', 'A backup strategy'],
+                'A fact table surrounded by dimension tables', ['star', 'fact', 'dimension', 'schema']),
+            mcq('What is the purpose of a confidence interval?',
+                ['To give a range likely to contain the true parameter', 'To prove causation', 'To remove outliers', 'To sort data'],
+                'To give a range likely to contain the true parameter', ['confidence', 'interval', 'range', 'parameter']),
+            mcq('Which chart suits showing correlation between many pairs of variables?',
+                ['Heatmap of the correlation matrix', 'Pie chart', 'Single bar chart', 'Gauge chart'],
+                'Heatmap of the correlation matrix', ['heatmap', 'correlation', 'matrix', 'pairs']),
+            text('How would you handle missing values in a data set?',
+                 'Investigate why they are missing, then drop, impute with mean, median or a model, or flag them',
+                 ['missing', 'impute', 'drop', 'median', 'flag']),
+            text('Explain the difference between a LEFT JOIN and an INNER JOIN.',
+                 'An inner join keeps only matching rows, while a left join keeps all left rows and fills non-matches with nulls',
+                 ['inner', 'left', 'join', 'matching', 'null']),
+            text('What is data normalization when preparing features, and why is it used?',
+                 'Scaling features to a common range so no feature dominates because of its units',
+                 ['scaling', 'range', 'features', 'units', 'normalization']),
+            text('Describe how you would detect outliers.',
+                 'Use box plots or the IQR rule, z-scores, or visual inspection, then check whether they are errors',
+                 ['outliers', 'iqr', 'z-score', 'box', 'inspection']),
+            text('What makes a good KPI?',
+                 'It is measurable, tied to a business goal, actionable and tracked consistently over time',
+                 ['measurable', 'goal', 'actionable', 'consistent', 'kpi']),
+            text('Explain what a p-value tells you.',
+                 'The probability of results at least as extreme as observed if the null hypothesis were true',
+                 ['probability', 'null', 'hypothesis', 'extreme', 'p-value']),
+            text('What is the difference between a data lake and a data warehouse?',
+                 'A data lake stores raw data in any format, while a warehouse stores cleaned, structured data for analysis',
+                 ['lake', 'warehouse', 'raw', 'structured', 'schema']),
+            text('Why can averages be misleading?',
+                 'Skewed data and outliers pull the mean away from typical values, and averages hide the spread',
+                 ['skew', 'outliers', 'mean', 'spread', 'median']),
+            text('Explain what a subquery is in SQL.',
+                 'A query nested inside another query whose result is used as a value, list or table',
+                 ['subquery', 'nested', 'query', 'result', 'table']),
+            text('How would you choose the right chart for a data set?',
+                 'Match the chart to the question: comparisons, trends, distributions, relationships or composition',
+                 ['comparison', 'trend', 'distribution', 'relationship', 'composition'])
+        ],
+        'hard': [
+            text('Explain the concept of statistical significance in hypothesis testing.',
+                 'Statistical significance indicates that results are unlikely due to chance',
+                 ['significance', 'hypothesis', 'testing', 'p-value', 'confidence', 'chance']),
+            text("Explain Simpson's paradox with an example.",
+                 'A trend that appears in several groups reverses when the groups are combined, due to a lurking variable',
+                 ['simpson', 'paradox', 'groups', 'reverse', 'confounding']),
+            text('What are Type I and Type II errors?',
+                 'A Type I error rejects a true null hypothesis; a Type II error fails to reject a false one',
+                 ['type', 'false', 'positive', 'negative', 'null']),
+            text('How would you design an A/B test and decide its sample size?',
+                 'Define the metric and hypothesis, randomize users, and size the sample from the effect size, power and significance level',
+                 ['randomize', 'power', 'effect', 'significance', 'sample']),
+            text('Explain the multiple comparisons problem and how to correct for it.',
+                 'Running many tests inflates false positives; corrections like Bonferroni or false discovery rate control it',
+                 ['multiple', 'comparisons', 'bonferroni', 'false', 'discovery']),
+            text('How do you deal with a confounding variable in observational data?',
+                 'Identify it and control for it through stratification, matching or including it in a regression model',
+                 ['confounding', 'control', 'stratification', 'matching', 'regression']),
+            text('Explain the difference between OLTP and OLAP systems.',
+                 'OLTP handles many small transactional writes; OLAP handles large analytical queries over historical data',
+                 ['oltp', 'olap', 'transactional', 'analytical', 'queries']),
+            text('How would you measure the impact of a feature launch without an experiment?',
+                 'Use quasi-experimental methods such as difference-in-differences, synthetic controls or interrupted time series',
+                 ['difference-in-differences', 'synthetic', 'control', 'time', 'series']),
+            text('Explain slowly changing dimensions in a data warehouse.',
+                 'Dimensions whose attributes change over time, handled by overwriting, adding rows with validity dates, or adding columns',
+                 ['slowly', 'changing', 'dimension', 'history', 'type']),
+            text('How would you detect and handle seasonality in a time series?',
+                 'Look for repeating patterns with decomposition or autocorrelation, then model or remove the seasonal component',
+                 ['seasonality', 'decomposition', 'autocorrelation', 'trend', 'component']),
+            text('What is survivorship bias and how can it distort an analysis?',
+                 'Only analysing cases that survived a selection process, which hides failures and overstates success',
+                 ['survivorship', 'bias', 'selection', 'failures', 'distort']),
+            text('Explain the central limit theorem and why it matters.',
+                 'Means of large samples are approximately normally distributed, which justifies many tests and intervals',
+                 ['central', 'limit', 'normal', 'sample', 'mean']),
+            text('How would you optimize a slow analytical SQL query?',
+                 'Read the query plan, add suitable indexes or partitions, filter early, avoid unnecessary joins and pre-aggregate',
+                 ['plan', 'index', 'partition', 'filter', 'aggregate']),
+            text('Explain Bayesian versus frequentist approaches to inference.',
+                 'Frequentists treat parameters as fixed and use long-run frequencies; Bayesians update prior beliefs with data into posteriors',
+                 ['bayesian', 'frequentist', 'prior', 'posterior', 'probability']),
+            text('How would you build a metric framework for a product?',
+                 'Start from a north star metric, break it into input metrics and guardrails, and define each precisely',
+                 ['north', 'star', 'input', 'guardrail', 'metrics'])
+        ]
+    },
+    'machine-learning': {
+        'easy': [
+            mcq('What is machine learning?',
+                ['Programming computers', 'Teaching computers to learn from data', 'Creating websites', 'Building databases'],
+                'Teaching computers to learn from data', ['learning', 'data', 'algorithms', 'patterns', 'prediction']),
+            mcq('What is supervised learning?',
+                ['Learning without guidance', 'Learning with labeled data', 'Learning from mistakes', 'Learning automatically'],
+                'Learning with labeled data', ['supervised', 'labeled', 'training', 'guidance', 'examples']),
+            mcq('What is unsupervised learning?',
+                ['Learning patterns from unlabeled data', 'Learning with a teacher', 'Learning from rewards', 'Learning by copying code'],
+                'Learning patterns from unlabeled data', ['unsupervised', 'unlabeled', 'patterns', 'clustering']),
+            mcq('What is reinforcement learning?',
+                ['Learning by trial and error from rewards', 'Learning from labeled images', 'Sorting data', 'Compressing files'],
+                'Learning by trial and error from rewards', ['reinforcement', 'reward', 'agent', 'environment']),
+            mcq('Which task predicts a continuous number?',
+                ['Classification', 'Regression', 'Clustering', 'Association'],
+                'Regression', ['regression', 'continuous', 'numeric', 'prediction']),
+            mcq('Which task assigns inputs to categories?',
+                ['Regression', 'Classification', 'Dimensionality reduction', 'Forecasting'],
+                'Classification', ['classification', 'category', 'label', 'class']),
+            mcq('What is clustering?',
+                ['Grouping similar data points without labels', 'Predicting prices', 'Labeling images by hand', 'Encrypting data'],
+                'Grouping similar data points without labels', ['clustering', 'groups', 'similar', 'unlabeled']),
+            mcq('What is a feature in machine learning?',
+                ['An input variable used by the model', 'The predicted output', 'A bug in the code', 'A training run'],
+                'An input variable used by the model', ['feature', 'input', 'variable', 'attribute']),
+            mcq('What is a label in supervised learning?',
+                ['The target value the model learns to predict', 'A column name', 'A file name', 'A hyperparameter'],
+                'The target value the model learns to predict', ['label', 'target', 'output', 'supervised']),
+            mcq('What is training data?',
+                ['Data used to fit the model', 'Data used only for reporting', 'Data that is deleted', 'Random noise'],
+                'Data used to fit the model', ['training', 'fit', 'data', 'learn']),
+            mcq('Why is a test set kept separate?',
+                ['To estimate performance on unseen data', 'To make training faster', 'To store backups', 'To add more features'],
+                'To estimate performance on unseen data', ['test', 'unseen', 'evaluate', 'generalization']),
+            mcq('Which algorithm is commonly used for binary classification?',
+                ['Logistic regression', 'K-means', 'PCA', 'Apriori'],
+                'Logistic regression', ['logistic', 'binary', 'classification', 'probability']),
+            mcq('Which algorithm fits a straight line to predict a number?',
+                ['Linear regression', 'Decision tree classifier', 'K-means', 'Naive Bayes'],
+                'Linear regression', ['linear', 'regression', 'line', 'slope']),
+            mcq('What does K stand for in K-means?',
+                ['The number of clusters', 'The number of features', 'The learning rate', 'The number of epochs'],
+                'The number of clusters', ['k-means', 'clusters', 'centroids', 'k']),
+            mcq('What does KNN stand for?',
+                ['K-Nearest Neighbors', 'Kernel Neural Network', 'Key Node Network', 'K-Normal Numbers'],
+                'K-Nearest Neighbors', ['knn', 'nearest', 'neighbors', 'distance']),
+            mcq('What is a decision tree?',
+                ['A model that splits data with a series of questions', 'A folder structure', 'A type of database index', 'A chart of project tasks'],
+                'A model that splits data with a series of questions', ['decision', 'tree', 'split', 'nodes']),
+            mcq('What is accuracy as a metric?',
+                ['The share of predictions that are correct', 'The speed of training', 'The size of the model', 'The number of features'],
+                'The share of predictions that are correct', ['accuracy', 'correct', 'predictions', 'metric']),
+            mcq('What is a neural network loosely inspired by?',
+                ['The brain', 'Spreadsheets', 'Compilers', 'Databases'],
+                'The brain', ['neural', 'neurons', 'brain', 'layers']),
+            mcq('What is an epoch in training?',
+                ['One full pass over the training data', 'One prediction', 'One feature', 'One hour of training'],
+                'One full pass over the training data', ['epoch', 'pass', 'training', 'iteration']),
+            mcq('What is a model parameter?',
+                ['A value learned from data, such as a weight', 'A setting chosen before training', 'A data file', 'A test case'],
+                'A value learned from data, such as a weight', ['parameter', 'weight', 'learned', 'model']),
+            mcq('What is a hyperparameter?',
+                ['A setting chosen before training, such as the learning rate', 'A weight learned from data', 'A label', 'A prediction'],
+                'A setting chosen before training, such as the learning rate', ['hyperparameter', 'setting', 'learning', 'rate']),
+            mcq('Which Python library is popular for classical machine learning?',
+                ['scikit-learn', 'Django', 'BeautifulSoup', 'Tkinter'],
+                'scikit-learn', ['scikit-learn', 'sklearn', 'python', 'library']),
+            mcq('Which of these is a deep learning framework?',
+                ['PyTorch', 'jQuery', 'Bootstrap', 'SQLite'],
+                'PyTorch', ['pytorch', 'deep', 'learning', 'framework']),
+            mcq('What is underfitting?',
+                ['A model too simple to capture the pattern', 'A model that memorizes training data', 'A model with too many features', 'A model that is too fast'],
+                'A model too simple to capture the pattern', ['underfitting', 'simple', 'bias', 'pattern']),
+            mcq('What does a confusion matrix summarize?',
+                ['Correct and incorrect predictions per class', 'Training time', 'Feature importance', 'Data types'],
+                'Correct and incorrect predictions per class', ['confusion', 'matrix', 'predictions', 'class']),
+            mcq('What is a spam filter an example of?',
+                ['Classification', 'Regression', 'Clustering', 'Dimensionality reduction'],
+                'Classification', ['spam', 'classification', 'email', 'filter']),
+            mcq('Predicting house prices is an example of which task?',
+                ['Regression', 'Classification', 'Clustering', 'Ranking'],
+                'Regression', ['regression', 'price', 'continuous', 'prediction']),
+            mcq('What is a training/test split?',
+                ['Dividing data into a part to learn from and a part to evaluate on', 'Splitting a model in two', 'Removing half the features', 'Copying the data'],
+                'Dividing data into a part to learn from and a part to evaluate on', ['split', 'training', 'test', 'evaluate']),
+            mcq('What is feature scaling?',
+                ['Putting features on comparable ranges', 'Adding more features', 'Deleting features', 'Renaming features'],
+                'Putting features on comparable ranges', ['scaling', 'standardize', 'normalize', 'range']),
+            mcq('What is a prediction?',
+                ["The model's output for a given input", 'The training data', 'The loss function', 'The feature list'],
+                "The model's output for a given input", ['prediction', 'output', 'input', 'model']),
+            mcq('What is natural language processing?',
+                ['Teaching computers to work with human language', 'Writing code in English', 'Translating binary to hex', 'Designing keyboards'],
+                'Teaching computers to work with human language', ['nlp', 'language', 'text', 'processing']),
+            mcq('What is computer vision?',
+                ['Teaching computers to interpret images and video', 'Improving monitor resolution', 'Building graphics cards', 'Drawing charts'],
+                'Teaching computers to interpret images and video', ['vision', 'images', 'video', 'recognition']),
+            mcq('What does a loss function measure?',
+                ["How far the model's predictions are from the targets", 'How much memory is used', 'How many features exist', 'How fast the data loads'],
+                "How far the model's predictions are from the targets", ['loss', 'error', 'predictions', 'targets']),
+            mcq('What is a recommendation system?',
+                ['A model that suggests items a user may like', 'A search engine index', 'A spelling checker', 'A backup tool'],
+                'A model that suggests items a user may like', ['recommendation', 'suggest', 'users', 'items']),
+            mcq('What is a dataset?',
+                ['A collection of examples used for learning or evaluation', 'A single prediction', 'A programming language', 'A neural layer'],
+                'A collection of examples used for learning or evaluation', ['dataset', 'examples', 'collection', 'data']),
+            text('What is the difference between supervised and unsupervised learning?',
+                 'Supervised learning uses labeled examples to predict targets; unsupervised learning finds structure in unlabeled data',
+                 ['supervised', 'unsupervised', 'labeled', 'unlabeled', 'structure']),
+            text('Why do we split data into training and test sets?',
+                 'To measure how well the model generalizes to data it did not see during training',
+                 ['generalize', 'unseen', 'training', 'test', 'evaluate']),
+            text('Give an everyday example of machine learning.',
+                 'Spam filters, movie recommendations and voice assistants all learn patterns from data',
+                 ['spam', 'recommendations', 'voice', 'patterns', 'data']),
+            text('What is a feature and how do you choose good ones?',
+                 'A feature is an input variable; good ones are relevant to the target, reliable and available at prediction time',
+                 ['feature', 'input', 'relevant', 'target', 'variable']),
+            text('What is the goal of training a model?',
+                 'To find parameters that minimize the loss on training data while still generalizing to new data',
+                 ['parameters', 'minimize', 'loss', 'generalize', 'training']),
+            text('Explain what a classification model outputs.',
+                 'A class label, often with a probability or score for each class',
+                 ['class', 'label', 'probability', 'score', 'output']),
+            text('What is the role of a validation set?',
+                 'It is used to tune hyperparameters and choose models without touching the test set',
+                 ['validation', 'tune', 'hyperparameters', 'model', 'selection']),
+            text('Why does more data often help a model?',
+                 'More varied examples reduce overfitting and help the model learn the true pattern instead of noise',
+                 ['data', 'overfitting', 'variance', 'pattern', 'noise']),
+            text('What is bias in a data set?',
+                 'Systematic skew in how data was collected or labeled, which the model then learns and repeats',
+                 ['bias', 'skew', 'collection', 'fairness', 'representative']),
+            text('Describe how K-means clustering works.',
+                 'It places K centroids, assigns each point to the nearest one, moves centroids to the mean and repeats',
+                 ['centroids', 'assign', 'nearest', 'mean', 'iterate'])
+        ],
+        'medium': [
+            text('Explain overfitting in machine learning.',
+                 'Overfitting occurs when a model learns training data too well and fails to generalize',
+                 ['overfitting', 'generalization', 'training', 'validation', 'bias', 'variance']),
+            mcq('Which technique adds a penalty on large weights to reduce overfitting?',
+                ['Regularization', 'Normalization of labels', 'Data duplication', 'Early stopping of data loading'],
+                'Regularization', ['regularization', 'penalty', 'weights', 'overfitting']),
+            mcq('Which regularization can drive some weights exactly to zero?',
+                ['L1 (Lasso)', 'L2 (Ridge)', 'Dropout', 'Batch normalization'],
+                'L1 (Lasso)', ['l1', 'lasso', 'sparse', 'zero']),
+            mcq('What does precision measure?',
+                ['Of predicted positives, the share that are truly positive', 'Of actual positives, the share found', 'Overall accuracy', 'Training speed'],
+                'Of predicted positives, the share that are truly positive', ['precision', 'positives', 'false', 'predicted']),
+            mcq('What does recall measure?',
+                ['Of actual positives, the share the model found', 'Of predicted positives, the share correct', 'The loss value', 'The number of epochs'],
+                'Of actual positives, the share the model found', ['recall', 'sensitivity', 'actual', 'positives']),
+            mcq('What is the F1 score?',
+                ['The harmonic mean of precision and recall', 'The sum of errors', 'The learning rate', 'The number of features'],
+                'The harmonic mean of precision and recall', ['f1', 'harmonic', 'precision', 'recall']),
+            mcq('What is k-fold cross-validation?',
+                ['Training and validating on k different splits of the data', 'Training k models on the same split', 'Using k features', 'Running k epochs'],
+                'Training and validating on k different splits of the data', ['cross-validation', 'folds', 'splits', 'evaluate']),
+            mcq('What does gradient descent do?',
+                ['Iteratively updates parameters to reduce the loss', 'Sorts the data', 'Selects features', 'Splits the data'],
+                'Iteratively updates parameters to reduce the loss', ['gradient', 'descent', 'loss', 'update']),
+            mcq('What happens if the learning rate is too high?',
+                ['Training may diverge or oscillate', 'Training always converges faster', 'The model gets more features', 'Nothing changes'],
+                'Training may diverge or oscillate', ['learning', 'rate', 'diverge', 'oscillate']),
+            mcq('What does PCA do?',
+                ['Projects data onto directions of maximum variance', 'Clusters data', 'Classifies images', 'Fills missing values'],
+                'Projects data onto directions of maximum variance', ['pca', 'variance', 'components', 'dimensionality']),
+            mcq('What is a random forest?',
+                ['An ensemble of decision trees trained on random subsets', 'A single deep tree', 'A neural network', 'A clustering method'],
+                'An ensemble of decision trees trained on random subsets', ['random', 'forest', 'trees', 'bagging']),
+            mcq('What does an ROC curve plot?',
+                ['True positive rate against false positive rate', 'Loss against epochs', 'Precision against features', 'Accuracy against data size'],
+                'True positive rate against false positive rate', ['roc', 'true', 'false', 'positive', 'rate']),
+            mcq('What is one-hot encoding?',
+                ['Turning a category into binary indicator columns', 'Scaling numbers to 0-1', 'Removing outliers', 'Hashing passwords'],
+                'Turning a category into binary indicator columns', ['one-hot', 'encoding', 'categorical', 'binary']),
+            mcq('What does dropout do in a neural network?',
+                ['Randomly disables units during training to reduce overfitting', 'Removes training data', 'Stops training early', 'Deletes layers permanently'],
+                'Randomly disables units during training to reduce overfitting', ['dropout', 'units', 'regularization', 'overfitting']),
+            mcq('Which activation function outputs max(0, x)?',
+                ['ReLU', 'Sigmoid', 'Tanh', 'Softmax'],
+                'ReLU', ['relu', 'activation', 'rectified', 'linear']),
+            mcq('What is the softmax function used for?',
+                ['Turning scores into class probabilities', 'Scaling features', 'Computing gradients', 'Removing noise'],
+                'Turning scores into class probabilities', ['softmax', 'probabilities', 'classes', 'output']),
+            mcq('What is class imbalance?',
+                ['When some classes have far fewer examples than others', 'When features have different scales', 'When the model is too large', 'When the test set is small'],
+                'When some classes have far fewer examples than others', ['imbalance', 'minority', 'classes', 'skewed']),
+            mcq('Which metric is misleading on a heavily imbalanced data set?',
+                ['Accuracy', 'Recall', 'Precision-recall AUC', 'F1 score'],
+                'Accuracy', ['accuracy', 'imbalance', 'misleading', 'metric']),
+            mcq('What is a convolutional neural network mainly used for?',
+                ['Images and spatial data', 'Tabular accounting data', 'Database indexing', 'Sorting strings'],
+                'Images and spatial data', ['cnn', 'convolution', 'images', 'filters']),
+            mcq('What is transfer learning?',
+                ['Reusing a model trained on one task as a starting point for another', 'Moving data between servers', 'Copying weights at random', 'Training without data'],
+                'Reusing a model trained on one task as a starting point for another', ['transfer', 'pretrained', 'fine-tune', 'reuse']),
+            text('Explain the bias-variance tradeoff.',
+                 'Simple models have high bias and underfit; complex models have high variance and overfit; the best model balances both',
+                 ['bias', 'variance', 'underfit', 'overfit', 'complexity']),
+            text('How does a decision tree choose where to split?',
+                 'It picks the feature and threshold that most reduce impurity, measured by Gini impurity or entropy',
+                 ['split', 'impurity', 'gini', 'entropy', 'information']),
+            text('Explain precision and recall and when you would favour each.',
+                 'Precision matters when false positives are costly; recall matters when missing positives is costly',
+                 ['precision', 'recall', 'false', 'positives', 'negatives']),
+            text('How would you handle an imbalanced classification problem?',
+                 'Resample with oversampling or undersampling, use class weights, and evaluate with precision, recall or AUC',
+                 ['oversampling', 'undersampling', 'weights', 'recall', 'auc']),
+            text('What is cross-validation and why use it?',
+                 'Rotating which fold is held out gives a more reliable performance estimate than a single split',
+                 ['cross-validation', 'folds', 'estimate', 'reliable', 'split']),
+            text('Explain how gradient descent trains a model.',
+                 'It computes the gradient of the loss and moves the parameters a small step in the opposite direction, repeatedly',
+                 ['gradient', 'loss', 'parameters', 'step', 'learning rate']),
+            text('What is feature engineering? Give an example.',
+                 'Creating informative inputs from raw data, such as extracting the day of week from a timestamp',
+                 ['feature', 'engineering', 'transform', 'raw', 'domain']),
+            text('Compare L1 and L2 regularization.',
+                 'L1 penalizes absolute weights and yields sparse models; L2 penalizes squared weights and shrinks them smoothly',
+                 ['l1', 'l2', 'sparse', 'shrink', 'penalty']),
+            text('What is data leakage and how do you prevent it?',
+                 'Information from outside the training data, such as the target or test set, leaks into features; split first and fit preprocessing on training data only',
+                 ['leakage', 'target', 'test', 'split', 'preprocessing']),
+            text('Explain how a random forest reduces overfitting compared with one tree.',
+                 'It averages many trees trained on bootstrap samples and random feature subsets, which lowers variance',
+                 ['averaging', 'bootstrap', 'variance', 'trees', 'random'])
+        ],
+        'hard': [
+            text('Compare different ensemble methods and their advantages.',
+                 'Ensemble methods combine multiple models to improve performance and reduce overfitting',
+                 ['ensemble', 'models', 'performance', 'bagging', 'boosting', 'stacking']),
+            text('Explain how gradient boosting works.',
+                 'It adds weak learners one at a time, each fitted to the residual errors or gradients of the current ensemble',
+                 ['boosting', 'residual', 'weak', 'learners', 'gradient']),
+            text('Explain the vanishing gradient problem and how it is addressed.',
+                 'Gradients shrink through many layers so early layers stop learning; ReLU, residual connections and normalization help',
+                 ['vanishing', 'gradient', 'relu', 'residual', 'normalization']),
+            text('How does the attention mechanism in transformers work?',
+                 'Each token builds queries, keys and values, and weights other tokens by query-key similarity to mix their values',
+                 ['attention', 'query', 'key', 'value', 'transformer']),
+            text('How would you deploy and monitor a model in production?',
+                 'Serve it behind an API, log inputs and predictions, and monitor data drift, latency and performance to trigger retraining',
+                 ['deploy', 'monitor', 'drift', 'retraining', 'latency']),
+            text('Explain concept drift and how to detect it.',
+                 'The relationship between inputs and target changes over time; track performance and input distributions against a baseline',
+                 ['concept', 'drift', 'distribution', 'performance', 'baseline']),
+            text('How do support vector machines find a decision boundary?',
+                 'They find the hyperplane with the largest margin between classes, using kernels for non-linear boundaries',
+                 ['svm', 'margin', 'hyperplane', 'kernel', 'support']),
+            text('Explain batch normalization and why it speeds up training.',
+                 'It normalizes layer inputs per mini-batch and learns a scale and shift, stabilizing activations and allowing higher learning rates',
+                 ['batch', 'normalization', 'activations', 'stabilize', 'learning rate']),
+            text('How would you make a model more interpretable?',
+                 'Prefer simple models where possible, or explain complex ones with feature importance, SHAP values or partial dependence',
+                 ['interpretable', 'shap', 'importance', 'explain', 'partial']),
+            text('Explain the difference between generative and discriminative models.',
+                 'Generative models learn the joint distribution of inputs and labels; discriminative models learn the boundary or conditional probability directly',
+                 ['generative', 'discriminative', 'joint', 'conditional', 'distribution']),
+            text('How do you choose hyperparameters efficiently?',
+                 'Use random search or Bayesian optimization with cross-validation rather than an exhaustive grid',
+                 ['random', 'search', 'bayesian', 'optimization', 'cross-validation']),
+            text('Explain how word embeddings capture meaning.',
+                 'Words are mapped to dense vectors learned from context so that words used similarly end up close together',
+                 ['embeddings', 'vectors', 'context', 'similarity', 'dense']),
+            text('What are the risks of training on biased data, and how can they be mitigated?',
+                 'Models reproduce unfair patterns; audit data and outcomes by group, rebalance data and apply fairness constraints',
+                 ['fairness', 'bias', 'audit', 'rebalance', 'constraints']),
+            text('Explain how recurrent neural networks handle sequences and their limitations.',
+                 'They carry a hidden state across time steps but struggle with long dependencies, which LSTMs, GRUs and attention address',
+                 ['recurrent', 'hidden', 'state', 'lstm', 'sequence']),
+            text('How would you design an evaluation for a recommendation system?',
+                 'Use offline ranking metrics such as precision at k and NDCG on held-out interactions, then confirm with online A/B tests',
+                 ['ranking', 'ndcg', 'precision', 'offline', 'online'])
+        ]
+    },
+    'web-development': {
+        'easy': [
+            mcq('What does HTML stand for?',
+                ['HyperText Markup Language', 'High Tech Modern Language', 'Home Tool Markup Language', 'Hyperlink Text Management Language'],
+                'HyperText Markup Language', ['html', 'markup', 'hypertext', 'web', 'structure']),
+            mcq('What is CSS used for?',
+                ['Creating databases', 'Styling web pages', 'Writing server code', 'Managing files'],
+                'Styling web pages', ['css', 'styling', 'design', 'presentation', 'layout']),
+            mcq('Which language adds interactivity to web pages in the browser?',
+                ['JavaScript', 'SQL', 'C', 'YAML'],
+                'JavaScript', ['javascript', 'browser', 'interactive', 'script']),
+            mcq('Which HTML tag creates a hyperlink?',
+                ['<a>', '<link>', '<href>', '<p>'],
+                '<a>', ['anchor', 'link', 'href', 'tag']),
+            mcq('Which HTML tag displays an image?',
+                ['<img>', '<picture-src>', '<image>', '<src>'],
+                '<img>', ['img', 'image', 'src', 'alt']),
+            mcq('Which HTML tag holds the largest heading?',
+                ['<h1>', '<h6>', '<head>', '<header>'],
+                '<h1>', ['heading', 'h1', 'title', 'tag']),
+            mcq('What does URL stand for?',
+                ['Uniform Resource Locator', 'Universal Routing Link', 'Unified Request Language', 'User Resource Listing'],
+                'Uniform Resource Locator', ['url', 'address', 'resource', 'locator']),
+            mcq('What does HTTP stand for?',
+                ['HyperText Transfer Protocol', 'High Transfer Text Process', 'Hosted Text Transport Program', 'Hyperlink Transfer Tool Protocol'],
+                'HyperText Transfer Protocol', ['http', 'protocol', 'transfer', 'web']),
+            mcq('What does the S in HTTPS add?',
+                ['Encryption through TLS', 'Speed', 'Server-side rendering', 'Static files'],
+                'Encryption through TLS', ['https', 'secure', 'tls', 'encryption']),
+            mcq('What is a web browser?',
+                ['An application that fetches and displays web pages', 'A web server', 'A database', 'A text editor'],
+                'An application that fetches and displays web pages', ['browser', 'client', 'render', 'pages']),
+            mcq('What is a web server?',
+                ['Software that serves responses to HTTP requests', 'A browser plugin', 'A CSS framework', 'A code editor'],
+                'Software that serves responses to HTTP requests', ['server', 'http', 'requests', 'responses']),
+            mcq('Which CSS property changes the text color?',
+                ['color', 'font-color', 'text-style', 'background'],
+                'color', ['color', 'text', 'css', 'property']),
+            mcq("Which CSS property sets the space inside an element's border?",
+                ['padding', 'margin', 'spacing', 'gap-inside'],
+                'padding', ['padding', 'box', 'spacing', 'border']),
+            mcq("Which CSS property sets the space outside an element's border?",
+                ['margin', 'padding', 'outline', 'inset'],
+                'margin', ['margin', 'box', 'spacing', 'outside']),
+            mcq('How do you select an element with id "main" in CSS?',
+                ['#main', '.main', 'main()', '*main'],
+                '#main', ['id', 'selector', 'hash', 'css']),
+            mcq('How do you select elements with class "card" in CSS?',
+                ['.card', '#card', '@card', 'card()'],
+                '.card', ['class', 'selector', 'dot', 'css']),
+            mcq('What does DOM stand for?',
+                ['Document Object Model', 'Data Output Method', 'Display Order Manager', 'Dynamic Object Markup'],
+                'Document Object Model', ['dom', 'document', 'tree', 'elements']),
+            mcq('Which HTML element groups form controls for submission?',
+                ['<form>', '<input-group>', '<fieldset-submit>', '<submit>'],
+                '<form>', ['form', 'submit', 'input', 'fields']),
+            mcq('Which HTTP method usually retrieves data?',
+                ['GET', 'POST', 'DELETE', 'PATCH'],
+                'GET', ['get', 'retrieve', 'method', 'http']),
+            mcq('Which HTTP method usually submits new data?',
+                ['POST', 'GET', 'HEAD', 'OPTIONS'],
+                'POST', ['post', 'submit', 'create', 'method']),
+            mcq('What does a 404 status code mean?',
+                ['Not Found', 'Server Error', 'Unauthorized', 'Moved Permanently'],
+                'Not Found', ['404', 'not', 'found', 'status']),
+            mcq('What does a 200 status code mean?',
+                ['OK', 'Created', 'Redirect', 'Bad Request'],
+                'OK', ['200', 'ok', 'success', 'status']),
+            mcq('What is responsive design?',
+                ['Layouts that adapt to different screen sizes', 'Pages that load instantly', 'Sites that reply to emails', 'Servers that auto-scale'],
+                'Layouts that adapt to different screen sizes', ['responsive', 'screen', 'mobile', 'layout']),
+            mcq('Which tool is used for version control?',
+                ['Git', 'Photoshop', 'Excel', 'FTP'],
+                'Git', ['git', 'version', 'control', 'commits']),
+            mcq('What is JSON?',
+                ['A lightweight text format for structured data', 'A JavaScript framework', 'A database engine', 'An image format'],
+                'A lightweight text format for structured data', ['json', 'format', 'data', 'objects']),
+            mcq('Which keyword declares a block-scoped variable that cannot be reassigned in JavaScript?',
+                ['const', 'var', 'let', 'static'],
+                'const', ['const', 'variable', 'javascript', 'constant']),
+            mcq('What does the alt attribute on an image provide?',
+                ['Alternative text for accessibility', 'The image size', 'The image URL', 'A caption style'],
+                'Alternative text for accessibility', ['alt', 'accessibility', 'screen', 'reader']),
+            mcq('What is a domain name?',
+                ['A human-readable address for a website', 'A programming language', 'A type of cookie', 'A CSS rule'],
+                'A human-readable address for a website', ['domain', 'address', 'dns', 'website']),
+            mcq('What does DNS do?',
+                ['Translates domain names to IP addresses', 'Encrypts web traffic', 'Stores user passwords', 'Compresses images'],
+                'Translates domain names to IP addresses', ['dns', 'domain', 'ip', 'lookup']),
+            mcq('What is a cookie in web development?',
+                ['A small piece of data the browser stores for a site', 'A JavaScript library', 'A server error', 'An image format'],
+                'A small piece of data the browser stores for a site', ['cookie', 'browser', 'session', 'storage']),
+            mcq('Which CSS layout module arranges items in one dimension?',
+                ['Flexbox', 'Grid', 'Float', 'Table'],
+                'Flexbox', ['flexbox', 'flex', 'layout', 'row']),
+            mcq('Which CSS layout module arranges items in rows and columns at once?',
+                ['Grid', 'Flexbox', 'Inline', 'Position'],
+                'Grid', ['grid', 'rows', 'columns', 'layout']),
+            mcq('Which HTML tag creates an unordered list?',
+                ['<ul>', '<ol>', '<li>', '<list>'],
+                '<ul>', ['ul', 'list', 'unordered', 'bullets']),
+            mcq('What is a framework like React used for?',
+                ['Building user interfaces from components', 'Managing databases', 'Configuring servers', 'Editing images'],
+                'Building user interfaces from components', ['react', 'components', 'ui', 'framework']),
+            mcq("Which file is usually served as a site's home page?",
+                ['index.html', 'home.css', 'main.json', 'start.js'],
+                'index.html', ['index', 'home', 'html', 'default']),
+            text('Explain the roles of HTML, CSS and JavaScript.',
+                 'HTML structures the content, CSS styles its presentation and JavaScript adds behaviour and interactivity',
+                 ['html', 'structure', 'css', 'style', 'javascript', 'behaviour']),
+            text('What happens when you type a URL into a browser?',
+                 'The browser resolves the domain with DNS, connects to the server, sends an HTTP request and renders the response',
+                 ['dns', 'request', 'server', 'response', 'render']),
+            text('Why are semantic HTML tags useful?',
+                 'Tags like header, nav and article describe meaning, which helps accessibility, SEO and maintainability',
+                 ['semantic', 'accessibility', 'seo', 'meaning', 'tags']),
+            text('What is the box model in CSS?',
+                 'Every element is a box made of content, padding, border and margin',
+                 ['content', 'padding', 'border', 'margin', 'box']),
+            text('Why should websites use HTTPS?',
+                 'It encrypts traffic, protecting data from eavesdropping and tampering, and verifies the site identity',
+                 ['encrypt', 'https', 'tls', 'security', 'identity']),
+            text('What is the difference between GET and POST requests?',
+                 'GET requests fetch data with parameters in the URL; POST sends data in the request body to create or change something',
+                 ['get', 'post', 'url', 'body', 'parameters']),
+            text('Explain what a web form does.',
+                 'A form collects user input in fields and submits it to a server for processing',
+                 ['form', 'input', 'submit', 'server', 'fields']),
+            text('Why is web accessibility important?',
+                 'It lets people with disabilities use the site, for example through screen readers and keyboard navigation',
+                 ['accessibility', 'disabilities', 'screen', 'keyboard', 'inclusive']),
+            text('What is the purpose of version control?',
+                 'It tracks changes to code over time, lets people collaborate and allows reverting to earlier versions',
+                 ['version', 'history', 'collaborate', 'revert', 'changes']),
+            text('What is the difference between a static and a dynamic website?',
+                 'A static site serves the same prebuilt files to everyone; a dynamic site generates pages per request, often from a database',
+                 ['static', 'dynamic', 'server', 'database', 'generate'])
+        ],
+        'medium': [
+            text('Explain the difference between frontend and backend development.',
+                 'Frontend handles user interface, backend handles server logic and database',
+                 ['frontend', 'backend', 'interface', 'server', 'database', 'logic']),
+            mcq('What does REST stand for?',
+                ['Representational State Transfer', 'Remote Execution Service Transport', 'Rapid Endpoint Server Technology', 'Resource State Template'],
+                'Representational State Transfer', ['rest', 'api', 'resources', 'stateless']),
+            mcq('Which HTTP status code means the client is not authenticated?',
+                ['401', '403', '404', '500'],
+                '401', ['401', 'unauthorized', 'authentication', 'status']),
+            mcq('Which HTTP status code means the user is authenticated but not allowed?',
+                ['403', '401', '302', '204'],
+                '403', ['403', 'forbidden', 'permission', 'status']),
+            mcq('What is CORS?',
+                ['A browser mechanism controlling cross-origin requests', 'A CSS preprocessor', 'A database index', 'A build tool'],
+                'A browser mechanism controlling cross-origin requests', ['cors', 'origin', 'headers', 'browser']),
+            mcq('What does async/await simplify in JavaScript?',
+                ['Writing asynchronous code that reads sequentially', 'Styling components', 'Declaring classes', 'Bundling modules'],
+                'Writing asynchronous code that reads sequentially', ['async', 'await', 'promise', 'asynchronous']),
+            mcq('What is a Promise in JavaScript?',
+                ['An object representing the eventual result of an async operation', 'A type of loop', 'A CSS animation', 'A server route'],
+                'An object representing the eventual result of an async operation', ['promise', 'async', 'resolve', 'reject']),
+            mcq('What does the === operator check in JavaScript?',
+                ['Equality of value and type', 'Equality of value only', 'Assignment', 'Reference count'],
+                'Equality of value and type', ['strict', 'equality', 'type', 'comparison']),
+            mcq('What is event bubbling?',
+                ['An event propagating from the target up through its ancestors', 'Events firing twice', 'Animations on hover', 'Queueing network requests'],
+                'An event propagating from the target up through its ancestors', ['event', 'bubbling', 'propagation', 'dom']),
+            mcq('What is localStorage?',
+                ['Browser key-value storage that persists across sessions', 'A server cache', 'A database table', 'A CSS variable'],
+                'Browser key-value storage that persists across sessions', ['localstorage', 'browser', 'persist', 'storage']),
+            mcq('What does a CDN do?',
+                ['Serves content from servers close to users', 'Compiles JavaScript', 'Hosts a database', 'Manages DNS records only'],
+                'Serves content from servers close to users', ['cdn', 'edge', 'latency', 'caching']),
+            mcq('Which HTTP header controls how long a response may be cached?',
+                ['Cache-Control', 'Content-Type', 'Authorization', 'Accept'],
+                'Cache-Control', ['cache-control', 'caching', 'max-age', 'header']),
+            mcq('What is an ORM?',
+                ['A library that maps database tables to objects', 'A CSS framework', 'A testing tool', 'A web server'],
+                'A library that maps database tables to objects', ['orm', 'objects', 'database', 'mapping']),
+            mcq('What is a JWT commonly used for?',
+                ['Carrying signed authentication claims', 'Styling pages', 'Compressing images', 'Routing requests'],
+                'Carrying signed authentication claims', ['jwt', 'token', 'authentication', 'claims']),
+            mcq('Which attack injects malicious scripts into pages viewed by other users?',
+                ['Cross-site scripting (XSS)', 'SQL injection', 'DDoS', 'Phishing'],
+                'Cross-site scripting (XSS)', ['xss', 'scripting', 'injection', 'escape']),
+            mcq('What prevents SQL injection?',
+                ['Parameterized queries', 'Longer passwords', 'Minified JavaScript', 'HTTPS alone'],
+                'Parameterized queries', ['parameterized', 'sql', 'injection', 'queries']),
+            mcq('What is a single-page application?',
+                ['An app that loads once and updates the page with JavaScript', 'A site with one HTML tag', 'A static landing page', 'A server with one route'],
+                'An app that loads once and updates the page with JavaScript', ['spa', 'single-page', 'routing', 'javascript']),
+            mcq('What is the virtual DOM in React?',
+                ['An in-memory representation used to compute minimal DOM updates', 'A browser extension', 'A server-side database', 'A CSS reset'],
+                'An in-memory representation used to compute minimal DOM updates', ['virtual', 'dom', 'diff', 'react']),
+            mcq('What is a media query used for?',
+                ['Applying CSS rules based on device characteristics', 'Querying a video database', 'Loading audio files', 'Searching images'],
+                'Applying CSS rules based on device characteristics', ['media', 'query', 'responsive', 'breakpoint']),
+            mcq('What does minification do?',
+                ['Removes unnecessary characters to shrink files', 'Encrypts code', 'Converts images to text', 'Adds comments'],
+                'Removes unnecessary characters to shrink files', ['minify', 'size', 'whitespace', 'performance']),
+            text('What makes an API RESTful?',
+                 'Resources identified by URLs, standard HTTP methods, stateless requests and representations such as JSON',
+                 ['resources', 'methods', 'stateless', 'json', 'urls']),
+            text('Explain the difference between cookies, localStorage and sessionStorage.',
+                 'Cookies are sent with requests and can expire; localStorage persists in the browser; sessionStorage lasts for one tab session',
+                 ['cookies', 'localstorage', 'sessionstorage', 'persist', 'requests']),
+            text('How does authentication differ from authorization?',
+                 'Authentication verifies who the user is; authorization decides what that user is allowed to do',
+                 ['authentication', 'authorization', 'identity', 'permissions', 'access']),
+            text('How would you improve the load time of a web page?',
+                 'Compress and cache assets, minify code, lazy-load images, use a CDN and reduce blocking scripts',
+                 ['compress', 'cache', 'minify', 'lazy', 'cdn']),
+            text('Explain how CORS works.',
+                 'The browser checks response headers like Access-Control-Allow-Origin, sending preflight requests for non-simple calls',
+                 ['cors', 'origin', 'preflight', 'headers', 'browser']),
+            text('What is the event loop in JavaScript?',
+                 'A single thread runs the call stack and, when it is empty, takes queued callbacks and microtasks to run next',
+                 ['event', 'loop', 'queue', 'stack', 'callbacks']),
+            text('How would you store user passwords securely?',
+                 'Hash them with a slow, salted algorithm such as bcrypt or argon2 and never store plain text',
+                 ['hash', 'salt', 'bcrypt', 'argon2', 'plain']),
+            text('What is the difference between server-side and client-side rendering?',
+                 'Server-side rendering sends ready HTML from the server; client-side rendering builds the page in the browser with JavaScript',
+                 ['server-side', 'client-side', 'html', 'javascript', 'render']),
+            text('Explain what a web API rate limit is and why it is used.',
+                 'A cap on requests per client over time, protecting the service from abuse and overload',
+                 ['rate', 'limit', 'requests', 'abuse', 'overload']),
+            text('How would you protect a form against CSRF?',
+                 'Include an unpredictable CSRF token checked by the server and use SameSite cookies',
+                 ['csrf', 'token', 'samesite', 'cookies', 'forgery'])
+        ],
+        'hard': [
+            text('Discuss microservices architecture and its benefits.',
+                 'Microservices architecture breaks applications into small, independent services for scalability',
+                 ['microservices', 'architecture', 'scalability', 'independent', 'services', 'deployment']),
+            text('How would you design a scalable URL shortener?',
+                 'Generate unique keys, store mappings in a distributed database, cache hot links and put servers behind a load balancer',
+                 ['keys', 'database', 'cache', 'load', 'balancer']),
+            text('Explain how you would implement real-time updates in a web app.',
+                 'Use WebSockets or server-sent events for pushes, with a pub/sub backend to fan messages out across servers',
+                 ['websockets', 'server-sent', 'events', 'pub/sub', 'push']),
+            text('Compare monolithic and microservice architectures.',
+                 'A monolith is simpler to build and deploy as one unit; microservices scale and deploy independently but add network and operational complexity',
+                 ['monolith', 'microservices', 'deploy', 'complexity', 'scale']),
+            text('How do you keep sessions working across multiple web servers?',
+                 'Store session state in a shared store such as Redis or use signed stateless tokens, rather than server memory',
+                 ['session', 'shared', 'redis', 'stateless', 'tokens']),
+            text('Explain HTTP caching with ETags and conditional requests.',
+                 'The server sends an ETag; the client sends If-None-Match, and the server replies 304 Not Modified when it still matches',
+                 ['etag', 'if-none-match', '304', 'conditional', 'cache']),
+            text('What are the trade-offs of GraphQL compared with REST?',
+                 'GraphQL lets clients request exactly the fields they need in one query but complicates caching, rate limiting and server cost control',
+                 ['graphql', 'rest', 'fields', 'caching', 'query']),
+            text('How would you secure a public REST API?',
+                 'Use HTTPS, strong authentication such as OAuth tokens, input validation, rate limiting and least-privilege authorization',
+                 ['https', 'oauth', 'validation', 'rate', 'authorization']),
+            text('Explain how a browser renders a page and what causes reflows.',
+                 'It builds the DOM and CSSOM, computes layout and paints; changing geometry or reading layout after writes triggers reflow',
+                 ['dom', 'cssom', 'layout', 'paint', 'reflow']),
+            text('How would you approach zero-downtime deployments?',
+                 'Use rolling or blue-green deployments behind a load balancer, health checks, and backward-compatible database migrations',
+                 ['rolling', 'blue-green', 'health', 'migrations', 'load balancer']),
+            text('Explain the Content Security Policy header.',
+                 'It tells the browser which sources of scripts, styles and other resources are allowed, limiting XSS damage',
+                 ['content', 'security', 'policy', 'sources', 'xss']),
+            text('How would you design pagination for a large, changing data set?',
+                 'Use cursor or keyset pagination on a stable sort key instead of offsets, so inserts do not shift pages',
+                 ['cursor', 'keyset', 'offset', 'pagination', 'sort']),
+            text('Explain how OAuth 2.0 authorization code flow works.',
+                 'The user approves access at the provider, the app receives a code, and its backend exchanges the code for tokens',
+                 ['oauth', 'authorization', 'code', 'tokens', 'exchange']),
+            text('How would you debug a memory leak in a long-running web app?',
+                 'Take heap snapshots over time, compare retained objects, and look for growing caches, listeners or closures',
+                 ['heap', 'snapshots', 'retained', 'listeners', 'leak']),
+            text('Explain the trade-offs of server-side rendering for SEO and performance.',
+                 'SSR gives crawlers and users content sooner but increases server load and complexity, often paired with hydration',
+                 ['ssr', 'seo', 'hydration', 'server', 'performance'])
+        ]
+    },
+    'dsa': {
+        'easy': [
+            mcq('What is the time complexity of binary search?',
+                ['O(n)', 'O(log n)', 'O(n²)', 'O(1)'],
+                'O(log n)', ['binary', 'search', 'logarithmic', 'complexity', 'efficient']),
+            mcq('What is a stack data structure?',
+                ['First In First Out', 'Last In First Out', 'Random Access', 'No Order'],
+                'Last In First Out', ['stack', 'lifo', 'push', 'pop', 'last', 'first']),
+            mcq('What order does a queue follow?',
+                ['First In First Out', 'Last In First Out', 'Sorted order', 'Random order'],
+                'First In First Out', ['queue', 'fifo', 'enqueue', 'dequeue']),
+            mcq('What is the time complexity of accessing an array element by index?',
+                ['O(1)', 'O(n)', 'O(log n)', 'O(n log n)'],
+                'O(1)', ['array', 'index', 'constant', 'access']),
+            mcq('What does binary search require of its input?',
+                ['It must be sorted', 'It must be unique', 'It must be a linked list', 'It must be small'],
+                'It must be sorted', ['sorted', 'binary', 'search', 'input']),
+            mcq('What is the worst-case time complexity of linear search?',
+                ['O(n)', 'O(1)', 'O(log n)', 'O(n²)'],
+                'O(n)', ['linear', 'search', 'scan', 'complexity']),
+            mcq('Which data structure stores key-value pairs with average O(1) lookup?',
+                ['Hash table', 'Linked list', 'Stack', 'Binary heap'],
+                'Hash table', ['hash', 'table', 'key', 'lookup']),
+            mcq('What is a linked list?',
+                ['Nodes that each point to the next node', 'A contiguous block of memory', 'A sorted array', 'A table of keys'],
+                'Nodes that each point to the next node', ['linked', 'list', 'nodes', 'pointer']),
+            mcq('What is the root of a tree?',
+                ['The top node with no parent', 'A node with no children', 'The deepest node', 'Any node with two children'],
+                'The top node with no parent', ['root', 'tree', 'parent', 'node']),
+            mcq('What is a leaf node?',
+                ['A node with no children', 'The root node', 'A node with one child', 'A node in a cycle'],
+                'A node with no children', ['leaf', 'node', 'children', 'tree']),
+            mcq('How many children can a node in a binary tree have at most?',
+                ['2', '1', '3', 'Unlimited'],
+                '2', ['binary', 'tree', 'children', 'two']),
+            mcq('Which operation adds an item to the top of a stack?',
+                ['Push', 'Pop', 'Enqueue', 'Peek'],
+                'Push', ['push', 'stack', 'top', 'add']),
+            mcq('Which operation removes the top item of a stack?',
+                ['Pop', 'Push', 'Shift', 'Insert'],
+                'Pop', ['pop', 'stack', 'remove', 'top']),
+            mcq('What does Big O notation describe?',
+                ['How running time or space grows with input size', 'The exact running time in seconds', 'The memory address', 'The number of lines of code'],
+                'How running time or space grows with input size', ['big', 'notation', 'growth', 'complexity']),
+            mcq('What is the time complexity of bubble sort in the worst case?',
+                ['O(n²)', 'O(n log n)', 'O(n)', 'O(log n)'],
+                'O(n²)', ['bubble', 'sort', 'quadratic', 'swap']),
+            mcq('Which sorting algorithm repeatedly picks the smallest remaining element?',
+                ['Selection sort', 'Merge sort', 'Quick sort', 'Counting sort'],
+                'Selection sort', ['selection', 'sort', 'minimum', 'swap']),
+            mcq('What is recursion?',
+                ['A function calling itself', 'A loop that never ends', 'Sorting in reverse', 'A type of array'],
+                'A function calling itself', ['recursion', 'function', 'base', 'case']),
+            mcq('What must every recursive function have to terminate?',
+                ['A base case', 'A global variable', 'A loop', 'Two parameters'],
+                'A base case', ['base', 'case', 'terminate', 'recursion']),
+            mcq('What is a graph?',
+                ['A set of vertices connected by edges', 'A sorted list', 'A table of numbers', 'A type of loop'],
+                'A set of vertices connected by edges', ['graph', 'vertices', 'edges', 'nodes']),
+            mcq('Which traversal visits a graph level by level?',
+                ['Breadth-first search', 'Depth-first search', 'In-order traversal', 'Binary search'],
+                'Breadth-first search', ['bfs', 'breadth', 'level', 'queue']),
+            mcq('Which data structure does depth-first search typically use?',
+                ['Stack', 'Queue', 'Heap', 'Hash table'],
+                'Stack', ['dfs', 'depth', 'stack', 'recursion']),
+            mcq('Which data structure does breadth-first search typically use?',
+                ['Queue', 'Stack', 'Tree', 'Set'],
+                'Queue', ['bfs', 'queue', 'breadth', 'level']),
+            mcq('What is the time complexity of inserting at the head of a linked list?',
+                ['O(1)', 'O(n)', 'O(log n)', 'O(n²)'],
+                'O(1)', ['linked', 'list', 'insert', 'head']),
+            mcq('What is a binary search tree property?',
+                ['Left subtree keys are smaller and right subtree keys are larger', 'All leaves are at the same depth', 'Every node has two children', 'Keys are stored in insertion order'],
+                'Left subtree keys are smaller and right subtree keys are larger', ['bst', 'left', 'right', 'ordering']),
+            mcq('Which traversal of a binary search tree returns keys in sorted order?',
+                ['In-order', 'Pre-order', 'Post-order', 'Level-order'],
+                'In-order', ['in-order', 'traversal', 'sorted', 'bst']),
+            mcq('What is a hash collision?',
+                ['Two keys mapping to the same bucket', 'A hash table running out of memory', 'A key being deleted', 'A sorted hash'],
+                'Two keys mapping to the same bucket', ['hash', 'collision', 'bucket', 'keys']),
+            mcq('What is the time complexity of merge sort?',
+                ['O(n log n)', 'O(n²)', 'O(n)', 'O(log n)'],
+                'O(n log n)', ['merge', 'sort', 'divide', 'conquer']),
+            mcq('What is a two-dimensional array?',
+                ['An array of arrays forming rows and columns', 'An array with two elements', 'Two separate arrays', 'A linked list of pairs'],
+                'An array of arrays forming rows and columns', ['matrix', 'rows', 'columns', 'array']),
+            mcq('Which structure is used to undo operations in an editor?',
+                ['Stack', 'Queue', 'Graph', 'Heap'],
+                'Stack', ['undo', 'stack', 'history', 'lifo']),
+            mcq('Which structure models people waiting in line?',
+                ['Queue', 'Stack', 'Tree', 'Hash set'],
+                'Queue', ['queue', 'line', 'fifo', 'order']),
+            mcq('What is the space complexity of an algorithm?',
+                ['How much extra memory it uses as input grows', 'How fast it runs', 'How many loops it has', 'How long its code is'],
+                'How much extra memory it uses as input grows', ['space', 'memory', 'complexity', 'growth']),
+            mcq('What does a set data structure guarantee?',
+                ['No duplicate elements', 'Sorted order', 'Constant-size storage', 'Index-based access'],
+                'No duplicate elements', ['set', 'unique', 'duplicates', 'membership']),
+            mcq('Which complexity class is fastest for large inputs?',
+                ['O(log n)', 'O(n)', 'O(n log n)', 'O(n²)'],
+                'O(log n)', ['logarithmic', 'fast', 'growth', 'complexity']),
+            mcq('What is a doubly linked list?',
+                ['Nodes with pointers to both next and previous nodes', 'Two linked lists side by side', 'A list with double values', 'A list sorted twice'],
+                'Nodes with pointers to both next and previous nodes', ['doubly', 'linked', 'previous', 'next']),
+            mcq('What is the height of a tree?',
+                ['The number of edges on the longest root-to-leaf path', 'The number of nodes', 'The number of leaves', 'The value at the root'],
+                'The number of edges on the longest root-to-leaf path', ['height', 'depth', 'path', 'tree']),
+            text('What is the difference between an array and a linked list?',
+                 'Arrays store elements contiguously with O(1) indexing; linked lists use nodes with pointers and O(1) insertion at known positions',
+                 ['array', 'linked', 'contiguous', 'pointers', 'indexing']),
+            text('Explain the difference between a stack and a queue.',
+                 'A stack removes the most recently added item first (LIFO); a queue removes the oldest item first (FIFO)',
+                 ['stack', 'queue', 'lifo', 'fifo', 'order']),
+            text('Why is binary search faster than linear search on sorted data?',
+                 'It halves the search range on each step, giving O(log n) instead of checking every element in O(n)',
+                 ['halves', 'sorted', 'logarithmic', 'linear', 'range']),
+            text('What is a hash function?',
+                 'A function that maps a key to a fixed-size value used to choose a bucket in a hash table',
+                 ['hash', 'function', 'key', 'bucket', 'map']),
+            text('Explain recursion with a simple example.',
+                 'A function solves a problem by calling itself on a smaller input, like factorial(n) = n * factorial(n - 1) with a base case',
+                 ['recursion', 'base', 'case', 'smaller', 'factorial']),
+            text('What does O(n) time complexity mean?',
+                 'The running time grows linearly with the size of the input',
+                 ['linear', 'grows', 'input', 'size', 'time']),
+            text('How would you reverse a string?',
+                 'Swap characters from both ends moving inward, or build a new string from the last character to the first',
+                 ['reverse', 'swap', 'ends', 'characters', 'loop']),
+            text('How do you find the largest number in an unsorted array?',
+                 'Scan every element once, keeping the largest value seen so far, in O(n) time',
+                 ['scan', 'maximum', 'largest', 'linear', 'loop']),
+            text('What is a tree data structure?',
+                 'A hierarchy of nodes where each node has one parent except the root, and no cycles',
+                 ['tree', 'hierarchy', 'parent', 'root', 'nodes']),
+            text('When would you use a hash set instead of a list?',
+                 'When you need fast membership tests or to remove duplicates, since lookups are average O(1)',
+                 ['membership', 'duplicates', 'lookup', 'constant', 'set'])
+        ],
+        'medium': [
+            text('Explain dynamic programming and provide an example.',
+                 'Dynamic programming solves complex problems by breaking them into simpler subproblems',
+                 ['dynamic', 'programming', 'subproblems', 'optimization', 'memoization']),
+            mcq('What is the average time complexity of quicksort?',
+                ['O(n log n)', 'O(n²)', 'O(n)', 'O(log n)'],
+                'O(n log n)', ['quicksort', 'pivot', 'partition', 'average']),
+            mcq('When does quicksort hit its O(n²) worst case?',
+                ['When pivots split the array very unevenly', 'When the array is small', 'When keys are strings', 'When memory is low'],
+                'When pivots split the array very unevenly', ['pivot', 'worst', 'unbalanced', 'quicksort']),
+            mcq('Which data structure supports efficient retrieval of the minimum element?',
+                ['Min-heap', 'Queue', 'Linked list', 'Hash table'],
+                'Min-heap', ['heap', 'minimum', 'priority', 'queue']),
+            mcq('What is the time complexity of inserting into a binary heap?',
+                ['O(log n)', 'O(1)', 'O(n)', 'O(n log n)'],
+                'O(log n)', ['heap', 'insert', 'sift', 'logarithmic']),
+            mcq('What does memoization do?',
+                ['Caches results of function calls to avoid recomputation', 'Frees memory', 'Sorts results', 'Encrypts data'],
+                'Caches results of function calls to avoid recomputation', ['memoization', 'cache', 'subproblems', 'reuse']),
+            mcq('Which algorithm finds shortest paths in an unweighted graph?',
+                ['Breadth-first search', 'Depth-first search', 'Kruskal', 'Prim'],
+                'Breadth-first search', ['bfs', 'shortest', 'unweighted', 'path']),
+            mcq('What is topological sorting used for?',
+                ['Ordering tasks so each comes after its dependencies', 'Sorting numbers', 'Finding cycles in undirected graphs', 'Balancing trees'],
+                'Ordering tasks so each comes after its dependencies', ['topological', 'dependencies', 'dag', 'order']),
+            mcq('Topological sort applies only to which kind of graph?',
+                ['Directed acyclic graph', 'Undirected graph', 'Complete graph', 'Weighted cyclic graph'],
+                'Directed acyclic graph', ['dag', 'directed', 'acyclic', 'topological']),
+            mcq('What is a balanced binary search tree?',
+                ['One whose height stays O(log n)', 'One with equal keys', 'One with only leaves', 'One sorted by insertion time'],
+                'One whose height stays O(log n)', ['balanced', 'height', 'avl', 'red-black']),
+            mcq('What is the two-pointer technique?',
+                ['Moving two indices through a sequence to avoid nested loops', 'Using two arrays', 'Pointer arithmetic in C', 'Doubly linked lists'],
+                'Moving two indices through a sequence to avoid nested loops', ['two', 'pointers', 'indices', 'linear']),
+            mcq('What is the sliding window technique?',
+                ['Maintaining a moving range over a sequence', 'Resizing a GUI window', 'Paging memory', 'Sorting in chunks'],
+                'Maintaining a moving range over a sequence', ['sliding', 'window', 'range', 'subarray']),
+            mcq('Which algorithm finds a minimum spanning tree?',
+                ["Kruskal's algorithm", 'Binary search', 'Bubble sort', 'Floyd cycle detection'],
+                "Kruskal's algorithm", ['minimum', 'spanning', 'tree', 'kruskal']),
+            mcq('What is a trie used for?',
+                ['Storing strings for fast prefix lookups', 'Sorting integers', 'Balancing loads', 'Hashing passwords'],
+                'Storing strings for fast prefix lookups', ['trie', 'prefix', 'strings', 'tree']),
+            mcq('What is the worst-case lookup time in a hash table with many collisions?',
+                ['O(n)', 'O(1)', 'O(log n)', 'O(n²)'],
+                'O(n)', ['hash', 'collisions', 'worst', 'case']),
+            mcq('Which technique detects a cycle in a linked list with O(1) space?',
+                ["Floyd's tortoise and hare", 'Binary search', 'Merge sort', 'Hashing every node'],
+                "Floyd's tortoise and hare", ['cycle', 'floyd', 'slow', 'fast']),
+            mcq('What is the time complexity of building a heap from n elements?',
+                ['O(n)', 'O(n log n)', 'O(n²)', 'O(log n)'],
+                'O(n)', ['heapify', 'build', 'heap', 'linear']),
+            mcq('Which sort is stable and guarantees O(n log n)?',
+                ['Merge sort', 'Quick sort', 'Heap sort', 'Selection sort'],
+                'Merge sort', ['merge', 'stable', 'sort', 'guarantee']),
+            mcq('What is a greedy algorithm?',
+                ['One that makes the locally best choice at each step', 'One that tries every possibility', 'One that uses the most memory', 'One that sorts first'],
+                'One that makes the locally best choice at each step', ['greedy', 'local', 'choice', 'optimal']),
+            mcq('What is backtracking?',
+                ['Building candidates incrementally and abandoning ones that cannot succeed', 'Undoing git commits', 'Reading arrays backwards', 'A type of sorting'],
+                'Building candidates incrementally and abandoning ones that cannot succeed', ['backtracking', 'candidates', 'prune', 'recursion']),
+            text('How does a hash table handle collisions?',
+                 'By chaining entries in per-bucket lists or by open addressing, probing for another free slot',
+                 ['chaining', 'open', 'addressing', 'probing', 'collision']),
+            text('Explain how merge sort works.',
+                 'It splits the array in half, sorts each half recursively and merges the sorted halves in linear time',
+                 ['split', 'merge', 'recursive', 'halves', 'sorted']),
+            text('Compare BFS and DFS and when to use each.',
+                 'BFS explores level by level and finds shortest unweighted paths; DFS goes deep first and suits cycle detection and topological sorting',
+                 ['bfs', 'dfs', 'level', 'shortest', 'depth']),
+            text('How would you find two numbers in an array that add up to a target?',
+                 'Walk the array keeping a hash map of seen values and check whether target minus the current value was seen, in O(n)',
+                 ['hash', 'map', 'complement', 'target', 'linear']),
+            text('Explain how a priority queue can be implemented.',
+                 'With a binary heap, giving O(log n) insert and extract-min and O(1) access to the top element',
+                 ['priority', 'heap', 'insert', 'extract', 'logarithmic']),
+            text('How do you detect a cycle in a directed graph?',
+                 'Run DFS and track nodes on the current recursion stack; reaching one of them again means a cycle',
+                 ['dfs', 'cycle', 'stack', 'visited', 'directed']),
+            text('What is the difference between memoization and tabulation?',
+                 'Memoization caches recursive calls top-down; tabulation fills a table bottom-up from the smallest subproblems',
+                 ['memoization', 'tabulation', 'top-down', 'bottom-up', 'table']),
+            text('How would you check whether a string of brackets is balanced?',
+                 'Push opening brackets onto a stack and pop on each closing bracket, checking it matches; the stack must end empty',
+                 ['stack', 'push', 'pop', 'match', 'brackets']),
+            text('Explain how to find the kth largest element efficiently.',
+                 'Keep a min-heap of size k over the array, or use quickselect for average O(n)',
+                 ['heap', 'quickselect', 'kth', 'partition', 'largest']),
+            text('What is amortized time complexity? Give an example.',
+                 'The average cost per operation over a sequence, such as appends to a dynamic array being O(1) despite occasional resizes',
+                 ['amortized', 'average', 'dynamic', 'array', 'resize'])
+        ],
+        'hard': [
+            text('Design an efficient algorithm for finding the shortest path in a weighted graph.',
+                 "Dijkstra's algorithm or Floyd-Warshall for shortest path in weighted graphs",
+                 ['dijkstra', 'shortest', 'path', 'weighted', 'graph', 'algorithm']),
+            text('Explain how to implement an LRU cache with O(1) operations.',
+                 'Combine a hash map from keys to nodes with a doubly linked list ordered by recency, evicting from the tail',
+                 ['hash', 'map', 'doubly', 'linked', 'evict']),
+            text('How does Bellman-Ford differ from Dijkstra?',
+                 'Bellman-Ford relaxes all edges repeatedly, handles negative weights and detects negative cycles, but runs in O(VE)',
+                 ['bellman-ford', 'negative', 'weights', 'relax', 'cycles']),
+            text('Explain the longest common subsequence problem and its solution.',
+                 'Fill a DP table where each cell holds the LCS length of two prefixes, extending matches diagonally, in O(mn)',
+                 ['lcs', 'dynamic', 'table', 'prefixes', 'subsequence']),
+            text('How does a union-find structure work and where is it used?',
+                 'It tracks disjoint sets with parent pointers, union by rank and path compression, as in Kruskal and connectivity checks',
+                 ['union-find', 'disjoint', 'rank', 'path', 'compression']),
+            text('Explain how to solve the 0/1 knapsack problem.',
+                 'Use DP over items and capacities, choosing for each item the better of skipping it or taking it, in O(nW)',
+                 ['knapsack', 'dynamic', 'capacity', 'items', 'take']),
+            text('How would you find the median of a stream of numbers?',
+                 'Keep a max-heap for the lower half and a min-heap for the upper half, balancing sizes so the median is at the tops',
+                 ['heaps', 'median', 'stream', 'balance', 'halves']),
+            text('Explain how a red-black or AVL tree stays balanced.',
+                 'After inserts and deletes they apply rotations and recolouring or height checks so the height stays O(log n)',
+                 ['rotations', 'balanced', 'height', 'avl', 'red-black']),
+            text('How do you find strongly connected components in a directed graph?',
+                 "Use Tarjan's or Kosaraju's algorithm, both based on depth-first search, in linear time",
+                 ['tarjan', 'kosaraju', 'dfs', 'components', 'strongly']),
+            text('Explain the A* search algorithm.',
+                 'A best-first search ordering nodes by path cost plus an admissible heuristic estimate to the goal',
+                 ['heuristic', 'admissible', 'cost', 'priority', 'goal']),
+            text('How would you design a data structure for autocomplete?',
+                 'A trie of words with top suggestions cached at each node, ranked by frequency',
+                 ['trie', 'prefix', 'ranking', 'frequency', 'cache']),
+            text('Explain the edit distance problem and its complexity.',
+                 'The minimum insertions, deletions and substitutions to turn one string into another, solved with DP in O(mn)',
+                 ['edit', 'distance', 'dynamic', 'insertions', 'substitutions']),
+            text('How would you count inversions in an array efficiently?',
+                 'Modify merge sort to count pairs crossing halves during merging, giving O(n log n)',
+                 ['inversions', 'merge', 'sort', 'count', 'pairs']),
+            text('Explain segment trees and when to use them.',
+                 'A tree over array ranges storing aggregates, answering range queries and point updates in O(log n)',
+                 ['segment', 'tree', 'range', 'queries', 'updates']),
+            text('How would you detect whether a problem needs dynamic programming?',
+                 'Look for optimal substructure and overlapping subproblems, where naive recursion repeats the same work',
+                 ['optimal', 'substructure', 'overlapping', 'subproblems', 'recursion'])
+        ]
+    },
+    'group-discussion': {
+        'easy': [
+            mcq('What is the most important skill in group discussions?',
+                ['Speaking loudly', 'Listening actively', 'Interrupting others', 'Being aggressive'],
+                'Listening actively', ['listening', 'active', 'communication', 'respect', 'understanding']),
+            text('How should you handle disagreements in a group discussion?',
+                 "Present your point respectfully and consider others' perspectives",
+                 ['respectful', 'perspective', 'disagreement', 'constructive', 'collaborative']),
+            mcq('What is the main purpose of a group discussion in a selection process?',
+                ['To assess communication and teamwork', 'To test typing speed', 'To check handwriting', 'To measure memory of facts'],
+                'To assess communication and teamwork', ['assessment', 'communication', 'teamwork', 'selection']),
+            mcq('How should you start speaking in a group discussion?',
+                ['With a clear, relevant point', 'By criticizing others', 'With a long personal story', 'By repeating the topic word for word'],
+                'With a clear, relevant point', ['opening', 'clear', 'relevant', 'point']),
+            mcq('What should you do if you do not know much about the topic?',
+                ['Listen first and build on points made by others', 'Stay silent throughout', 'Change the topic', 'Make up statistics'],
+                'Listen first and build on points made by others', ['listen', 'build', 'contribute', 'honest']),
+            mcq('Which body language shows engagement?',
+                ['Eye contact and an open posture', 'Crossed arms and looking away', 'Checking your phone', 'Leaning back with eyes closed'],
+                'Eye contact and an open posture', ['eye', 'contact', 'posture', 'engagement']),
+            mcq('What is the best way to disagree with someone?',
+                ['Acknowledge their point, then give your reasons', 'Raise your voice', 'Ignore them', 'Laugh at their idea'],
+                'Acknowledge their point, then give your reasons', ['acknowledge', 'reasons', 'respect', 'disagree']),
+            mcq('What does it mean to summarize a discussion?',
+                ['Briefly restate the key points and conclusions', 'Repeat only your own points', 'Introduce a new topic', 'List every sentence said'],
+                'Briefly restate the key points and conclusions', ['summary', 'key', 'points', 'conclusion']),
+            mcq('Which behaviour hurts your performance in a group discussion?',
+                ['Interrupting others repeatedly', 'Asking a quiet member for their view', 'Using examples', 'Staying on topic'],
+                'Interrupting others repeatedly', ['interrupting', 'rude', 'dominate', 'behaviour']),
+            mcq('Why are examples useful in a group discussion?',
+                ['They make points concrete and persuasive', 'They fill time', 'They confuse the group', 'They replace listening'],
+                'They make points concrete and persuasive', ['examples', 'concrete', 'persuasive', 'support']),
+            mcq('What tone is best in a group discussion?',
+                ['Calm and confident', 'Loud and aggressive', 'Sarcastic', 'Hesitant and inaudible'],
+                'Calm and confident', ['tone', 'calm', 'confident', 'voice']),
+            mcq('What should you do when someone makes a good point?',
+                ['Acknowledge it and add to it', 'Ignore it', 'Repeat it as your own', 'Argue against it anyway'],
+                'Acknowledge it and add to it', ['acknowledge', 'build', 'credit', 'collaborate']),
+            mcq('What does staying on topic mean?',
+                ['Keeping contributions relevant to the question discussed', 'Talking about anything', 'Reading notes aloud', 'Speaking only once'],
+                'Keeping contributions relevant to the question discussed', ['relevance', 'topic', 'focus', 'stay']),
+            mcq('How long should each contribution usually be?',
+                ['Short and focused', 'As long as possible', 'A single word', 'Several minutes without pause'],
+                'Short and focused', ['concise', 'brief', 'focused', 'length']),
+            mcq('What is a good way to include a quiet participant?',
+                ['Invite their opinion by name', 'Talk over them', 'Point out that they are quiet', 'Ignore them'],
+                'Invite their opinion by name', ['include', 'invite', 'participation', 'quiet']),
+            mcq('What is active listening?',
+                ['Paying full attention and responding to what was said', 'Waiting for your turn to talk', 'Taking notes without looking up', 'Nodding at everything'],
+                'Paying full attention and responding to what was said', ['active', 'listening', 'attention', 'respond']),
+            mcq('Which of these is a fact rather than an opinion?',
+                ['Water boils at 100°C at sea level', 'Summer is the best season', 'Cats are nicer than dogs', 'Blue is the nicest color'],
+                'Water boils at 100°C at sea level', ['fact', 'opinion', 'evidence', 'verifiable']),
+            mcq('What is the role of a moderator?',
+                ['Keeping the discussion fair, focused and on time', 'Winning the argument', 'Speaking the most', 'Choosing the topic after it ends'],
+                'Keeping the discussion fair, focused and on time', ['moderator', 'fair', 'focus', 'time']),
+            mcq('What should you avoid saying about other participants?',
+                ['Personal remarks', 'Their valid points', 'Their names', 'Questions for them'],
+                'Personal remarks', ['personal', 'remarks', 'respect', 'professional']),
+            mcq('What helps you structure a point clearly?',
+                ['State the point, give a reason, then an example', 'Start with a joke only', 'Use as much jargon as possible', 'Speak without pausing'],
+                'State the point, give a reason, then an example', ['structure', 'point', 'reason', 'example']),
+            mcq('What is consensus?',
+                ['General agreement reached by the group', 'A vote won by one person', 'A list of disagreements', 'The loudest opinion'],
+                'General agreement reached by the group', ['consensus', 'agreement', 'group', 'decision']),
+            mcq("Which phrase politely adds to someone's point?",
+                ['"Building on that, ..."', '"That is wrong."', '"Let me finish first."', '"Anyway, ..."'],
+                '"Building on that, ..."', ['building', 'polite', 'phrase', 'add']),
+            mcq('How should you react if someone interrupts you?',
+                ['Politely ask to finish your point', 'Shout over them', 'Leave the discussion', 'Stop talking for the rest of it'],
+                'Politely ask to finish your point', ['interruption', 'polite', 'finish', 'assertive']),
+            mcq('What is an abstract topic in a group discussion?',
+                ['A topic based on an idea or word rather than facts, like "Red"', 'A topic about current news', 'A technical coding question', 'A case study with data'],
+                'A topic based on an idea or word rather than facts, like "Red"', ['abstract', 'topic', 'creative', 'idea']),
+            mcq('What is a case-based group discussion?',
+                ['Discussing a scenario and recommending a solution', 'Arguing a court case', 'Reading a book aloud', 'Solving a math problem alone'],
+                'Discussing a scenario and recommending a solution', ['case', 'scenario', 'solution', 'analysis']),
+            mcq('Why should you avoid jargon?',
+                ['Not everyone may understand it', 'It makes you sound smart', 'It saves time', 'Evaluators prefer it'],
+                'Not everyone may understand it', ['jargon', 'clarity', 'simple', 'audience']),
+            mcq('What is a good way to prepare for group discussions?',
+                ['Read widely on current affairs and practise speaking', 'Memorize one speech', 'Avoid the news', 'Only practise writing'],
+                'Read widely on current affairs and practise speaking', ['prepare', 'read', 'practise', 'current affairs']),
+            mcq('What do evaluators usually look for?',
+                ['Content, communication, teamwork and leadership', 'Only who speaks the most', 'Only clothing', 'Only accent'],
+                'Content, communication, teamwork and leadership', ['evaluation', 'content', 'teamwork', 'leadership']),
+            mcq('What should you do if the discussion goes off topic?',
+                ['Gently steer it back to the main question', 'Follow the tangent', 'Stop participating', 'Start a separate discussion'],
+                'Gently steer it back to the main question', ['steer', 'topic', 'focus', 'redirect']),
+            mcq('Which shows respect for time limits?',
+                ['Making points concisely', 'Speaking until stopped', 'Repeating points', 'Waiting until the last minute to speak'],
+                'Making points concisely', ['time', 'concise', 'respect', 'limits']),
+            mcq('What is an open-ended question?',
+                ['One that invites explanation rather than yes or no', 'One with a single correct answer', 'One asked at the end', 'One nobody answers'],
+                'One that invites explanation rather than yes or no', ['open-ended', 'question', 'explain', 'invite']),
+            mcq('Why should you use facts and data when possible?',
+                ['They make arguments credible', 'They end the discussion', 'They replace reasoning', 'They are required by rules'],
+                'They make arguments credible', ['facts', 'data', 'credible', 'evidence']),
+            mcq('How should you conclude a group discussion if asked to?',
+                ['Summarize the main views fairly and note any agreement', 'Repeat only your own view', 'Add new arguments', 'Declare a winner'],
+                'Summarize the main views fairly and note any agreement', ['conclude', 'summarize', 'fair', 'agreement']),
+            mcq('What is assertiveness?',
+                ['Stating your view confidently while respecting others', 'Forcing others to agree', 'Never speaking', 'Agreeing with everyone'],
+                'Stating your view confidently while respecting others', ['assertive', 'confident', 'respect', 'views']),
+            mcq('Which is a sign of good teamwork in a discussion?',
+                ['Linking your point to what others said', 'Talking only to the evaluator', 'Ignoring earlier points', 'Repeating yourself'],
+                'Linking your point to what others said', ['teamwork', 'linking', 'collaboration', 'build']),
+            text('Why is listening as important as speaking in a group discussion?',
+                 'Listening lets you respond to what was actually said, build on ideas and keep the discussion coherent',
+                 ['listening', 'respond', 'build', 'ideas', 'coherent']),
+            text('How would you open a group discussion?',
+                 'Define the topic briefly, set out the key angles and offer a clear initial view to give the group direction',
+                 ['define', 'topic', 'angles', 'direction', 'opening']),
+            text('What makes a contribution valuable?',
+                 'It is relevant, adds something new, is supported by a reason or example and moves the discussion forward',
+                 ['relevant', 'new', 'reason', 'example', 'forward']),
+            text('How can you show confidence without dominating?',
+                 'Speak clearly and calmly, make concise points, and leave room for others to respond',
+                 ['confidence', 'clear', 'concise', 'room', 'others']),
+            text('Why should you avoid personal attacks?',
+                 'They shift focus from ideas to people, create hostility and show poor professionalism',
+                 ['personal', 'attacks', 'ideas', 'hostility', 'professional']),
+            text('What should you do if you realize you made a mistake in a point?',
+                 'Acknowledge it briefly, correct it and continue, which shows honesty and maturity',
+                 ['acknowledge', 'correct', 'honesty', 'mistake', 'maturity']),
+            text('How do you prepare for a topic you know little about?',
+                 'Listen carefully at first, ask clarifying questions and relate the topic to general knowledge or experience',
+                 ['listen', 'clarify', 'questions', 'relate', 'experience']),
+            text('What is the difference between a debate and a group discussion?',
+                 'A debate argues fixed sides to win; a group discussion explores views together to reach understanding or a conclusion',
+                 ['debate', 'sides', 'explore', 'together', 'conclusion']),
+            text('How can body language affect a group discussion?',
+                 'Open posture, eye contact and nodding show engagement, while closed or dismissive gestures discourage others',
+                 ['body', 'language', 'eye', 'contact', 'posture']),
+            text('Describe how to summarize a discussion well.',
+                 'Restate the main viewpoints neutrally, highlight agreements and open questions, and keep it brief',
+                 ['summarize', 'neutral', 'agreements', 'viewpoints', 'brief'])
+        ],
+        'medium': [
+            text('Explain the role of a facilitator in group discussions.',
+                 'A facilitator guides the discussion, ensures participation, and maintains focus',
+                 ['facilitator', 'guide', 'participation', 'focus', 'leadership', 'moderation']),
+            mcq('What is groupthink?',
+                ['Conformity that suppresses dissent and critical thinking', 'A brainstorming technique', 'Thinking in groups of two', 'A voting system'],
+                'Conformity that suppresses dissent and critical thinking', ['groupthink', 'conformity', 'dissent', 'bias']),
+            mcq('Which technique helps a group generate many ideas quickly?',
+                ['Brainstorming without judgement', 'Voting on the first idea', 'Debating each idea fully', 'Silent agreement'],
+                'Brainstorming without judgement', ['brainstorming', 'ideas', 'judgement', 'generate']),
+            mcq('What is the best response to a factually wrong claim by a participant?',
+                ['Politely correct it with evidence', 'Mock the participant', 'Ignore it completely', 'Accept it to avoid conflict'],
+                'Politely correct it with evidence', ['correct', 'evidence', 'polite', 'facts']),
+            mcq('What does paraphrasing someone show?',
+                ['That you understood their point', 'That you disagree', 'That you were not listening', 'That you want to end'],
+                'That you understood their point', ['paraphrase', 'understanding', 'listening', 'confirm']),
+            mcq('Which is an example of a leadership behaviour in a group discussion?',
+                ['Proposing a structure for the discussion', 'Speaking the longest', 'Rejecting all ideas', 'Choosing the winner'],
+                'Proposing a structure for the discussion', ['leadership', 'structure', 'direction', 'initiative']),
+            mcq('What is a logical fallacy?',
+                ['An error in reasoning that weakens an argument', 'A true statement', 'A kind of example', 'A summary technique'],
+                'An error in reasoning that weakens an argument', ['fallacy', 'reasoning', 'error', 'argument']),
+            mcq('Attacking the person rather than the argument is called what?',
+                ['Ad hominem', 'Straw man', 'Red herring', 'Slippery slope'],
+                'Ad hominem', ['ad hominem', 'fallacy', 'attack', 'person']),
+            mcq('Misrepresenting an argument to make it easier to attack is called what?',
+                ['Straw man', 'Ad hominem', 'False dilemma', 'Bandwagon'],
+                'Straw man', ['straw man', 'fallacy', 'misrepresent', 'argument']),
+            mcq('Presenting only two options when more exist is called what?',
+                ['False dilemma', 'Red herring', 'Circular reasoning', 'Appeal to authority'],
+                'False dilemma', ['false', 'dilemma', 'fallacy', 'options']),
+            mcq('How can you tell whether your argument is well structured?',
+                ['It has a clear claim, reasons and evidence', 'It is long', 'It uses many quotes', 'It repeats the topic'],
+                'It has a clear claim, reasons and evidence', ['claim', 'reasons', 'evidence', 'structure']),
+            mcq('What should a group do when it cannot reach consensus?',
+                ['Record the main positions and the reasons for them', 'Declare the loudest view correct', 'Stop talking', 'Pick at random'],
+                'Record the main positions and the reasons for them', ['consensus', 'positions', 'record', 'disagreement']),
+            mcq('What is the benefit of diverse viewpoints in a group?',
+                ['They expose blind spots and improve decisions', 'They always slow decisions down', 'They guarantee agreement', 'They remove the need for evidence'],
+                'They expose blind spots and improve decisions', ['diversity', 'viewpoints', 'blind spots', 'decisions']),
+            mcq('How should you handle an emotional topic?',
+                ['Acknowledge feelings and keep to respectful, evidence-based points', 'Avoid speaking at all', 'Match the strongest emotion', 'Dismiss feelings as irrelevant'],
+                'Acknowledge feelings and keep to respectful, evidence-based points', ['emotional', 'respect', 'evidence', 'empathy']),
+            mcq('Which question helps clarify a vague point?',
+                ['"Could you give an example of that?"', '"Why are you wrong?"', '"Can we skip this?"', '"Who agrees with me?"'],
+                '"Could you give an example of that?"', ['clarify', 'question', 'example', 'vague']),
+            mcq("What does playing devil's advocate mean?",
+                ['Arguing the opposite view to test an idea', 'Agreeing with everyone', 'Leading the group', 'Avoiding the topic'],
+                'Arguing the opposite view to test an idea', ["devil's advocate", 'opposite', 'test', 'argument']),
+            mcq('What is the SWOT framework useful for in a case discussion?',
+                ['Structuring strengths, weaknesses, opportunities and threats', 'Timing each speaker', 'Scoring participants', 'Choosing a moderator'],
+                'Structuring strengths, weaknesses, opportunities and threats', ['swot', 'strengths', 'weaknesses', 'framework']),
+            mcq('How do you handle two participants arguing with each other?',
+                ['Acknowledge both views and bring others into the discussion', 'Take one side loudly', 'Wait for them to stop', 'Leave the room'],
+                'Acknowledge both views and bring others into the discussion', ['conflict', 'acknowledge', 'include', 'mediate']),
+            mcq('What is the difference between hearing and listening?',
+                ['Listening involves attention and understanding', 'They are the same', 'Hearing requires more effort', 'Listening is passive'],
+                'Listening involves attention and understanding', ['hearing', 'listening', 'attention', 'understanding']),
+            mcq('What is a good way to respond to a question you cannot answer?',
+                ['Admit it and offer a related point or ask others', 'Invent an answer', 'Change the subject', 'Ignore it'],
+                'Admit it and offer a related point or ask others', ['honest', 'admit', 'related', 'question']),
+            text('How would you handle a participant who keeps going off topic?',
+                 'Acknowledge their point briefly and redirect the group to the main question, perhaps by summarizing where things stand',
+                 ['acknowledge', 'redirect', 'topic', 'summarize', 'focus']),
+            text('How can you add value when others have already made the obvious points?',
+                 'Bring a new angle, such as a stakeholder view, data, an example or a counterargument, or connect existing points',
+                 ['angle', 'stakeholder', 'counterargument', 'connect', 'value']),
+            text('What is the difference between being assertive and being aggressive?',
+                 'Assertive people state views confidently while respecting others; aggressive people push views by dismissing or overpowering others',
+                 ['assertive', 'aggressive', 'respect', 'confident', 'dismiss']),
+            text('How do you balance speaking time in a group discussion?',
+                 'Make concise points, notice who has not spoken and invite them, and avoid repeating yourself',
+                 ['concise', 'invite', 'balance', 'time', 'repeat']),
+            text('Explain how to use evidence effectively in a group discussion.',
+                 'Choose relevant, credible facts or examples, state the source where possible and tie them clearly to your claim',
+                 ['evidence', 'relevant', 'credible', 'source', 'claim']),
+            text('How should you approach a case study discussion?',
+                 'Clarify the problem, identify stakeholders and constraints, weigh options and recommend a justified solution',
+                 ['problem', 'stakeholders', 'constraints', 'options', 'recommend']),
+            text('What are common mistakes people make in group discussions?',
+                 'Interrupting, speaking without substance, ignoring others, going off topic and staying silent throughout',
+                 ['interrupting', 'substance', 'ignoring', 'topic', 'silent']),
+            text('How can you turn a disagreement into a productive discussion?',
+                 'Find common ground, focus on the reasons behind each view and look for options that address both',
+                 ['common', 'ground', 'reasons', 'options', 'productive']),
+            text("Why is it important to give credit to others' ideas?",
+                 'It builds trust and collaboration, and shows evaluators you are listening and working as a team',
+                 ['credit', 'trust', 'collaboration', 'listening', 'team']),
+            text('How would you summarize a discussion with no clear agreement?',
+                 'State the main positions and their strongest reasons fairly, note areas of agreement and what remains open',
+                 ['positions', 'reasons', 'fair', 'agreement', 'open'])
+        ],
+        'hard': [
+            text('Discuss strategies for managing dominant participants in group discussions.',
+                 'Use techniques like direct addressing, time limits, and encouraging others to participate',
+                 ['dominant', 'participants', 'management', 'inclusion', 'balance', 'techniques']),
+            text('How would you lead a group to a decision on a contentious issue?',
+                 'Agree on criteria first, surface all options and concerns, evaluate options against the criteria and check for consent',
+                 ['criteria', 'options', 'concerns', 'evaluate', 'consent']),
+            text('How do cognitive biases affect group decisions, and how can they be reduced?',
+                 "Anchoring, confirmation bias and groupthink skew decisions; counter them with diverse views, devil's advocates and evidence",
+                 ['bias', 'anchoring', 'confirmation', 'groupthink', 'diverse']),
+            text('Discuss the ethics of artificial intelligence replacing human jobs.',
+                 'Weigh productivity gains against displacement, and discuss reskilling, safety nets and fair distribution of benefits',
+                 ['automation', 'displacement', 'reskilling', 'ethics', 'distribution']),
+            text('How would you argue both sides of "Social media does more harm than good"?',
+                 'Harms include misinformation and mental health effects; benefits include connection, information access and voice for the unheard',
+                 ['misinformation', 'mental', 'health', 'connection', 'access']),
+            text('How do you keep a discussion evidence-based when emotions run high?',
+                 'Acknowledge feelings, ask for sources and examples, separate facts from opinions and return to the question',
+                 ['emotions', 'evidence', 'sources', 'facts', 'opinions']),
+            text('Discuss whether remote work is better than office work.',
+                 'Remote work offers flexibility and focus; offices aid collaboration and culture; hybrid models try to balance both',
+                 ['remote', 'flexibility', 'collaboration', 'culture', 'hybrid']),
+            text('How would you structure a discussion on a broad topic like climate change?',
+                 'Break it into causes, impacts and solutions, consider economic, social and policy angles, and aim for concrete actions',
+                 ['structure', 'causes', 'impacts', 'solutions', 'policy']),
+            text('How can you demonstrate leadership without formally leading?',
+                 'Propose structure, summarize progress, involve quiet members and steer the group towards a conclusion',
+                 ['leadership', 'structure', 'summarize', 'involve', 'steer']),
+            text('Discuss the trade-offs between economic growth and environmental protection.',
+                 'Growth raises living standards but can degrade the environment; sustainable policies, green technology and carbon pricing can reconcile them',
+                 ['growth', 'environment', 'sustainable', 'technology', 'pricing']),
+            text('How would you respond if the group quickly agrees on a weak idea?',
+                 "Ask probing questions about risks and alternatives, play devil's advocate and propose criteria for testing it",
+                 ['probing', 'risks', 'alternatives', 'groupthink', 'criteria']),
+            text('Discuss whether privacy should be traded for national security.',
+                 'Security needs must be weighed against civil liberties, with oversight, proportionality and transparency as safeguards',
+                 ['privacy', 'security', 'liberties', 'oversight', 'proportionality']),
+            text('How do cultural differences affect communication in diverse groups?',
+                 'Norms about directness, turn-taking and hierarchy differ; awareness, patience and clarifying questions prevent misunderstandings',
+                 ['cultural', 'directness', 'hierarchy', 'awareness', 'misunderstandings']),
+            text('Discuss whether higher education should be free.',
+                 'Free education widens access and social mobility but costs taxpayers; targeted aid and quality concerns are key counterpoints',
+                 ['access', 'mobility', 'cost', 'aid', 'quality']),
+            text('How would you evaluate your own performance after a group discussion?',
+                 'Reflect on the relevance and clarity of your points, how you listened and included others, and what you would change',
+                 ['reflect', 'relevance', 'clarity', 'listening', 'improve'])
+        ]
+    },
+    'cloud-computing': {
+        'easy': [
+            mcq('What is cloud computing?',
+                ['Computing in the sky', 'Delivering computing services over the internet', 'Using only local computers', 'Storing data on CDs'],
+                'Delivering computing services over the internet', ['cloud', 'internet', 'services', 'computing', 'delivery', 'remote']),
+            mcq('What are the main types of cloud services?',
+                ['IaaS, PaaS, SaaS', 'Hardware, Software, Network', 'Public, Private, Hybrid', 'All of the above'],
+                'IaaS, PaaS, SaaS', ['iaas', 'paas', 'saas', 'infrastructure', 'platform', 'software']),
+            mcq('What does IaaS stand for?',
+                ['Infrastructure as a Service', 'Internet as a Service', 'Integration as a Service', 'Information as a Service'],
+                'Infrastructure as a Service', ['iaas', 'infrastructure', 'virtual', 'machines']),
+            mcq('What does SaaS stand for?',
+                ['Software as a Service', 'Storage as a Service', 'Security as a Service', 'Server as a Service'],
+                'Software as a Service', ['saas', 'software', 'subscription', 'hosted']),
+            mcq('What does PaaS stand for?',
+                ['Platform as a Service', 'Programs as a Service', 'Processing as a Service', 'Packages as a Service'],
+                'Platform as a Service', ['paas', 'platform', 'deploy', 'runtime']),
+            mcq('Which is an example of SaaS?',
+                ['Web-based email such as Gmail', 'A rented virtual machine', 'A physical server', 'A local text editor'],
+                'Web-based email such as Gmail', ['saas', 'email', 'web', 'application']),
+            mcq('Which company runs Amazon Web Services?',
+                ['Amazon', 'Microsoft', 'Google', 'IBM'],
+                'Amazon', ['aws', 'amazon', 'provider', 'cloud']),
+            mcq('Which cloud platform is run by Microsoft?',
+                ['Azure', 'AWS', 'Google Cloud', 'Heroku'],
+                'Azure', ['azure', 'microsoft', 'provider', 'cloud']),
+            mcq('What is a public cloud?',
+                ['Cloud services offered to many customers over the internet', 'A cloud owned by one company for itself', 'A free Wi-Fi network', 'A local data center only'],
+                'Cloud services offered to many customers over the internet', ['public', 'shared', 'provider', 'internet']),
+            mcq('What is a private cloud?',
+                ['Cloud infrastructure dedicated to one organization', 'A cloud with no internet access', 'A personal laptop', 'A public file share'],
+                'Cloud infrastructure dedicated to one organization', ['private', 'dedicated', 'organization', 'control']),
+            mcq('What is a hybrid cloud?',
+                ['A mix of public and private cloud environments', 'Two public clouds', 'A cloud that runs on batteries', 'A cloud without servers'],
+                'A mix of public and private cloud environments', ['hybrid', 'public', 'private', 'mix']),
+            mcq('What is a virtual machine?',
+                ['A software emulation of a computer', 'A physical server', 'A network cable', 'A type of database'],
+                'A software emulation of a computer', ['virtual', 'machine', 'hypervisor', 'emulation']),
+            mcq('What does scalability mean in the cloud?',
+                ['The ability to add or remove resources as demand changes', 'The speed of a single CPU', 'The size of a hard drive', 'The number of users on a laptop'],
+                'The ability to add or remove resources as demand changes', ['scalability', 'resources', 'demand', 'grow']),
+            mcq('What does pay-as-you-go pricing mean?',
+                ['Paying only for the resources you use', 'Paying a fixed fee forever', 'Paying upfront for hardware', 'Paying nothing'],
+                'Paying only for the resources you use', ['pay-as-you-go', 'usage', 'billing', 'cost']),
+            mcq('What is cloud storage?',
+                ['Storing data on servers accessed over the internet', 'Storing data on a USB stick', 'Printing documents', 'Saving files in RAM'],
+                'Storing data on servers accessed over the internet', ['storage', 'files', 'online', 'servers']),
+            mcq('Which AWS service provides object storage?',
+                ['S3', 'EC2', 'Lambda', 'RDS'],
+                'S3', ['s3', 'object', 'storage', 'buckets']),
+            mcq('Which AWS service provides virtual servers?',
+                ['EC2', 'S3', 'CloudFront', 'SNS'],
+                'EC2', ['ec2', 'virtual', 'servers', 'instances']),
+            mcq('What is a data center?',
+                ['A facility housing servers and networking equipment', 'A spreadsheet of data', 'A central database table', 'A help desk'],
+                'A facility housing servers and networking equipment', ['data', 'center', 'servers', 'facility']),
+            mcq('What is a region in cloud computing?',
+                ['A geographic area containing data centers', 'A network cable', 'A billing plan', 'A programming language'],
+                'A geographic area containing data centers', ['region', 'geographic', 'data centers', 'location']),
+            mcq('What is an availability zone?',
+                ['An isolated data center location within a region', 'A time zone', 'A billing account', 'A security password'],
+                'An isolated data center location within a region', ['availability', 'zone', 'isolated', 'region']),
+            mcq('What is a benefit of the cloud for small businesses?',
+                ['No need to buy and maintain servers upfront', 'Unlimited free resources', 'No internet required', 'No security responsibilities at all'],
+                'No need to buy and maintain servers upfront', ['cost', 'upfront', 'maintenance', 'benefit']),
+            mcq('What is a backup?',
+                ['A copy of data kept to restore after loss', 'A faster server', 'A network firewall', 'A deleted file'],
+                'A copy of data kept to restore after loss', ['backup', 'copy', 'restore', 'recovery']),
+            mcq('What is serverless computing?',
+                ['Running code without managing servers yourself', 'Computing without any servers at all', 'Working offline', 'Using only mobile devices'],
+                'Running code without managing servers yourself', ['serverless', 'functions', 'managed', 'lambda']),
+            mcq('Which is an example of a serverless service?',
+                ['AWS Lambda', 'A physical rack server', 'A desktop PC', 'A network switch'],
+                'AWS Lambda', ['lambda', 'serverless', 'functions', 'aws']),
+            mcq('What does elasticity mean in the cloud?',
+                ['Automatically scaling resources up and down with load', 'Stretching network cables', 'Using flexible pricing only', 'Keeping resources fixed'],
+                'Automatically scaling resources up and down with load', ['elasticity', 'automatic', 'scaling', 'load']),
+            mcq('What is multi-tenancy?',
+                ['Many customers sharing the same infrastructure securely', 'Many servers in one room', 'One user with many accounts', 'Renting an office'],
+                'Many customers sharing the same infrastructure securely', ['multi-tenancy', 'shared', 'customers', 'isolation']),
+            mcq('Who is responsible for physical data center security in the public cloud?',
+                ['The cloud provider', 'The customer', 'The end user', 'No one'],
+                'The cloud provider', ['shared', 'responsibility', 'provider', 'physical']),
+            mcq('What is a cloud provider?',
+                ['A company that offers cloud computing services', 'An internet browser', 'A programming language', 'A hardware store'],
+                'A company that offers cloud computing services', ['provider', 'company', 'services', 'cloud']),
+            mcq('What is a load balancer?',
+                ['A service that spreads traffic across servers', 'A tool that weighs hardware', 'A backup system', 'A type of storage'],
+                'A service that spreads traffic across servers', ['load', 'balancer', 'traffic', 'distribute']),
+            mcq('What is uptime?',
+                ['The time a service is available and working', 'The time to start a computer', 'The time zone of a server', 'The time to upload a file'],
+                'The time a service is available and working', ['uptime', 'availability', 'service', 'sla']),
+            mcq('What does SLA stand for?',
+                ['Service Level Agreement', 'System Load Allocation', 'Secure Login Access', 'Server Lease Arrangement'],
+                'Service Level Agreement', ['sla', 'service', 'agreement', 'availability']),
+            mcq("What is Google's cloud platform called?",
+                ['Google Cloud Platform', 'Google Drive Server', 'Google Compute Box', 'Google Hosting Cloud'],
+                'Google Cloud Platform', ['gcp', 'google', 'cloud', 'provider']),
+            mcq('What is a container?',
+                ['A lightweight package of an application and its dependencies', 'A storage box in a data center', 'A virtual network', 'A database table'],
+                'A lightweight package of an application and its dependencies', ['container', 'docker', 'package', 'dependencies']),
+            mcq('Which tool is widely used to build and run containers?',
+                ['Docker', 'Excel', 'Photoshop', 'Outlook'],
+                'Docker', ['docker', 'containers', 'images', 'runtime']),
+            mcq('What is data encryption?',
+                ['Encoding data so only authorized parties can read it', 'Compressing data', 'Deleting data', 'Copying data'],
+                'Encoding data so only authorized parties can read it', ['encryption', 'keys', 'security', 'confidential']),
+            text('Explain the difference between IaaS, PaaS and SaaS.',
+                 'IaaS provides virtual infrastructure, PaaS provides a managed platform to deploy code, and SaaS provides finished applications',
+                 ['iaas', 'paas', 'saas', 'infrastructure', 'applications']),
+            text('What are the advantages of cloud storage over local storage?',
+                 'Access from anywhere, built-in redundancy, easy sharing and scaling without buying hardware',
+                 ['access', 'redundancy', 'sharing', 'scaling', 'hardware']),
+            text('What is the difference between public and private clouds?',
+                 'Public clouds share provider infrastructure among many customers; private clouds are dedicated to one organization',
+                 ['public', 'private', 'shared', 'dedicated', 'organization']),
+            text('Why do companies move to the cloud?',
+                 'To cut upfront costs, scale on demand, speed up delivery and reduce the work of maintaining hardware',
+                 ['costs', 'scale', 'demand', 'speed', 'maintenance']),
+            text('What is virtualization?',
+                 'Running several virtual machines on one physical host, with a hypervisor sharing its resources between them',
+                 ['virtualization', 'hypervisor', 'virtual', 'machines', 'host']),
+            text('What are some risks of using cloud services?',
+                 'Outages, data breaches, vendor lock-in, unexpected costs and compliance issues',
+                 ['outages', 'breaches', 'lock-in', 'costs', 'compliance']),
+            text('Explain what auto-scaling does.',
+                 'It adds or removes instances automatically based on metrics like CPU load or request rate',
+                 ['auto-scaling', 'instances', 'metrics', 'load', 'automatic']),
+            text('Why are backups important in the cloud?',
+                 'Data can still be lost through deletion, corruption or attacks, so backups allow recovery',
+                 ['backups', 'recovery', 'deletion', 'corruption', 'attacks']),
+            text('What is the shared responsibility model?',
+                 'The provider secures the underlying infrastructure, while the customer secures their data, access and configuration',
+                 ['shared', 'responsibility', 'provider', 'customer', 'security']),
+            text('What is the difference between a virtual machine and a container?',
+                 'A virtual machine runs a full guest operating system; a container shares the host kernel and packages only the app and its dependencies',
+                 ['virtual', 'machine', 'container', 'kernel', 'operating system'])
+        ],
+        'medium': [
+            text('Explain the benefits of cloud computing for businesses.',
+                 'Cost reduction, scalability, flexibility, and reduced maintenance overhead',
+                 ['cost', 'scalability', 'flexibility', 'maintenance', 'benefits', 'business']),
+            mcq('What is Kubernetes?',
+                ['A platform that orchestrates containers', 'A container image format', 'A cloud provider', 'A programming language'],
+                'A platform that orchestrates containers', ['kubernetes', 'orchestration', 'containers', 'pods']),
+            mcq('What is the smallest deployable unit in Kubernetes?',
+                ['Pod', 'Node', 'Cluster', 'Namespace'],
+                'Pod', ['pod', 'kubernetes', 'containers', 'unit']),
+            mcq('What is Infrastructure as Code?',
+                ['Managing infrastructure with versioned configuration files', 'Writing code on servers directly', 'Hardware programming', 'Documenting servers by hand'],
+                'Managing infrastructure with versioned configuration files', ['iac', 'terraform', 'configuration', 'versioned']),
+            mcq('Which tool is commonly used for Infrastructure as Code?',
+                ['Terraform', 'Slack', 'Figma', 'Jira'],
+                'Terraform', ['terraform', 'iac', 'provisioning', 'declarative']),
+            mcq('What does IAM stand for in cloud security?',
+                ['Identity and Access Management', 'Internet Access Monitor', 'Instance Allocation Manager', 'Integrated Application Module'],
+                'Identity and Access Management', ['iam', 'identity', 'access', 'permissions']),
+            mcq('What is the principle of least privilege?',
+                ['Granting only the permissions needed for a task', 'Giving everyone admin access', 'Denying all access', 'Sharing one account'],
+                'Granting only the permissions needed for a task', ['least', 'privilege', 'permissions', 'security']),
+            mcq('What is a VPC?',
+                ['A logically isolated virtual network in the cloud', 'A virtual PC', 'A video processing cluster', 'A payment card'],
+                'A logically isolated virtual network in the cloud', ['vpc', 'network', 'isolated', 'subnets']),
+            mcq('What is object storage best suited for?',
+                ['Large amounts of unstructured data like files and media', 'Low-latency block devices for databases', 'CPU-heavy computation', 'Real-time messaging'],
+                'Large amounts of unstructured data like files and media', ['object', 'storage', 'unstructured', 'media']),
+            mcq('What is a CDN used for in the cloud?',
+                ['Caching content near users to reduce latency', 'Running databases', 'Managing passwords', 'Building containers'],
+                'Caching content near users to reduce latency', ['cdn', 'edge', 'cache', 'latency']),
+            mcq('What is horizontal scaling?',
+                ['Adding more machines', 'Adding more CPU to one machine', 'Reducing the number of users', 'Upgrading the network card only'],
+                'Adding more machines', ['horizontal', 'scale out', 'machines', 'instances']),
+            mcq('What is vertical scaling?',
+                ['Adding more resources to a single machine', 'Adding more machines', 'Splitting a database', 'Caching pages'],
+                'Adding more resources to a single machine', ['vertical', 'scale up', 'resources', 'machine']),
+            mcq('What is a managed database service?',
+                ['A database whose operations like backups and patching are run by the provider', 'A spreadsheet', 'A database on your laptop', 'A read-only archive'],
+                'A database whose operations like backups and patching are run by the provider', ['managed', 'database', 'backups', 'patching']),
+            mcq('What does RTO stand for in disaster recovery?',
+                ['Recovery Time Objective', 'Redundant Task Operation', 'Real-Time Output', 'Remote Transfer Option'],
+                'Recovery Time Objective', ['rto', 'recovery', 'time', 'objective']),
+            mcq('What does RPO stand for in disaster recovery?',
+                ['Recovery Point Objective', 'Remote Process Owner', 'Redundant Power Outlet', 'Resource Planning Option'],
+                'Recovery Point Objective', ['rpo', 'recovery', 'point', 'data loss']),
+            mcq('What is vendor lock-in?',
+                ['Dependence on one provider that makes switching costly', 'A security lock on servers', 'A discount contract', 'A type of encryption'],
+                'Dependence on one provider that makes switching costly', ['lock-in', 'vendor', 'switching', 'dependence']),
+            mcq('What is a cold start in serverless computing?',
+                ['Extra latency when a new function instance is initialized', 'A server in a cold room', 'Restarting a laptop', 'A failed deployment'],
+                'Extra latency when a new function instance is initialized', ['cold', 'start', 'latency', 'serverless']),
+            mcq('What is a message queue used for?',
+                ['Decoupling services with asynchronous messages', 'Storing images', 'Running SQL queries', 'Encrypting traffic'],
+                'Decoupling services with asynchronous messages', ['queue', 'asynchronous', 'decoupling', 'messages']),
+            mcq('What is CI/CD?',
+                ['Continuous integration and continuous delivery of code', 'Cloud infrastructure and cloud databases', 'Central identity and central directory', 'Code inspection and code deletion'],
+                'Continuous integration and continuous delivery of code', ['ci/cd', 'integration', 'delivery', 'pipeline']),
+            mcq('What is block storage typically used for?',
+                ['Disks attached to virtual machines and databases', 'Static website hosting', 'Email delivery', 'Content caching'],
+                'Disks attached to virtual machines and databases', ['block', 'storage', 'volumes', 'disks']),
+            text('Compare horizontal and vertical scaling.',
+                 'Vertical scaling adds resources to one machine and hits hardware limits; horizontal scaling adds machines and needs load balancing',
+                 ['horizontal', 'vertical', 'machines', 'limits', 'load balancing']),
+            text('What is Infrastructure as Code and why use it?',
+                 'Defining infrastructure in version-controlled files makes environments reproducible, reviewable and automated',
+                 ['infrastructure', 'code', 'reproducible', 'version', 'automated']),
+            text('How do containers and Kubernetes help deployments?',
+                 'Containers package apps consistently, and Kubernetes schedules, scales and restarts them across a cluster',
+                 ['containers', 'kubernetes', 'schedule', 'scale', 'cluster']),
+            text('How would you control cloud costs?',
+                 'Right-size instances, use auto-scaling, reserved or spot instances, delete idle resources and monitor spending with budgets',
+                 ['right-size', 'reserved', 'spot', 'idle', 'budgets']),
+            text('Explain how a load balancer improves availability.',
+                 'It spreads traffic across healthy instances and stops sending requests to failed ones, found by health checks',
+                 ['load', 'balancer', 'health', 'checks', 'availability']),
+            text('What is the difference between RTO and RPO?',
+                 'RTO is how quickly a service must be restored; RPO is how much data loss, measured in time, is acceptable',
+                 ['rto', 'rpo', 'restore', 'data loss', 'time']),
+            text('How does IAM help secure cloud resources?',
+                 'It defines identities and roles with fine-grained policies so each user or service gets only the access it needs',
+                 ['iam', 'roles', 'policies', 'least', 'privilege']),
+            text('Explain the pros and cons of serverless functions.',
+                 'They scale automatically and cost nothing when idle, but have cold starts, time limits and less control over the runtime',
+                 ['serverless', 'scale', 'idle', 'cold', 'limits']),
+            text('What is a multi-region deployment and why use one?',
+                 'Running the service in several regions improves resilience to regional outages and lowers latency for distant users',
+                 ['multi-region', 'resilience', 'outages', 'latency', 'regions']),
+            text('How do you secure data stored in the cloud?',
+                 'Encrypt it at rest and in transit, restrict access with IAM, manage keys carefully and audit access logs',
+                 ['encrypt', 'rest', 'transit', 'keys', 'audit'])
+        ],
+        'hard': [
+            text('Discuss cloud security challenges and mitigation strategies.',
+                 'Security challenges include data breaches, compliance, and access control; mitigation involves encryption and monitoring',
+                 ['security', 'challenges', 'encryption', 'monitoring', 'compliance', 'access control']),
+            text('How would you design a highly available web application on the cloud?',
+                 'Run stateless instances across availability zones behind a load balancer, with a replicated database, health checks and auto-scaling',
+                 ['availability', 'zones', 'load balancer', 'replicated', 'auto-scaling']),
+            text('Explain the CAP theorem and its relevance to cloud databases.',
+                 'During a network partition a distributed system must choose between consistency and availability, which shapes database design',
+                 ['cap', 'consistency', 'availability', 'partition', 'distributed']),
+            text('How would you plan a migration of a legacy application to the cloud?',
+                 'Assess dependencies, choose rehost, replatform or refactor per component, migrate in phases with testing and a rollback plan',
+                 ['assess', 'rehost', 'refactor', 'phases', 'rollback']),
+            text('Explain eventual consistency and how applications cope with it.',
+                 'Replicas converge over time rather than instantly, so apps use idempotent operations, versioning and read-your-writes where needed',
+                 ['eventual', 'consistency', 'replicas', 'idempotent', 'versioning']),
+            text('How would you design disaster recovery for a critical system?',
+                 'Set RTO and RPO targets, replicate data to another region, automate failover and test recovery regularly',
+                 ['disaster', 'recovery', 'replicate', 'failover', 'test']),
+            text('Discuss the trade-offs of a multi-cloud strategy.',
+                 'It reduces lock-in and can improve resilience, but increases complexity, skills needed and integration costs',
+                 ['multi-cloud', 'lock-in', 'resilience', 'complexity', 'costs']),
+            text('How would you implement zero-trust security in a cloud environment?',
+                 'Verify every request with strong identity, enforce least privilege, segment networks and continuously monitor, trusting no network location',
+                 ['zero-trust', 'identity', 'least', 'privilege', 'segmentation']),
+            text('Explain how you would observe and debug a distributed cloud system.',
+                 'Collect metrics, structured logs and distributed traces with correlation ids, and alert on service level objectives',
+                 ['metrics', 'logs', 'tracing', 'correlation', 'alerts']),
+            text('How would you handle a sudden 10x traffic spike?',
+                 'Rely on auto-scaling and caching, use queues to absorb bursts, shed or rate-limit load and protect the database',
+                 ['auto-scaling', 'caching', 'queues', 'rate-limit', 'database']),
+            text('Explain the design of an event-driven architecture in the cloud.',
+                 'Services publish events to a broker and others subscribe asynchronously, giving loose coupling but needing idempotency and ordering care',
+                 ['event-driven', 'broker', 'publish', 'subscribe', 'idempotency']),
+            text('How do you design a multi-tenant SaaS system securely?',
+                 'Isolate tenant data by schema, database or row-level security, scope every query and credential to the tenant and audit access',
+                 ['multi-tenant', 'isolation', 'tenant', 'row-level', 'audit']),
+            text('Discuss the challenges of managing secrets in the cloud.',
+                 'Secrets must stay out of code and images, live in a secrets manager, be rotated regularly and be accessed with least privilege',
+                 ['secrets', 'manager', 'rotation', 'least', 'privilege']),
+            text('How would you design a data pipeline for large-scale analytics in the cloud?',
+                 'Ingest via streaming or batch into object storage, process with scalable compute, load a warehouse and orchestrate with monitoring',
+                 ['ingest', 'streaming', 'object storage', 'warehouse', 'orchestrate']),
+            text('Explain the trade-offs between containers and serverless for a new service.',
+                 'Containers give control and suit steady workloads; serverless removes operations and suits spiky, event-driven work but limits runtime and adds cold starts',
+                 ['containers', 'serverless', 'control', 'cold starts', 'workloads'])
+        ]
+    }
+}
+
+
+def sample_question_bank():
+    """A fresh copy of the built-in sample bank, with ids numbered from 1"""
+    bank = copy.deepcopy(POOLS)
+    next_id = 1
+    for difficulties in bank.values():
+        for difficulty, questions in difficulties.items():
+            difficulties[difficulty] = [{'id': next_id + i, **question} for i, question in enumerate(questions)]
+            next_id += len(questions)
+    return bank
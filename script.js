@@ -289,6 +289,14 @@ class InterviewMaster {
     }
 
     logout() {
+        const token = localStorage.getItem('authToken');
+        if (token) {
+            // Revoke the server-side session; nothing to wait for
+            fetch('/api/logout', {
+                method: 'POST',
+                headers: { 'Authorization': `Bearer ${token}` }
+            }).catch(() => {});
+        }
         localStorage.removeItem('authToken');
         this.currentUser = null;
         document.getElementById('authContainer').style.display = 'block';
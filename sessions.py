@@ -0,0 +1,82 @@
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+
+class SessionStore:
+    """Maps login tokens to emails, with a fixed time-to-live.
+
+    Lookups are a single dict access. Every session lives for the same
+    `ttl`, so insertion order is expiry order and eviction only ever has to
+    look at the oldest entries.
+
+    With `db_file`, sessions live in SQLite instead, so they survive a
+    restart and are shared between worker processes. Lookups then go to the
+    database every time (one primary-key read) rather than to a per-process
+    copy, so a logout in one worker takes effect in all of them.
+    """
+
+    def __init__(self, ttl, db_file=None):
+        self.ttl = ttl
+        self.db_file = db_file
+        self._lock = threading.Lock()
+        self._sessions = OrderedDict()
+        self._local = threading.local()
+        if db_file:
+            self._connect().execute(
+                'CREATE TABLE IF NOT EXISTS sessions ('
+                'token TEXT PRIMARY KEY, email TEXT NOT NULL, expires REAL NOT NULL)'
+            )
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    def _evict_expired(self, now):
+        while self._sessions:
+            token, (_, expires) = next(iter(self._sessions.items()))
+            if expires > now:
+                break
+            del self._sessions[token]
+
+    def create(self, email):
+        token = str(uuid.uuid4())
+        now = time.time()
+        expires = now + self.ttl
+        if self.db_file:
+            conn = self._connect()
+            conn.execute('INSERT INTO sessions (token, email, expires) VALUES (?, ?, ?)', (token, email, expires))
+            conn.execute('DELETE FROM sessions WHERE expires <= ?', (now,))
+            return token
+        with self._lock:
+            self._evict_expired(now)
+            self._sessions[token] = (email, expires)
+        return token
+
+    def get(self, token):
+        """Return the email for a live token, or None"""
+        if self.db_file:
+            session = self._connect().execute(
+                'SELECT email, expires FROM sessions WHERE token = ?', (token,)
+            ).fetchone()
+        else:
+            session = self._sessions.get(token)
+        if session is None:
+            return None
+        email, expires = session
+        if expires <= time.time():
+            self.revoke(token)
+            return None
+        return email
+
+    def revoke(self, token):
+        with self._lock:
+            self._sessions.pop(token, None)
+        if self.db_file:
+            self._connect().execute('DELETE FROM sessions WHERE token = ?', (token,))
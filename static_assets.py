@@ -0,0 +1,160 @@
+import gzip
+import hashlib
+import os
+import re
+import threading
+import time
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+MIMETYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.js': 'text/javascript; charset=utf-8',
+}
+
+
+class Asset:
+    """One file held in memory with its fingerprint and compressed variants"""
+
+    __slots__ = ('name', 'mimetype', 'digest', 'url', 'bodies')
+
+    def __init__(self, name, data, url_prefix):
+        stem, ext = os.path.splitext(name)
+        self.name = name
+        self.mimetype = MIMETYPES.get(ext, 'application/octet-stream')
+        self.digest = hashlib.sha256(data).hexdigest()[:16]
+        self.url = f'{url_prefix}{stem}.{self.digest}{ext}'
+        # Smallest first, so negotiation can take the first one accepted
+        self.bodies = {}
+        if brotli is not None:
+            self.bodies['br'] = brotli.compress(data, quality=11)
+        self.bodies['gzip'] = gzip.compress(data, compresslevel=9, mtime=0)
+        self.bodies['identity'] = data
+
+    def etag(self, encoding):
+        return self.digest if encoding == 'identity' else f'{self.digest}-{encoding}'
+
+    def negotiate(self, accept_encoding):
+        """Pick (encoding, body) for an Accept-Encoding header"""
+        accepted = set()
+        for part in (accept_encoding or '').split(','):
+            coding, *params = part.split(';')
+            quality = 1.0
+            for param in params:
+                key, _, value = param.partition('=')
+                if key.strip() == 'q':
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            if quality > 0:
+                accepted.add(coding.strip().lower())
+        for encoding, body in self.bodies.items():
+            if encoding == 'identity' or encoding in accepted or '*' in accepted:
+                return encoding, body
+
+    def matches(self, if_none_match):
+        """True if an If-None-Match header names any variant of this content"""
+        for tag in (if_none_match or '').split(','):
+            tag = tag.strip()
+            if tag == '*':
+                return True
+            if tag.startswith('W/'):
+                tag = tag[2:]
+            if tag.strip('"').split('-')[0] == self.digest:
+                return True
+        return False
+
+
+class StaticAssets:
+    """Serves a fixed set of front-end files from memory, ready to send.
+
+    Each file is read once, fingerprinted with a hash of its contents, and
+    compressed ahead of time with gzip (and brotli, when installed), so a
+    request never touches the disk or a compressor. References to the other
+    assets inside `pages` are rewritten to their fingerprinted URLs, which can
+    then be cached forever: a changed file gets a new URL.
+
+    Files are reloaded when their mtime or size changes, checked at most once
+    every `check_interval` seconds.
+    """
+
+    def __init__(self, root, names, pages=(), url_prefix='/assets/', check_interval=1.0):
+        self.root = root
+        self.names = tuple(names)
+        self.pages = tuple(pages)
+        self.url_prefix = url_prefix
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._signature = None
+        self._assets = {}
+        self._by_url = {}
+        self._last_check = 0.0
+
+    def _file_signature(self):
+        signature = []
+        for name in self.names + self.pages:
+            try:
+                stat = os.stat(os.path.join(self.root, name))
+            except FileNotFoundError:
+                signature.append(None)
+                continue
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _read(self, name):
+        with open(os.path.join(self.root, name), 'rb') as f:
+            return f.read()
+
+    def _build(self):
+        assets = {}
+        for name in self.names:
+            if os.path.exists(os.path.join(self.root, name)):
+                assets[name] = Asset(name, self._read(name), self.url_prefix)
+        if assets:
+            pattern = re.compile(
+                rb'''(["'])/?(''' + b'|'.join(re.escape(name.encode()) for name in assets) + rb''')\1'''
+            )
+        for name in self.pages:
+            if not os.path.exists(os.path.join(self.root, name)):
+                continue
+            data = self._read(name)
+            if assets:
+                data = pattern.sub(
+                    lambda match: match.group(1) + assets[match.group(2).decode()].url.encode() + match.group(1),
+                    data,
+                )
+            assets[name] = Asset(name, data, self.url_prefix)
+        return assets
+
+    def refresh(self, force=False):
+        now = time.monotonic()
+        if not force and now - self._last_check < self.check_interval:
+            return
+        self._last_check = now
+
+        signature = self._file_signature()
+        if signature == self._signature:
+            return
+        with self._lock:
+            signature = self._file_signature()
+            if signature == self._signature:
+                return
+            assets = self._build()
+            self._assets = assets
+            self._by_url = {asset.url: asset for asset in assets.values()}
+            self._signature = signature
+
+    def get(self, name):
+        """Return the current Asset for a file name, or None"""
+        self.refresh()
+        return self._assets.get(name)
+
+    def by_url(self, url):
+        """Return the Asset a fingerprinted URL points at, or None if it is not current"""
+        self.refresh()
+        return self._by_url.get(url)
@@ -0,0 +1,580 @@
+import json
+import sqlite3
+import threading
+
+from event_log import EventLog
+from filestore import read_json, update_json
+
+# Scores at or above this count towards a user's streak
+STREAK_THRESHOLD = 70
+
+
+def empty_user_stats():
+    return {'credits': 0, 'score_total': 0, 'count': 0, 'current_streak': 0, 'best_streak': 0}
+
+
+def accumulate_user_stats(stats, interview):
+    """Fold one completed interview into a user's running aggregates"""
+    score = interview.get('score', 0)
+    stats['credits'] += interview.get('creditsEarned', 0)
+    stats['score_total'] += score
+    stats['count'] += 1
+    if score >= STREAK_THRESHOLD:
+        stats['current_streak'] += 1
+        stats['best_streak'] = max(stats['best_streak'], stats['current_streak'])
+    else:
+        stats['current_streak'] = 0
+    return stats
+
+
+def compute_user_stats(interviews):
+    """Aggregate a full interview history from scratch"""
+    stats = empty_user_stats()
+    for interview in interviews:
+        accumulate_user_stats(stats, interview)
+    return stats
+
+
+def user_record_stats(stats):
+    """The stats fields of a user record, derived from their aggregates"""
+    count = stats['count']
+    return {
+        'credits': stats['credits'],
+        'interviewsCompleted': count,
+        'accuracy': round(stats['score_total'] / count) if count > 0 else 0,
+        'streak': stats['current_streak'],
+    }
+
+
+class Storage:
+    """Interface shared by the storage backends.
+
+    Users are keyed by email. Progress is the per-user, per-domain document
+    served by /api/user-progress, and interviews is the per-user history list.
+    Every backend keeps running aggregates of each user's history (see
+    `accumulate_user_stats`) so /api/sync-user-stats never rescans it.
+    """
+
+    def get_user(self, email):
+        raise NotImplementedError
+
+    def create_user(self, email, user):
+        """Insert a new user, returning False if the email is already taken"""
+        raise NotImplementedError
+
+    def save_user(self, email, user):
+        raise NotImplementedError
+
+    def save_users(self, users):
+        """Save several {email: user} at once"""
+        for email, user in users.items():
+            self.save_user(email, user)
+
+    def iter_users(self):
+        """Stream (email, user) for every user"""
+        raise NotImplementedError
+
+    def get_progress(self):
+        raise NotImplementedError
+
+    def record_progress(self, email, domain, entry):
+        """Append one completed interview entry to a user's domain progress"""
+        raise NotImplementedError
+
+    def record_progress_many(self, entries):
+        """Append several (email, domain, entry) progress entries at once"""
+        for email, domain, entry in entries:
+            self.record_progress(email, domain, entry)
+
+    def progress_version(self):
+        """Opaque token that changes whenever get_progress() would return something new"""
+        raise NotImplementedError
+
+    def update_progress(self, updates):
+        """Set progress entry scores from (email, domain, timestamp, score).
+
+        A progress entry and the interview it was recorded with share their
+        timestamp (`completedAt` on the interview).
+        """
+        raise NotImplementedError
+
+    def get_interviews(self, email):
+        raise NotImplementedError
+
+    def record_interview(self, email, interview):
+        """Append to a user's history and update their aggregates"""
+        raise NotImplementedError
+
+    def record_interviews(self, interviews):
+        """Record several (email, interview) pairs at once"""
+        for email, interview in interviews:
+            self.record_interview(email, interview)
+
+    def get_user_stats(self, email):
+        raise NotImplementedError
+
+    def iter_interviews(self):
+        """Stream (key, email, interview) for every stored interview"""
+        raise NotImplementedError
+
+    def update_interviews(self, updates):
+        """Replace stored interviews from (key, interview) pairs"""
+        raise NotImplementedError
+
+    def verify_user_stats(self, fix=False):
+        """Recompute aggregates from the full history.
+
+        Returns a list of (email, stored, expected) for every user whose
+        aggregates disagree with their history, replacing them if `fix`.
+        """
+        raise NotImplementedError
+
+    def defer(self, write, item):
+        """Hand `item` to `write(items)`, a batch writer kept outside storage.
+
+        Backends that buffer writes pass it everything buffered for `write`
+        at their next flush; the others call it right away.
+        """
+        write([item])
+
+    def compact(self):
+        """Fold any append-only logs into their snapshots"""
+
+    def flush(self):
+        """Write out anything buffered in memory"""
+
+
+def _group_progress_updates(updates):
+    """{(email, domain): {timestamp: score}} from update_progress() arguments"""
+    grouped = {}
+    for email, domain, timestamp, score in updates:
+        # Entries without a timestamp can't be matched to their interview
+        if timestamp is None:
+            continue
+        grouped.setdefault((email, domain), {})[timestamp] = score
+    return grouped
+
+
+def _apply_progress(progress, record):
+    if 'scores' in record:
+        # Correction from update_progress(): {timestamp: new score}
+        for entry in progress.get(record['email'], {}).get(record['domain'], {}).get('interviews', []):
+            if entry.get('timestamp') in record['scores']:
+                entry['score'] = record['scores'][entry['timestamp']]
+        return
+    domain_progress = progress.setdefault(record['email'], {}).setdefault(
+        record['domain'], {'completed': 0, 'interviews': []}
+    )
+    domain_progress['completed'] += 1
+    domain_progress['interviews'].append(record['entry'])
+
+
+class JsonStorage(Storage):
+    """Default backend: the original users/progress/interviews JSON files.
+
+    Progress is kept in memory and persisted as an append-only log of
+    completed interviews on top of progress.json, which is rewritten only
+    when the log is compacted. Rescored interviews and progress entries are
+    logged as correction records, so they survive a compaction by any
+    process.
+    """
+
+    def __init__(self, users_file, progress_file, progress_log_file, interviews_file, interviews_log_file):
+        self.users_file = users_file
+        self._progress_log = EventLog(progress_file, progress_log_file, _apply_progress)
+        self._user_stats = {}
+        self._interview_log = EventLog(
+            interviews_file, interviews_log_file, self._apply_interview, load=self._load_interviews
+        )
+
+    def _load_interviews(self, interviews):
+        self._user_stats = {email: compute_user_stats(history) for email, history in interviews.items()}
+
+    def _apply_interview(self, interviews, record):
+        email, interview = record['email'], record['interview']
+        history = interviews.setdefault(email, [])
+        if 'index' in record:
+            # Correction from update_interviews()
+            history[record['index']] = interview
+            self._user_stats[email] = compute_user_stats(history)
+            return
+        history.append(interview)
+        accumulate_user_stats(self._user_stats.setdefault(email, empty_user_stats()), interview)
+
+    def get_user(self, email):
+        return read_json(self.users_file).get(email)
+
+    def create_user(self, email, user):
+        def add(users):
+            if email in users:
+                return False
+            users[email] = user
+        return update_json(self.users_file, add) is not False
+
+    def save_user(self, email, user):
+        update_json(self.users_file, lambda users: users.update({email: user}))
+
+    def save_users(self, updates):
+        update_json(self.users_file, lambda users: users.update(updates))
+
+    def iter_users(self):
+        return iter(read_json(self.users_file).items())
+
+    def get_progress(self):
+        log = self._progress_log
+        log.refresh()
+        with log.lock:
+            return {
+                email: {
+                    domain: {'completed': p['completed'], 'interviews': list(p['interviews'])}
+                    for domain, p in domains.items()
+                }
+                for email, domains in log.state.items()
+            }
+
+    def record_progress(self, email, domain, entry):
+        self._progress_log.append({'email': email, 'domain': domain, 'entry': entry})
+
+    def record_progress_many(self, entries):
+        self._progress_log.append_many([
+            {'email': email, 'domain': domain, 'entry': entry} for email, domain, entry in entries
+        ])
+
+    def progress_version(self):
+        log = self._progress_log
+        log.refresh()
+        with log.lock:
+            return log.version()
+
+    def update_progress(self, updates):
+        self._progress_log.append_many([
+            {'email': email, 'domain': domain, 'scores': scores}
+            for (email, domain), scores in _group_progress_updates(updates).items()
+        ])
+
+    def get_interviews(self, email):
+        log = self._interview_log
+        log.refresh()
+        with log.lock:
+            return list(log.state.get(email, []))
+
+    def record_interview(self, email, interview):
+        self._interview_log.append({'email': email, 'interview': interview})
+
+    def record_interviews(self, interviews):
+        self._interview_log.append_many([
+            {'email': email, 'interview': interview} for email, interview in interviews
+        ])
+
+    def get_user_stats(self, email):
+        log = self._interview_log
+        log.refresh()
+        with log.lock:
+            return dict(self._user_stats.get(email) or empty_user_stats())
+
+    def iter_interviews(self):
+        log = self._interview_log
+        log.refresh()
+        with log.lock:
+            emails = list(log.state)
+        for email in emails:
+            history = log.state.get(email, [])
+            for index in range(len(history)):
+                yield (email, index), email, history[index]
+
+    def update_interviews(self, updates):
+        self._interview_log.append_many([
+            {'email': email, 'index': index, 'interview': interview} for (email, index), interview in updates
+        ])
+
+    def verify_user_stats(self, fix=False):
+        log = self._interview_log
+        log.refresh()
+        mismatches = []
+        with log.lock:
+            for email, history in log.state.items():
+                expected = compute_user_stats(history)
+                stored = self._user_stats.get(email)
+                if stored != expected:
+                    mismatches.append((email, stored, expected))
+                    if fix:
+                        self._user_stats[email] = expected
+        return mismatches
+
+    def compact(self):
+        self._progress_log.compact()
+        self._interview_log.compact()
+
+
+class SqliteStorage(Storage):
+    """SQLite backend with one row per user and per recorded interview.
+
+    The database runs in WAL mode so readers never block the single writer,
+    and each thread gets its own connection.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS users (
+            email TEXT PRIMARY KEY,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS progress (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT NOT NULL,
+            domain TEXT NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_progress_email ON progress (email, domain);
+        CREATE TABLE IF NOT EXISTS interviews (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            email TEXT NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_interviews_email ON interviews (email);
+        CREATE TABLE IF NOT EXISTS counters (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS user_stats (
+            email TEXT PRIMARY KEY,
+            credits NUMERIC NOT NULL,
+            score_total NUMERIC NOT NULL,
+            count INTEGER NOT NULL,
+            current_streak INTEGER NOT NULL,
+            best_streak INTEGER NOT NULL
+        );
+    """
+
+    STATS_COLUMNS = ('credits', 'score_total', 'count', 'current_streak', 'best_streak')
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        conn = self._connect()
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.executescript(self.SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def get_user(self, email):
+        row = self._connect().execute('SELECT data FROM users WHERE email = ?', (email,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def create_user(self, email, user):
+        try:
+            self._connect().execute('INSERT INTO users (email, data) VALUES (?, ?)', (email, json.dumps(user)))
+        except sqlite3.IntegrityError:
+            return False
+        return True
+
+    def save_user(self, email, user):
+        self._connect().execute(
+            'INSERT INTO users (email, data) VALUES (?, ?) '
+            'ON CONFLICT(email) DO UPDATE SET data = excluded.data',
+            (email, json.dumps(user))
+        )
+
+    def save_users(self, users):
+        conn = self._connect()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.executemany(
+                'INSERT INTO users (email, data) VALUES (?, ?) '
+                'ON CONFLICT(email) DO UPDATE SET data = excluded.data',
+                [(email, json.dumps(user)) for email, user in users.items()]
+            )
+
+    def iter_users(self, page_size=1000):
+        conn = self._connect()
+        last_email = ''
+        while True:
+            rows = conn.execute(
+                'SELECT email, data FROM users WHERE email > ? ORDER BY email LIMIT ?', (last_email, page_size)
+            ).fetchall()
+            if not rows:
+                return
+            for email, data in rows:
+                yield email, json.loads(data)
+            last_email = rows[-1][0]
+
+    def get_progress(self):
+        progress = {}
+        rows = self._connect().execute('SELECT email, domain, data FROM progress ORDER BY id')
+        for email, domain, data in rows:
+            domain_progress = progress.setdefault(email, {}).setdefault(domain, {'completed': 0, 'interviews': []})
+            domain_progress['completed'] += 1
+            domain_progress['interviews'].append(json.loads(data))
+        return progress
+
+    def record_progress(self, email, domain, entry):
+        self._connect().execute(
+            'INSERT INTO progress (email, domain, data) VALUES (?, ?, ?)',
+            (email, domain, json.dumps(entry))
+        )
+
+    def record_progress_many(self, entries):
+        conn = self._connect()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.executemany(
+                'INSERT INTO progress (email, domain, data) VALUES (?, ?, ?)',
+                [(email, domain, json.dumps(entry)) for email, domain, entry in entries]
+            )
+
+    def progress_version(self):
+        # Rows are only ever appended, or rewritten by update_progress()
+        last_id, updates = self._connect().execute(
+            "SELECT (SELECT MAX(id) FROM progress), "
+            "(SELECT value FROM counters WHERE name = 'progress_updates')"
+        ).fetchone()
+        return f'{last_id or 0}-{updates or 0}'
+
+    def update_progress(self, updates):
+        conn = self._connect()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.execute(
+                "INSERT INTO counters (name, value) VALUES ('progress_updates', 1) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + 1"
+            )
+            changed = []
+            for (email, domain), scores in _group_progress_updates(updates).items():
+                rows = conn.execute('SELECT id, data FROM progress WHERE email = ? AND domain = ?', (email, domain))
+                for row_id, data in rows.fetchall():
+                    entry = json.loads(data)
+                    if entry.get('timestamp') in scores:
+                        entry['score'] = scores[entry['timestamp']]
+                        changed.append((json.dumps(entry), row_id))
+            conn.executemany('UPDATE progress SET data = ? WHERE id = ?', changed)
+
+    def get_interviews(self, email):
+        rows = self._connect().execute('SELECT data FROM interviews WHERE email = ? ORDER BY id', (email,))
+        return [json.loads(data) for (data,) in rows]
+
+    def _read_user_stats(self, conn, email):
+        row = conn.execute(
+            f'SELECT {", ".join(self.STATS_COLUMNS)} FROM user_stats WHERE email = ?', (email,)
+        ).fetchone()
+        return dict(zip(self.STATS_COLUMNS, row)) if row else None
+
+    def _write_user_stats(self, conn, email, stats):
+        conn.execute(
+            f'INSERT OR REPLACE INTO user_stats (email, {", ".join(self.STATS_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)',
+            (email, *(stats[column] for column in self.STATS_COLUMNS))
+        )
+
+    def record_interview(self, email, interview):
+        self.record_interviews([(email, interview)])
+
+    def record_interviews(self, interviews):
+        conn = self._connect()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.executemany(
+                'INSERT INTO interviews (email, data) VALUES (?, ?)',
+                [(email, json.dumps(interview)) for email, interview in interviews]
+            )
+            stats = {}
+            for email, interview in interviews:
+                if email not in stats:
+                    stats[email] = self._read_user_stats(conn, email) or empty_user_stats()
+                accumulate_user_stats(stats[email], interview)
+            for email, user_stats in stats.items():
+                self._write_user_stats(conn, email, user_stats)
+
+    def get_user_stats(self, email):
+        return self._read_user_stats(self._connect(), email) or empty_user_stats()
+
+    def iter_interviews(self, page_size=1000):
+        conn = self._connect()
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                'SELECT id, email, data FROM interviews WHERE id > ? ORDER BY id LIMIT ?',
+                (last_id, page_size)
+            ).fetchall()
+            if not rows:
+                return
+            for row_id, email, data in rows:
+                yield row_id, email, json.loads(data)
+            last_id = rows[-1][0]
+
+    def update_interviews(self, updates):
+        conn = self._connect()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            conn.executemany(
+                'UPDATE interviews SET data = ? WHERE id = ?',
+                [(json.dumps(interview), row_id) for row_id, interview in updates]
+            )
+
+    def verify_user_stats(self, fix=False):
+        conn = self._connect()
+        emails = [row[0] for row in conn.execute('SELECT DISTINCT email FROM interviews')]
+        mismatches = []
+        for email in emails:
+            expected = compute_user_stats(self.get_interviews(email))
+            stored = self._read_user_stats(conn, email)
+            if stored != expected:
+                mismatches.append((email, stored, expected))
+                if fix:
+                    self._write_user_stats(conn, email, expected)
+        return mismatches
+
+
+def create_storage(backend, users_file, progress_file, progress_log_file,
+                   interviews_file, interviews_log_file, db_file):
+    if backend == 'json':
+        return JsonStorage(users_file, progress_file, progress_log_file, interviews_file, interviews_log_file)
+    if backend == 'sqlite':
+        return SqliteStorage(db_file)
+    raise ValueError(f'Unknown storage backend: {backend}')
+
+
+def migrate_json_to_sqlite(users_file, progress_file, progress_log_file,
+                           interviews_file, interviews_log_file, db_file):
+    """One-shot import of the JSON data files into a SQLite database.
+
+    Returns the number of users, progress entries and interviews imported.
+    The import runs in a single transaction, so a failure leaves the
+    database untouched.
+    """
+    source = JsonStorage(users_file, progress_file, progress_log_file, interviews_file, interviews_log_file)
+    target = SqliteStorage(db_file)
+    conn = target._connect()
+    if conn.execute('SELECT 1 FROM users LIMIT 1').fetchone():
+        raise ValueError(f'{db_file} already contains users; refusing to migrate twice')
+
+    users = read_json(users_file)
+    progress = source.get_progress()
+    interviews = source._interview_log.state
+
+    progress_rows = [
+        (email, domain, json.dumps(entry))
+        for email, domains in progress.items()
+        for domain, domain_progress in domains.items()
+        for entry in domain_progress.get('interviews', [])
+    ]
+    interview_rows = [
+        (email, json.dumps(interview))
+        for email, history in interviews.items()
+        for interview in history
+    ]
+
+    with conn:
+        conn.execute('BEGIN')
+        conn.executemany(
+            'INSERT OR REPLACE INTO users (email, data) VALUES (?, ?)',
+            [(email, json.dumps(user)) for email, user in users.items()]
+        )
+        conn.executemany('INSERT INTO progress (email, domain, data) VALUES (?, ?, ?)', progress_rows)
+        conn.executemany('INSERT INTO interviews (email, data) VALUES (?, ?)', interview_rows)
+    target.verify_user_stats(fix=True)
+
+    return len(users), len(progress_rows), len(interview_rows)
@@ -0,0 +1,237 @@
+import json
+import math
+import os
+from datetime import datetime, timedelta
+
+from storage import STREAK_THRESHOLD
+
+DOMAINS = ('data-analytics', 'machine-learning', 'web-development', 'dsa', 'group-discussion', 'cloud-computing')
+DIFFICULTIES = ('easy', 'medium', 'hard')
+
+# Questions on a paper of each difficulty, as issued by /api/questions
+PAPER_SIZES = {'easy': 45, 'medium': 30, 'hard': 15}
+FIRST_SIGNUP = datetime(2024, 1, 1)
+
+
+def synthetic_user(email, index, password_hash):
+    """A freshly signed-up user, in the shape /api/signup stores"""
+    return {
+        'email': email,
+        'password_hash': password_hash,
+        'fullName': f'Synthetic User {index}',
+        'credits': 0,
+        'streak': 0,
+        'accuracy': 0,
+        'created_at': '2024-01-01T00:00:00',
+        'interviewsCompleted': 0
+    }
+
+
+def user_email(index):
+    return f'user{index}@example.com'
+
+
+def synthetic_questions(per_pool):
+    """A questions.json-shaped bank with `per_pool` distinct questions per domain/difficulty.
+
+    `write_questions` falls back to it for pools the seed bank lacks.
+    """
+    questions = {}
+    for domain in DOMAINS:
+        questions[domain] = {}
+        for level, difficulty in enumerate(DIFFICULTIES):
+            pool = []
+            for i in range(per_pool):
+                question_id = (level + 1) * 100000 + i
+                text = f'Synthetic {domain} {difficulty} question {i}'
+                if i % 3 == 2:
+                    pool.append({
+                        'id': question_id,
+                        'text': text + ': explain the concept.',
+                        'type': 'text',
+                        'keywords': ['concept', 'example', 'tradeoff', f'term{i}']
+                    })
+                else:
+                    options = [f'Option {c} for {domain} {difficulty} {i}' for c in 'ABCD']
+                    pool.append({
+                        'id': question_id,
+                        'text': text + '?',
+                        'type': 'mcq',
+                        'options': options,
+                        'correct_answer': options[i % 4]
+                    })
+            questions[domain][difficulty] = pool
+    return questions
+
+
+def parse_distribution(spec):
+    """Parse a 'name:param:...' spec into a function drawing one sample from an rng.
+
+    Supported: const:V, uniform:LOW:HIGH, normal:MEAN:SD, lognormal:MU:SIGMA,
+    poisson:LAMBDA, geometric:P (failures before the first success) and
+    beta:A:B (scaled to 0-100, for scores).
+    """
+    name, *params = spec.split(':')
+    try:
+        params = [float(param) for param in params]
+    except ValueError:
+        raise ValueError(f'Bad distribution parameters: {spec}')
+    arity = {'const': 1, 'uniform': 2, 'normal': 2, 'lognormal': 2, 'poisson': 1, 'geometric': 1, 'beta': 2}
+    if name not in arity:
+        raise ValueError(f'Unknown distribution: {name}')
+    if len(params) != arity[name]:
+        raise ValueError(f'{name} takes {arity[name]} parameter(s): {spec}')
+
+    if name == 'const':
+        return lambda rng: params[0]
+    if name == 'uniform':
+        return lambda rng: rng.uniform(*params)
+    if name == 'normal':
+        return lambda rng: rng.gauss(*params)
+    if name == 'lognormal':
+        return lambda rng: rng.lognormvariate(*params)
+    if name == 'beta':
+        return lambda rng: 100 * rng.betavariate(*params)
+    if name == 'poisson':
+        return lambda rng: _poisson(rng, params[0])
+    p = params[0]
+    if not 0 < p <= 1:
+        raise ValueError(f'geometric needs 0 < p <= 1: {spec}')
+    if p == 1:
+        return lambda rng: 0
+    return lambda rng: math.floor(math.log(1 - rng.random()) / math.log(1 - p))
+
+
+def _poisson(rng, lam):
+    if lam >= 30:
+        # Normal approximation; Knuth's method gets slow for large means
+        return max(0, round(rng.gauss(lam, math.sqrt(lam))))
+    limit = math.exp(-lam)
+    count, product = 0, rng.random()
+    while product > limit:
+        count += 1
+        product *= rng.random()
+    return count
+
+
+def synthetic_history(index, rng, interview_counts, scores):
+    """One user and their interviews, replayed the way /api/update-stats records them.
+
+    Returns (user fields, progress document, interview list); the caller
+    adds the account fields.
+    """
+    count = max(0, round(interview_counts(rng)))
+    created = FIRST_SIGNUP + timedelta(minutes=index % 525600)
+    stats = {'credits': 0, 'interviewsCompleted': 0, 'streak': 0, 'accuracy': 0}
+    progress = {}
+    interviews = []
+    when = created
+    for _ in range(count):
+        when += timedelta(seconds=rng.randint(600, 7 * 86400))
+        timestamp = when.isoformat()
+        domain = rng.choice(DOMAINS)
+        difficulty = rng.choice(DIFFICULTIES)
+        total = PAPER_SIZES[difficulty]
+        correct = round(min(100, max(0, scores(rng))) * total / 100)
+        score = round(correct / total * 100)
+        credits = round(correct / total * 200)
+
+        stats['credits'] += credits
+        stats['interviewsCompleted'] += 1
+        stats['streak'] = stats['streak'] + 1 if score >= STREAK_THRESHOLD else 0
+        completed = stats['interviewsCompleted']
+        stats['accuracy'] = (stats['accuracy'] * (completed - 1) + score) / completed
+
+        domain_progress = progress.setdefault(domain, {'completed': 0, 'interviews': []})
+        domain_progress['completed'] += 1
+        domain_progress['interviews'].append({'difficulty': difficulty, 'score': score, 'timestamp': timestamp})
+        interviews.append({
+            'domain': domain,
+            'difficulty': difficulty,
+            'score': score,
+            'correctAnswers': correct,
+            'totalQuestions': total,
+            'creditsEarned': credits,
+            'completedAt': timestamp
+        })
+    stats['created_at'] = created.isoformat()
+    return stats, progress, interviews
+
+
+class _ObjectWriter:
+    """Writes a JSON object one key at a time"""
+
+    def __init__(self, f):
+        self.f = f
+        self.first = True
+        f.write('{')
+
+    def add(self, key, value):
+        self.f.write('\n' if self.first else ',\n')
+        self.first = False
+        self.f.write(json.dumps(key) + ': ' + json.dumps(value))
+
+    def close(self):
+        self.f.write('\n}\n')
+
+
+def write_history(directory, count, password_hash, rng, interview_counts, scores):
+    """Stream `count` users with their progress and interviews into a data directory.
+
+    users.json, progress.json and interviews.json are written side by side,
+    one user at a time, so memory use does not grow with `count`. Returns
+    the number of interviews written.
+    """
+    total = 0
+    names = ('users.json', 'progress.json', 'interviews.json')
+    files = [open(os.path.join(directory, name), 'w') for name in names]
+    try:
+        users, progress, interviews = (_ObjectWriter(f) for f in files)
+        for index in range(count):
+            email = user_email(index)
+            stats, user_progress, history = synthetic_history(index, rng, interview_counts, scores)
+            user = synthetic_user(email, index, password_hash)
+            user.update(stats)
+            users.add(email, user)
+            if history:
+                progress.add(email, user_progress)
+                interviews.add(email, history)
+            total += len(history)
+        for writer in (users, progress, interviews):
+            writer.close()
+    finally:
+        for f in files:
+            f.close()
+    return total
+
+
+def write_questions(path, seed, per_pool, rng):
+    """Stream a questions.json with `per_pool` questions per domain/difficulty.
+
+    Each pool cycles through its questions in `seed` (the sample bank),
+    adding numbered variants with shuffled options so every question stays
+    distinct. Pools missing from `seed` fall back to `synthetic_questions`.
+    Question ids are renumbered from 1. Returns the number written.
+    """
+    next_id = 1
+    with open(path, 'w') as f:
+        f.write('{')
+        for d, domain in enumerate(DOMAINS):
+            f.write((',\n' if d else '\n') + json.dumps(domain) + ': {')
+            for level, difficulty in enumerate(DIFFICULTIES):
+                base = seed.get(domain, {}).get(difficulty) or synthetic_questions(1)[domain][difficulty]
+                f.write((',\n' if level else '\n') + json.dumps(difficulty) + ': [')
+                for i in range(per_pool):
+                    question = dict(base[i % len(base)], id=next_id)
+                    variant = i // len(base)
+                    if variant:
+                        key = 'question' if 'question' in question else 'text'
+                        question[key] = f'{question[key]} (variant {variant})'
+                        if question.get('options'):
+                            question['options'] = rng.sample(question['options'], len(question['options']))
+                    f.write((',\n' if i else '\n') + json.dumps(question))
+                    next_id += 1
+                f.write('\n]')
+            f.write('\n}')
+        f.write('\n}\n')
+    return next_id - 1
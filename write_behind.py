@@ -0,0 +1,223 @@
+import atexit
+import logging
+import signal
+import sys
+import threading
+
+from storage import Storage, accumulate_user_stats
+
+log = logging.getLogger(__name__)
+
+
+class _Batch:
+    def __init__(self):
+        self.users = {}
+        self.progress = []
+        self.interviews = []
+        # write -> items buffered for it by defer()
+        self.deferred = {}
+
+    def __len__(self):
+        deferred = sum(len(items) for items in self.deferred.values())
+        return len(self.users) + len(self.progress) + len(self.interviews) + deferred
+
+
+class WriteBehindStorage(Storage):
+    """Buffers writes in memory and flushes them to a backend in batches.
+
+    Saves are acknowledged as soon as they are buffered. A background thread
+    flushes every `interval` seconds, or as soon as `max_batch` writes are
+    waiting. Repeated saves of the same user are coalesced, and each flush
+    uses the backend's batch methods (one atomic users.json rewrite and one
+    fsync'd log append per kind of record for the JSON backend). Writers
+    outside storage, such as the leaderboard, can batch through the same
+    buffer with `defer()`; their items are not visible to storage reads.
+
+    Reads see buffered writes, including a batch that is being flushed.
+    Reads that merge the backend with the buffer take no lock while they
+    read the backend: `_version` is odd while a batch is being written, and
+    a read that overlapped a write is retried once it has finished, so no
+    record is missed or counted twice. The buffer is flushed again at
+    interpreter exit and on SIGTERM.
+    """
+
+    def __init__(self, backend, interval=0.2, max_batch=100):
+        self.backend = backend
+        self.interval = interval
+        self.max_batch = max_batch
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+        self._flushed = threading.Condition(self._lock)
+        self._version = 0
+        self._pending = _Batch()
+        self._inflight = _Batch()
+        self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+        _install_sigterm_handler()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                self._wakeup.wait_for(lambda: len(self._pending) >= self.max_batch, timeout=self.interval)
+            try:
+                self.flush()
+            except Exception:
+                # Keep the flusher alive; the batch is retried on the next tick
+                log.exception('Write-behind flush failed; will retry')
+
+    def _buffered(self, add):
+        with self._lock:
+            add(self._pending)
+            if len(self._pending) >= self.max_batch:
+                self._wakeup.notify()
+
+    def flush(self):
+        with self._flush_lock:
+            with self._lock:
+                if not len(self._pending):
+                    return
+                self._inflight, self._pending = self._pending, _Batch()
+                self._version += 1
+            batch = self._inflight
+            try:
+                if batch.users:
+                    self.backend.save_users(batch.users)
+                    batch.users = {}
+                if batch.progress:
+                    self.backend.record_progress_many(batch.progress)
+                    batch.progress = []
+                if batch.interviews:
+                    self.backend.record_interviews(batch.interviews)
+                    batch.interviews = []
+                for write, items in list(batch.deferred.items()):
+                    write(items)
+                    del batch.deferred[write]
+            except Exception:
+                # Put whatever was not written back in front of newer writes
+                with self._lock:
+                    batch.users.update(self._pending.users)
+                    batch.progress.extend(self._pending.progress)
+                    batch.interviews.extend(self._pending.interviews)
+                    for write, items in self._pending.deferred.items():
+                        batch.deferred.setdefault(write, []).extend(items)
+                    self._pending = batch
+                raise
+            finally:
+                with self._lock:
+                    self._inflight = _Batch()
+                    self._version += 1
+                    self._flushed.notify_all()
+
+    def get_user(self, email):
+        with self._lock:
+            user = self._pending.users.get(email) or self._inflight.users.get(email)
+        if user is not None:
+            return dict(user)
+        return self.backend.get_user(email)
+
+    def create_user(self, email, user):
+        if self.get_user(email) is not None:
+            return False
+        return self.backend.create_user(email, user)
+
+    def save_user(self, email, user):
+        user = dict(user)
+        self._buffered(lambda batch: batch.users.__setitem__(email, user))
+
+    def save_users(self, users):
+        users = {email: dict(user) for email, user in users.items()}
+        self._buffered(lambda batch: batch.users.update(users))
+
+    def _read(self, read, attribute):
+        """Return read() from the backend and the buffered records of one kind.
+
+        Both are taken while no batch is being written, so each buffered
+        record is in exactly one of them.
+        """
+        while True:
+            with self._lock:
+                self._flushed.wait_for(lambda: self._version % 2 == 0)
+                version = self._version
+                unflushed = getattr(self._inflight, attribute) + getattr(self._pending, attribute)
+            result = read()
+            with self._lock:
+                if self._version == version:
+                    return result, unflushed
+
+    def get_progress(self):
+        progress, unflushed = self._read(self.backend.get_progress, 'progress')
+        for email, domain, entry in unflushed:
+            domain_progress = progress.setdefault(email, {}).setdefault(domain, {'completed': 0, 'interviews': []})
+            domain_progress['completed'] += 1
+            domain_progress['interviews'].append(entry)
+        return progress
+
+    def progress_version(self):
+        # Buffered entries are only ever appended until a flush moves them
+        version, unflushed = self._read(self.backend.progress_version, 'progress')
+        return f'{version}+{len(unflushed)}'
+
+    def record_progress(self, email, domain, entry):
+        self._buffered(lambda batch: batch.progress.append((email, domain, entry)))
+
+    def record_progress_many(self, entries):
+        self._buffered(lambda batch: batch.progress.extend(entries))
+
+    def update_progress(self, updates):
+        self.flush()
+        self.backend.update_progress(updates)
+
+    def get_interviews(self, email):
+        interviews, unflushed = self._read(lambda: self.backend.get_interviews(email), 'interviews')
+        interviews.extend(interview for owner, interview in unflushed if owner == email)
+        return interviews
+
+    def record_interview(self, email, interview):
+        self._buffered(lambda batch: batch.interviews.append((email, interview)))
+
+    def record_interviews(self, interviews):
+        self._buffered(lambda batch: batch.interviews.extend(interviews))
+
+    def get_user_stats(self, email):
+        stats, unflushed = self._read(lambda: self.backend.get_user_stats(email), 'interviews')
+        for owner, interview in unflushed:
+            if owner == email:
+                accumulate_user_stats(stats, interview)
+        return stats
+
+    def iter_users(self):
+        self.flush()
+        return self.backend.iter_users()
+
+    def defer(self, write, item):
+        self._buffered(lambda batch: batch.deferred.setdefault(write, []).append(item))
+
+    def iter_interviews(self):
+        self.flush()
+        return self.backend.iter_interviews()
+
+    def update_interviews(self, updates):
+        self.backend.update_interviews(updates)
+
+    def verify_user_stats(self, fix=False):
+        self.flush()
+        return self.backend.verify_user_stats(fix=fix)
+
+    def compact(self):
+        self.flush()
+        self.backend.compact()
+
+
+_sigterm_installed = False
+
+
+def _install_sigterm_handler():
+    """Turn SIGTERM into a normal exit so atexit flushes still run"""
+    global _sigterm_installed
+    if _sigterm_installed or threading.current_thread() is not threading.main_thread():
+        return
+    if signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(128 + signum))
+    _sigterm_installed = True